@@ -0,0 +1,121 @@
+"""
+Benchmark: memória por registro das entidades (tracemalloc)
+
+Compara as entidades antigas (GameHistory como @dataclass com timestamp
+sempre preenchido, Player com __dict__, strings não internadas) com as
+atuais (__slots__, timestamp calculado sob demanda e nomes, palavras e
+resultados internados pelos loaders). Os registros são criados a partir
+de linhas no formato do arquivo, como fazem os repositórios.
+
+Uso:
+    python benchmarks/entity_memory.py [--rows 1000000]
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from domain.entities import GameHistory, Player
+from domain.entities.game_history import _day_epoch, parse_date
+
+PLAYERS = [f"Jogador{i}" for i in range(200)]
+WORDS = ["PYTHON", "FORCA", "SLOTS", "MEMORIA", "INTERN", "OBJETO", "CACHE"]
+
+
+@dataclass
+class LegacyGameHistory:
+    # GameHistory antes dos __slots__: __dict__ por instância e datetime por linha
+    date: str
+    player_name: str
+    word: str
+    result: str
+    attempts_used: int
+    duration_seconds: int
+    timestamp: Optional[datetime] = None
+
+    def __post_init__(self):
+        if self.timestamp is None:
+            self.timestamp = parse_date(self.date)
+
+    @classmethod
+    def from_file_format(cls, line: str) -> 'LegacyGameHistory':
+        parts = line.strip().split('|')
+        return cls(parts[0], parts[1], parts[2], parts[3], int(parts[4]), int(parts[5]))
+
+
+class LegacyPlayer:
+    # Player antes dos __slots__
+    def __init__(self, name: str, wins: int = 0, losses: int = 0):
+        self.name = name
+        self.wins = wins
+        self.losses = losses
+
+
+def _history_lines(rows: int):
+    rng = random.Random(42)
+    for i in range(rows):
+        yield (f"2025-{1 + i % 12:02d}-{1 + i % 28:02d} {i % 24:02d}:{i % 60:02d}:{i * 7 % 60:02d}|"
+               f"{rng.choice(PLAYERS)}|{rng.choice(WORDS)}|{'WIN' if rng.random() < 0.6 else 'LOSS'}|"
+               f"{rng.randint(0, 6)}|{rng.randint(5, 600)}\n")
+
+
+def _player_lines(rows: int):
+    for i in range(rows):
+        yield f"Jogador{i}|{i % 50}|{i % 30}\n"
+
+
+def _parse_player(cls, line: str, intern: bool):
+    name, wins, losses = line.strip().split('|')
+    return cls(sys.intern(name) if intern else name, int(wins), int(losses))
+
+
+def measure(build, lines) -> float:
+    """Bytes por registro retidos pela lista de objetos criada por `build`"""
+    lines = list(lines)
+    gc.collect()
+    _day_epoch.cache_clear()
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    records = [build(line) for line in lines]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    per_record = (after - before) / len(records)
+    del records
+    return per_record
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memória por registro das entidades")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    cases = [
+        ("GameHistory", lambda: _history_lines(args.rows),
+         LegacyGameHistory.from_file_format, GameHistory.from_file_format),
+        ("Player", lambda: _player_lines(args.rows),
+         lambda line: _parse_player(LegacyPlayer, line, intern=False),
+         lambda line: _parse_player(Player, line, intern=True)),
+    ]
+
+    print(f"{args.rows} registros")
+    print(f"{'entidade':<12} {'antes(B)':>9} {'depois(B)':>10} {'redução':>8} {'total antes':>12} {'total depois':>13}")
+
+    for label, lines, legacy, current in cases:
+        before = measure(legacy, lines())
+        after = measure(current, lines())
+        print(f"{label:<12} {before:>9.1f} {after:>10.1f} {before / after:>7.1f}x "
+              f"{before * args.rows / 1024 / 1024:>10.1f}MB {after * args.rows / 1024 / 1024:>11.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmark: GameSessionManager com muitas partidas simultâneas
+
+Cria N sessões single player, mede a memória retida por sessão
+(tracemalloc, comparada com a estimativa usada pelo orçamento de
+memória) e depois joga todas as partidas até o fim, medindo palpites
+por segundo com uma thread e com várias threads em sessões
+diferentes. Os resultados vão para um escritor nulo: o custo medido é
+o do gerenciador, não o da gravação.
+
+Uso:
+    python benchmarks/game_sessions.py [--sessions 10000 100000] [--threads 8]
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import threading
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from domain.services import GameSessionManager
+
+WORDS = ["PYTHON", "FORCA", "SESSAO", "MEMORIA", "TRAVA", "PALPITE", "CACHE", "ALGORITMO"]
+LETTERS = "AEIOSRNTMCDLPUGHBFVQJZXKWY"
+
+
+class _Words:
+    # Repositório de palavras em memória (sem I/O no benchmark)
+    def __init__(self, seed: int = 42):
+        self._rng = random.Random(seed)
+
+    def random_word(self) -> str:
+        return self._rng.choice(WORDS)
+
+
+class _NullWriter:
+    # Escritor de resultados que só conta as partidas encerradas
+    def __init__(self):
+        self.submitted = 0
+
+    def submit(self, history, player_name: str, won: bool):
+        self.submitted += 1
+
+
+def _create(sessions: int):
+    manager = GameSessionManager(_Words(), _NullWriter(), idle_timeout=None, memory_budget=None)
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    ids = [manager.start_single_player_game(f"Jogador{i}") for i in range(sessions)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # Desconta a própria lista de ids, que não pertence ao gerenciador
+    measured = (after - before - sys.getsizeof(ids)) / sessions
+    return manager, ids, measured
+
+
+def _play(manager: GameSessionManager, ids, threads: int) -> float:
+    # Palpites em ordem fixa até cada partida terminar; devolve palpites/s
+    def worker(chunk):
+        for session_id in chunk:
+            for letter in LETTERS:
+                result = manager.make_guess(session_id, letter)
+                if result['game_over']:
+                    break
+
+    chunks = [ids[k::threads] for k in range(threads)]
+    workers = [threading.Thread(target=worker, args=(chunk,)) for chunk in chunks]
+
+    guesses_before = manager.metrics()['guesses']
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    return (manager.metrics()['guesses'] - guesses_before) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sessões de jogo simultâneas")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    print(f"{'sessões':>8} {'criação/s':>10} {'B/sessão':>9} {'estimado':>9} "
+          f"{'palpites/s 1T':>14} {f'palpites/s {args.threads}T':>14}")
+
+    for sessions in args.sessions:
+        started = time.perf_counter()
+        manager, ids, measured = _create(sessions)
+        created_per_sec = sessions / (time.perf_counter() - started)
+        estimated = manager.metrics()['bytes_per_session']
+
+        # Metade das sessões com uma thread, a outra metade com várias
+        half = len(ids) // 2
+        single = _play(manager, ids[:half], 1)
+        multi = _play(manager, ids[half:], args.threads)
+
+        metrics = manager.metrics()
+        assert metrics['finished'] == sessions == manager.result_writer.submitted
+
+        print(f"{sessions:>8} {created_per_sec:>10.0f} {measured:>9.0f} {estimated:>9.0f} "
+              f"{single:>14.0f} {multi:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
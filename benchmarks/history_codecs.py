@@ -0,0 +1,88 @@
+"""
+Benchmark: segmentos do histórico em texto, gzip e lzma
+
+Grava o mesmo segmento mensal com cada codec e mede o tamanho em disco,
+o tempo de arquivamento e a vazão de leitura em streaming (linhas e
+partidas por segundo), para escolher o codec dos segmentos frios.
+
+Uso:
+    python benchmarks/history_codecs.py [--rows 500000]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.storage.history_segments import HistorySegments
+
+PLAYERS = [f"Jogador{i}" for i in range(200)]
+WORDS = ["PYTHON", "FORCA", "ARQUIVO", "SEGMENTO", "COMPRESSAO", "MEMORIA", "CACHE"]
+
+
+def _lines(rows: int):
+    rng = random.Random(42)
+    for i in range(rows):
+        yield "2025-01", (
+            f"2025-01-{1 + i * 28 // rows:02d} {i % 24:02d}:{i % 60:02d}:{i * 7 % 60:02d}|"
+            f"{rng.choice(PLAYERS)}|{rng.choice(WORDS)}|{'WIN' if rng.random() < 0.6 else 'LOSS'}|"
+            f"{rng.randint(0, 6)}|{rng.randint(5, 600)}\n"
+        ).encode('utf-8')
+
+
+def run(codec, rows: int) -> dict:
+    directory = tempfile.mkdtemp(prefix="forca-codec-")
+    try:
+        segments = HistorySegments(os.path.join(directory, "history.txt"), codec)
+
+        started = time.perf_counter()
+        segments.archive(_lines(rows), hot_inode=0)
+        segments.finish_archive()
+        write_time = time.perf_counter() - started
+
+        path = segments.segment_path("2025-01")
+        size = os.path.getsize(path)
+
+        started = time.perf_counter()
+        lines = sum(1 for _ in segments.iter_lines("2025-01"))
+        scan_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        games = sum(1 for _ in segments.iter_histories("2025-01"))
+        parse_time = time.perf_counter() - started
+
+        assert lines == games == rows
+        return {
+            'codec': codec or 'texto',
+            'size_mb': size / 1024 / 1024,
+            'write_s': write_time,
+            'lines_per_s': lines / scan_time,
+            'games_per_s': games / parse_time,
+        }
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Codecs dos segmentos do histórico")
+    parser.add_argument("--rows", type=int, default=500_000)
+    args = parser.parse_args()
+
+    print(f"{'codec':<7} {'MB':>8} {'razão':>6} {'arquivar(s)':>12} "
+          f"{'linhas/s':>11} {'partidas/s':>11}")
+
+    baseline = None
+    for codec in (None, 'gzip', 'lzma'):
+        r = run(codec, args.rows)
+        baseline = baseline or r['size_mb']
+        print(f"{r['codec']:<7} {r['size_mb']:>8.2f} {baseline / r['size_mb']:>5.1f}x "
+              f"{r['write_s']:>12.2f} {r['lines_per_s']:>11.0f} {r['games_per_s']:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
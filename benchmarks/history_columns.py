@@ -0,0 +1,108 @@
+"""
+Benchmark: estatísticas do histórico em lista de objetos x colunas
+
+Compara o caminho antigo (listas de GameHistory e list comprehensions)
+com HistoryColumns usando array.array e, se instalado, NumPy. Os dados
+são sintéticos e gerados em memória.
+
+Uso:
+    python benchmarks/history_columns.py [--rows 1000000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from domain.entities import GameHistory
+from domain.services import history_columns
+from domain.services.history_columns import HistoryColumns
+
+PLAYERS = [f"Jogador{i}" for i in range(200)]
+WORDS = ["PYTHON", "FORCA", "ARRAY", "COLUNA", "VETOR", "MEMORIA", "CACHE"]
+
+
+def _generate(rows: int):
+    rng = random.Random(42)
+    histories = []
+    for i in range(rows):
+        won = rng.random() < 0.6
+        histories.append(GameHistory(
+            date=f"2025-{1 + i % 12:02d}-{1 + i % 28:02d} 12:00:00",
+            player_name=rng.choice(PLAYERS),
+            word=rng.choice(WORDS),
+            result='WIN' if won else 'LOSS',
+            attempts_used=rng.randint(0, 6),
+            duration_seconds=rng.randint(5, 600)
+        ))
+    return histories
+
+
+def _list_statistics(histories, player_name):
+    # Caminho antigo do HistoryUseCase: filtros e somas em listas Python
+    games = [h for h in histories if h.player_name.casefold() == player_name.casefold()]
+    wins = [h for h in histories if h.result == 'WIN']
+    attempts = [h.attempts_used for h in histories]
+    durations = [h.duration_seconds for h in histories]
+    per_player = {}
+    for h in histories:
+        per_player[h.player_name] = per_player.get(h.player_name, 0) + 1
+    return len(games), len(wins), sum(attempts), sum(durations), len(per_player)
+
+
+def _column_statistics(columns, player_name):
+    player = columns.summary(player_name)
+    overall = columns.summary()
+    per_player = columns.games_by_player()
+    return (player['total_games'], overall['wins'], overall['attempts_sum'],
+            overall['duration_sum'], len(per_player))
+
+
+def _timed(func, *args, repeat: int = 3):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Lista de objetos x colunas do histórico")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"Gerando {args.rows} partidas...")
+    histories = _generate(args.rows)
+
+    started = time.perf_counter()
+    columns = HistoryColumns.from_histories(histories)
+    print(f"Montagem das colunas: {time.perf_counter() - started:.2f}s\n")
+
+    player = PLAYERS[0]
+    list_time, expected = _timed(_list_statistics, histories, player)
+    print(f"{'caminho':<22} {'tempo(s)':>9} {'ganho':>7}")
+    print(f"{'listas de objetos':<22} {list_time:>9.3f} {1.0:>6.1f}x")
+
+    numpy_module = history_columns.np
+    backends = [('colunas array', None)]
+    if numpy_module is not None:
+        backends.append(('colunas numpy', numpy_module))
+
+    for label, module in backends:
+        history_columns.np = module
+        elapsed, result = _timed(_column_statistics, columns, player)
+        if result != expected:
+            print(f"Divergência em {label}: {result} != {expected}")
+            sys.exit(1)
+        print(f"{label:<22} {elapsed:>9.3f} {list_time / elapsed:>6.1f}x")
+
+    history_columns.np = numpy_module
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark: GameHistory completo x LazyGameHistory nos filtros do histórico
+
+Grava um history.txt sintético e roda os filtros comuns do
+HistoryUseCase com o FileHistoryRepository decodificando todos os
+campos (lazy_records=False) e com registros preguiçosos, que só
+convertem os campos lidos pelo filtro.
+
+Uso:
+    python benchmarks/lazy_history.py [--rows 500000]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.storage.file_history_repository import FileHistoryRepository
+from domain.use_cases import HistoryUseCase
+
+PLAYERS = [f"Jogador{i}" for i in range(200)]
+WORDS = ["PYTHON", "FORCA", "PREGUICA", "CAMPO", "LINHA", "MEMORIA", "CACHE"]
+
+
+def _write_history(path: str, rows: int):
+    rng = random.Random(42)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("# Histórico - Formato: data|jogador|palavra|resultado|tentativas|duracao\n")
+        for i in range(rows):
+            f.write(f"2025-01-{1 + i * 28 // rows:02d} {i % 24:02d}:{i % 60:02d}:{i * 7 % 60:02d}|"
+                    f"{rng.choice(PLAYERS)}|{rng.choice(WORDS)}|{'WIN' if rng.random() < 0.6 else 'LOSS'}|"
+                    f"{rng.randint(0, 6)}|{rng.randint(5, 600)}\n")
+
+
+def _filters(use_case: HistoryUseCase, repository: FileHistoryRepository):
+    player = PLAYERS[0]
+    return [
+        ("get_victories()", lambda: len(use_case.get_victories())),
+        ("get_defeats()", lambda: len(use_case.get_defeats())),
+        ("get_all + jogador", lambda: sum(1 for h in repository.get_all() if h.player_name == player)),
+        ("get_all + palavra", lambda: sum(1 for h in repository.get_all() if h.word == "PYTHON")),
+        ("get_all + tentativas", lambda: sum(h.attempts_used for h in repository.get_all())),
+        # Vários campos por registro: a linha é dividida uma vez e as partes reaproveitadas
+        ("get_all + 4 campos", lambda: sum(h.attempts_used + h.duration_seconds
+                                           for h in repository.get_all()
+                                           if h.result == 'WIN' and h.player_name != player)),
+    ]
+
+
+def _timed(func, repeat: int = 3):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Registros completos x preguiçosos")
+    parser.add_argument("--rows", type=int, default=500_000)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="forca-lazy-")
+    try:
+        path = os.path.join(directory, "history.txt")
+        _write_history(path, args.rows)
+
+        eager = FileHistoryRepository(path, segment_by_month=False, lazy_records=False)
+        lazy = FileHistoryRepository(path, segment_by_month=False, lazy_records=True)
+        eager_filters = _filters(HistoryUseCase(eager), eager)
+        lazy_filters = _filters(HistoryUseCase(lazy), lazy)
+
+        print(f"{args.rows} partidas")
+        print(f"{'filtro':<22} {'completo(s)':>12} {'preguiçoso(s)':>14} {'ganho':>7}")
+
+        for (label, eager_run), (_, lazy_run) in zip(eager_filters, lazy_filters):
+            eager_time, expected = _timed(eager_run)
+            lazy_time, result = _timed(lazy_run)
+            if result != expected:
+                print(f"Divergência em {label}: {result} != {expected}")
+                sys.exit(1)
+            print(f"{label:<22} {eager_time:>12.3f} {lazy_time:>14.3f} {eager_time / lazy_time:>6.1f}x")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,433 @@
+"""
+Gerador de carga: jogadores simulados jogando partidas completas
+
+Cada jogador simulado é uma thread que inicia partidas single player,
+chuta letras com a estratégia escolhida até o fim e começa outra. As
+partidas encerradas passam pelo GameResultWriter e são gravadas em
+scoreboard.txt e history.txt, como no jogo de verdade.
+
+Modos:
+    inprocess  Um HangmanGameUseCase por jogador, compartilhando
+               repositórios, escritor e gerenciador de sessões, sobre
+               uma cópia temporária de assets/words.txt
+    http       Contra o servidor (server.py) em --url; --assets aponta
+               para a pasta de dados do servidor para a conferência
+
+Relata vazão, p50/p95/p99 de início de partida, make_guess, palpite
+final (que entrega o resultado ao escritor) e, no modo inprocess, da
+persistência (do submit até o lote estar gravado). Ao final confere
+scoreboard.txt contra history.txt para os jogadores simulados, que
+usam nomes únicos por execução.
+
+Uso:
+    python benchmarks/load_generator.py --players 32 --games 50 --strategy dictionary
+    python benchmarks/load_generator.py --mode http --url http://127.0.0.1:8080 --assets assets
+"""
+
+import argparse
+import http.client
+import json
+import os
+import random
+import secrets
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.storage import FileWordRepository, FilePlayerRepository, FileHistoryRepository
+from domain.services import GameResultWriter, GameSessionManager
+from domain.use_cases import HangmanGameUseCase
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Letras mais frequentes em português primeiro
+FREQUENCY_ORDER = "AEOSRINDMUTCLPVGHQBFZJXKWY"
+
+
+# ==================== Estratégias de palpite ====================
+
+class FrequencyStrategy:
+    """Chuta as letras na ordem de frequência do português"""
+
+    def __init__(self, words: List[str], rng: random.Random):
+        pass
+
+    def next_letter(self, pattern: str, guessed: set) -> str:
+        return next(letter for letter in FREQUENCY_ORDER if letter not in guessed)
+
+
+class RandomStrategy:
+    """Chuta letras em ordem aleatória"""
+
+    def __init__(self, words: List[str], rng: random.Random):
+        self.rng = rng
+
+    def next_letter(self, pattern: str, guessed: set) -> str:
+        return self.rng.choice([letter for letter in FREQUENCY_ORDER if letter not in guessed])
+
+
+class DictionaryStrategy:
+    """Filtra o dicionário pelo padrão revelado e chuta a letra mais comum entre os candidatos"""
+
+    def __init__(self, words: List[str], rng: random.Random):
+        self.words = [w.upper() for w in words]
+
+    def next_letter(self, pattern: str, guessed: set) -> str:
+        wrong = {letter for letter in guessed if letter not in pattern}
+        candidates = [
+            word for word in self.words
+            if len(word) == len(pattern)
+            and all(p == '_' and c not in guessed or p == c for p, c in zip(pattern, word))
+            and not wrong.intersection(word)
+        ]
+
+        counts = Counter(letter for word in candidates for letter in set(word) if letter not in guessed)
+        if counts:
+            return counts.most_common(1)[0][0]
+        return next(letter for letter in FREQUENCY_ORDER if letter not in guessed)
+
+
+STRATEGIES = {
+    'frequency': FrequencyStrategy,
+    'random': RandomStrategy,
+    'dictionary': DictionaryStrategy,
+}
+
+
+# ==================== Clientes ====================
+
+class _TimedResultWriter(GameResultWriter):
+    # Mede do submit até o lote com o resultado estar gravado
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stamp_lock = threading.Lock()
+        self._submitted_at: Dict[int, float] = {}
+        self.persist_latencies: List[float] = []
+
+    def submit(self, history, player_name: str, won: bool) -> None:
+        with self._stamp_lock:
+            # O objeto fica vivo na fila até ser gravado: id() não se repete antes disso
+            self._submitted_at[id(history)] = time.perf_counter()
+        super().submit(history, player_name, won)
+
+    def _write_batch(self, batch) -> None:
+        super()._write_batch(batch)
+        now = time.perf_counter()
+        with self._stamp_lock:
+            for history, _, _ in batch:
+                started = self._submitted_at.pop(id(history), None)
+                if started is not None:
+                    self.persist_latencies.append(now - started)
+
+
+class _InProcessClient:
+    # Um HangmanGameUseCase por jogador, dependências compartilhadas
+    def __init__(self, shared: Dict):
+        self.use_case = HangmanGameUseCase(
+            shared['words'], shared['players'], shared['history'],
+            result_writer=shared['writer'], session_manager=shared['sessions']
+        )
+
+    def start(self, player_name: str) -> str:
+        return self.use_case.start_single_player_game(player_name).masked_word
+
+    def guess(self, letter: str) -> Dict:
+        result = self.use_case.make_guess(letter)
+        return {
+            'valid': result['valid'],
+            'game_over': result['game_over'],
+            'won': result['won'],
+            'masked_word': result['game_state'].masked_word,
+        }
+
+
+class _HttpClient:
+    # Uma conexão keep-alive por jogador
+    def __init__(self, url: str):
+        parts = urlsplit(url)
+        self.connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+        self.session_id: Optional[str] = None
+
+    def _post(self, path: str, payload: Dict) -> Dict:
+        self.connection.request('POST', path, body=json.dumps(payload),
+                                headers={'Content-Type': 'application/json'})
+        response = self.connection.getresponse()
+        data = json.loads(response.read())
+        if response.status >= 400:
+            raise RuntimeError(f"{path}: {response.status} {data.get('error')}")
+        return data
+
+    def start(self, player_name: str) -> str:
+        data = self._post('/games', {'player': player_name})
+        self.session_id = data['session_id']
+        return data['game_state']['masked_word']
+
+    def guess(self, letter: str) -> Dict:
+        data = self._post(f'/games/{self.session_id}/guess', {'letter': letter})
+        return {
+            'valid': data['valid'],
+            'game_over': data['game_over'],
+            'won': data['won'],
+            'masked_word': data['game_state']['masked_word'],
+        }
+
+
+# ==================== Execução ====================
+
+_merge_lock = threading.Lock()
+
+
+def _player(client, name: str, games: int, strategy, samples: Dict[str, List[float]],
+            outcomes: Counter, errors: List[str]):
+    start_times, guess_times, finish_times = [], [], []
+    won = lost = 0
+
+    try:
+        for _ in range(games):
+            started = time.perf_counter()
+            masked = client.start(name)
+            start_times.append(time.perf_counter() - started)
+
+            guessed = set()
+            while True:
+                letter = strategy.next_letter(masked.replace(' ', ''), guessed)
+                guessed.add(letter)
+
+                started = time.perf_counter()
+                result = client.guess(letter)
+                elapsed = time.perf_counter() - started
+                guess_times.append(elapsed)
+
+                masked = result['masked_word']
+                if result['game_over']:
+                    finish_times.append(elapsed)
+                    won += result['won']
+                    lost += not result['won']
+                    break
+    except Exception as e:
+        errors.append(f"{name}: {e}")
+
+    # Listas locais por thread: junta uma vez no fim (sem trava no laço)
+    with _merge_lock:
+        samples['start'].extend(start_times)
+        samples['make_guess'].extend(guess_times)
+        samples['finish'].extend(finish_times)
+        outcomes[(name, 'WIN')] += won
+        outcomes[(name, 'LOSS')] += lost
+
+
+def _percentiles(values: List[float]) -> Dict[str, float]:
+    if not values:
+        return {'count': 0, 'p50_ms': 0.0, 'p95_ms': 0.0, 'p99_ms': 0.0, 'max_ms': 0.0}
+
+    ordered = sorted(values)
+
+    def rank(percent: float) -> float:
+        # Nearest-rank
+        return ordered[max(0, min(len(ordered) - 1, int(round(percent / 100 * len(ordered))) - 1))] * 1000
+
+    return {
+        'count': len(ordered),
+        'p50_ms': rank(50),
+        'p95_ms': rank(95),
+        'p99_ms': rank(99),
+        'max_ms': ordered[-1] * 1000,
+    }
+
+
+def check_consistency(assets: str, outcomes: Counter, use_delta_log: bool = False) -> Dict:
+    """
+    Confere scoreboard.txt x history.txt (e x o que os clientes viram)
+    para os jogadores simulados
+
+    Args:
+        assets: Pasta com scoreboard.txt e history.txt
+        outcomes: Vitórias/derrotas vistas pelos clientes, por (nome, resultado)
+        use_delta_log: O placar foi gravado com log de deltas (lido junto do snapshot)
+
+    Returns:
+        Dicionário com 'consistent' e as divergências encontradas
+    """
+    scoreboard = FilePlayerRepository(os.path.join(assets, "scoreboard.txt"), use_delta_log=use_delta_log)
+    players = {p.name: p for p in scoreboard.get_all()}
+    history = Counter()
+    for record in FileHistoryRepository(os.path.join(assets, "history.txt")).iter_records():
+        history[(record.player_name, record.result)] += 1
+
+    names = sorted({name for name, _ in outcomes})
+    mismatches = []
+    for name in names:
+        player = players.get(name)
+        board = (player.wins, player.losses) if player else (0, 0)
+        logged = (history[(name, 'WIN')], history[(name, 'LOSS')])
+        seen = (outcomes[(name, 'WIN')], outcomes[(name, 'LOSS')])
+        if not board == logged == seen:
+            mismatches.append({'player': name, 'scoreboard': board, 'history': logged, 'clients': seen})
+
+    return {
+        'players': len(names),
+        'games': sum(outcomes.values()),
+        'consistent': not mismatches,
+        'mismatches': mismatches[:20],
+    }
+
+
+def _wait_server_flush(url: str, timeout: float = 30.0) -> Dict:
+    # Espera o escritor do servidor gravar tudo o que recebeu
+    parts = urlsplit(url)
+    deadline = time.monotonic() + timeout
+    while True:
+        connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=10)
+        connection.request('GET', '/metrics')
+        metrics = json.loads(connection.getresponse().read())
+        connection.close()
+
+        writer = metrics['result_writer']
+        done = writer['pending'] == 0 and writer['written'] + writer['failed'] >= writer['submitted']
+        if done or time.monotonic() > deadline:
+            return metrics
+        time.sleep(0.1)
+
+
+def run(args) -> Dict:
+    run_id = secrets.token_hex(3)
+    names = [f"Carga{run_id}x{i}" for i in range(args.players)]
+    words = [line.strip() for line in open(args.words, encoding='utf-8')
+             if line.strip() and not line.startswith('#')]
+
+    shared = None
+    directory = None
+    if args.mode == 'inprocess':
+        directory = tempfile.mkdtemp(prefix="forca-carga-")
+        shutil.copy(args.words, os.path.join(directory, "words.txt"))
+        player_repository = FilePlayerRepository(os.path.join(directory, "scoreboard.txt"),
+                                                 use_delta_log=args.delta_log)
+        history_repository = FileHistoryRepository(os.path.join(directory, "history.txt"))
+        word_repository = FileWordRepository(os.path.join(directory, "words.txt"))
+        writer = _TimedResultWriter(history_repository, player_repository)
+        shared = {
+            'words': word_repository,
+            'players': player_repository,
+            'history': history_repository,
+            'writer': writer,
+            'sessions': GameSessionManager(word_repository, writer, idle_timeout=None, memory_budget=None),
+        }
+
+    samples = {'start': [], 'make_guess': [], 'finish': []}
+    outcomes: Counter = Counter()
+    errors: List[str] = []
+    threads = []
+    for i, name in enumerate(names):
+        client = _InProcessClient(shared) if shared else _HttpClient(args.url)
+        strategy = STRATEGIES[args.strategy](words, random.Random(args.seed + i))
+        threads.append(threading.Thread(
+            target=_player, args=(client, name, args.games, strategy, samples, outcomes, errors)
+        ))
+
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    report = {
+        'mode': args.mode,
+        'strategy': args.strategy,
+        'players': args.players,
+        'elapsed_seconds': elapsed,
+        'games': len(samples['finish']),
+        'games_per_second': len(samples['finish']) / elapsed,
+        'guesses_per_second': len(samples['make_guess']) / elapsed,
+        'win_rate': (sum(n for (_, r), n in outcomes.items() if r == 'WIN') / len(samples['finish'])
+                     if samples['finish'] else 0.0),
+        'latency': {key: _percentiles(values) for key, values in samples.items()},
+        'errors': errors[:20],
+    }
+
+    try:
+        if shared:
+            # close() grava os pendentes: a persistência entra na medição
+            flush_started = time.perf_counter()
+            try:
+                shared['writer'].close()
+            except RuntimeError as e:
+                report['errors'].append(str(e))
+            report['final_flush_seconds'] = time.perf_counter() - flush_started
+            report['latency']['persist'] = _percentiles(shared['writer'].persist_latencies)
+            report['result_writer'] = shared['writer'].metrics()
+            report['consistency'] = check_consistency(directory, outcomes, args.delta_log)
+        else:
+            metrics = _wait_server_flush(args.url)
+            report['result_writer'] = metrics['result_writer']
+            report['server_latency'] = {
+                route: {k: v for k, v in values.items() if k != 'buckets'}
+                for route, values in metrics['latency'].items()
+            }
+            report['consistency'] = check_consistency(args.assets, outcomes)
+    finally:
+        if directory:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    return report
+
+
+def _print_report(report: Dict):
+    print(f"modo={report['mode']} estratégia={report['strategy']} jogadores={report['players']} "
+          f"partidas={report['games']} em {report['elapsed_seconds']:.2f}s")
+    print(f"vazão: {report['games_per_second']:.1f} partidas/s, {report['guesses_per_second']:.1f} palpites/s, "
+          f"vitórias {report['win_rate']:.0%}")
+
+    print(f"{'operação':<12} {'n':>8} {'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9} {'max(ms)':>9}")
+    for name, stats in report['latency'].items():
+        print(f"{name:<12} {stats['count']:>8} {stats['p50_ms']:>9.2f} {stats['p95_ms']:>9.2f} "
+              f"{stats['p99_ms']:>9.2f} {stats['max_ms']:>9.2f}")
+
+    writer = report['result_writer']
+    print(f"escritor: {writer['written']} gravados, {writer['failed']} falhas, {writer['batches']} lotes "
+          f"(média {writer['average_batch_size']:.1f}), {writer['blocked_submits']} submits bloqueados")
+
+    consistency = report['consistency']
+    status = "OK" if consistency['consistent'] else "DIVERGENTE"
+    print(f"consistência scoreboard x history: {status} ({consistency['players']} jogadores, "
+          f"{consistency['games']} partidas)")
+    for mismatch in consistency['mismatches']:
+        print(f"  {mismatch}")
+    for error in report['errors']:
+        print(f"  erro: {error}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gerador de carga com jogadores simulados")
+    parser.add_argument("--mode", choices=["inprocess", "http"], default="inprocess")
+    parser.add_argument("--players", type=int, default=16)
+    parser.add_argument("--games", type=int, default=50, help="Partidas por jogador")
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), default="frequency")
+    parser.add_argument("--words", default=os.path.join(ROOT, "assets", "words.txt"),
+                        help="Dicionário (cópia usada no modo inprocess, estratégia dictionary)")
+    parser.add_argument("--delta-log", action="store_true", help="Placar com log de deltas")
+    parser.add_argument("--url", default="http://127.0.0.1:8080", help="Servidor (modo http)")
+    parser.add_argument("--assets", default="assets", help="Pasta de dados do servidor (modo http)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", help="Grava o relatório neste arquivo")
+    args = parser.parse_args()
+
+    report = run(args)
+    _print_report(report)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+    sys.exit(0 if report['consistency']['consistent'] and not report['errors'] else 1)
+
+
+if __name__ == "__main__":
+    main()
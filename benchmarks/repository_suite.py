@@ -0,0 +1,522 @@
+"""
+Suíte de micro-benchmarks dos repositórios em arquivo e dos casos de uso
+
+Gera words.txt, scoreboard.txt e history.txt sintéticos em cada escala
+e mede cada método público de FileWordRepository, FilePlayerRepository,
+FileHistoryRepository, ScoreboardUseCase e HistoryUseCase:
+
+    cold_ms      Mediana da primeira chamada em --cold-samples instâncias novas
+                 (índices laterais já existem); cold_min_ms é a melhor
+    warm_ms      Mediana das repetições seguintes na mesma instância;
+                 warm_min_ms é a melhor e mean_ms a média
+    alloc_*      Pico e saldo de memória alocada (tracemalloc), frio e quente
+    rss_*        Pico de RSS do processo e quanto ele cresceu no caso
+
+Cada (escala, classe) roda em --processes subprocessos novos, em
+rodadas intercaladas, cada um sobre uma cópia nova dos dados (os casos
+de escrita não engordam os arquivos da rodada seguinte), e os números
+finais são medianas entre eles. O pico de RSS de uma classe também não
+contamina a outra. Os resultados vão para um JSON; o comando compare
+acusa regressões contra uma linha de base gravada.
+
+O compare só olha medianas (cold_ms, warm_ms) e picos de alocação, e
+uma métrica só regride se piorar mais que --threshold (padrão 100%, ou
+seja, 2x) E por mais que o piso absoluto (--min-delta-ms, padrão 1 ms).
+Na escala 1k os tempos frios ficam em poucos milissegundos e oscilam
+até ~1.7x entre execuções idênticas, por isso os padrões são largos: o
+alvo são regressões de complexidade, que nas escalas maiores passam
+disso com folga. Os padrões foram escolhidos para que duas execuções do
+mesmo código na mesma máquina saiam limpas; confira isso ao trocar de
+máquina (e aperte o --threshold só se a máquina for mais estável):
+
+    python benchmarks/repository_suite.py run --scales 1k --out a.json
+    python benchmarks/repository_suite.py run --scales 1k --out b.json
+    python benchmarks/repository_suite.py compare a.json b.json   # deve sair com 0
+
+Uso:
+    python benchmarks/repository_suite.py run --scales 1k 100k --out bench.json
+    python benchmarks/repository_suite.py run --scales 10m --out bench-10m.json  # vários GB de RAM
+    python benchmarks/repository_suite.py compare baseline.json bench.json [--threshold 1.0]
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows: sem getrusage, o RSS não é medido
+    resource = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from data.storage import FileWordRepository, FilePlayerRepository, FileHistoryRepository
+from domain.entities import GameHistory, Player
+from domain.use_cases import ScoreboardUseCase, HistoryUseCase
+
+SCALES = {'1k': 1_000, '10k': 10_000, '100k': 100_000, '1m': 1_000_000, '10m': 10_000_000}
+TARGETS = ['ScoreboardUseCase', 'HistoryUseCase', 'FileWordRepository',
+           'FilePlayerRepository', 'FileHistoryRepository']
+LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+# Casos que alteram os dados: ficam no fim de cada lista, depois das leituras
+WRITE_METHODS = {'add_word', 'import_words', 'save_membership_index', 'save', 'save_game_result',
+                 'save_game_results', 'compact', 'save_many'}
+MIN_SAMPLES = 5  # Amostras quentes mínimas, mesmo estourando o budget
+WORDS_IN_HISTORY = ["PYTHON", "FORCA", "ARQUIVO", "MEMORIA", "INDICE", "CACHE", "PLACAR", "LINHA"]
+
+
+# ==================== Dados sintéticos ====================
+
+def _word(i: int) -> str:
+    # Palavra única por índice: i em base 26, com pelo menos 6 letras
+    letters = []
+    while True:
+        i, digit = divmod(i, 26)
+        letters.append(LETTERS[digit])
+        if i == 0 and len(letters) >= 6:
+            return ''.join(letters)
+
+
+def _history_players(records: int) -> int:
+    return max(10, min(records // 20, 50_000))
+
+
+def generate(directory: str, records: int) -> None:
+    """Grava os três arquivos com `records` linhas cada"""
+    os.makedirs(directory, exist_ok=True)
+
+    with open(os.path.join(directory, "words.txt"), 'w', encoding='utf-8') as f:
+        f.writelines(f"{_word(i)}\n" for i in range(records))
+
+    with open(os.path.join(directory, "scoreboard.txt"), 'w', encoding='utf-8') as f:
+        f.write("# Placar - Formato: nome|vitorias|derrotas\n")
+        # Um em cada dez jogadores ainda não jogou (fica fora do ranking)
+        f.writelines(
+            f"Jogador{i}|{0 if i % 10 == 9 else (i * 7) % 97}|{0 if i % 10 == 9 else (i * 3) % 61}\n"
+            for i in range(records)
+        )
+
+    # Doze meses terminando no mês corrente: os antigos viram segmentos na migração
+    players = _history_players(records)
+    end = datetime.now().replace(microsecond=0)
+    start = end - timedelta(days=365)
+    step = (end - start).total_seconds() / records
+    with open(os.path.join(directory, "history.txt"), 'w', encoding='utf-8') as f:
+        f.write("# Histórico - Formato: data|jogador|palavra|resultado|tentativas|duracao\n")
+        for i in range(records):
+            moment = start + timedelta(seconds=int(i * step))
+            f.write(f"{moment:%Y-%m-%d %H:%M:%S}|Jogador{(i * 7919) % players}|"
+                    f"{WORDS_IN_HISTORY[i % len(WORDS_IN_HISTORY)]}|{'WIN' if i % 5 < 3 else 'LOSS'}|"
+                    f"{i % 7}|{5 + i % 600}\n")
+
+
+def prime(directory: str) -> None:
+    """Migração para segmentos e índices laterais, fora da medição"""
+    history = FileHistoryRepository(os.path.join(directory, "history.txt"))
+    history.get_by_player("Jogador0")
+    history.get_summary()
+    history.get_between(datetime.now() - timedelta(days=1), datetime.now())
+    history.get_recent(1)
+    words = FileWordRepository(os.path.join(directory, "words.txt"))
+    words.contains(_word(0))
+    words.save_membership_index()
+
+
+# ==================== Casos ====================
+
+def _cases(directory: str, records: int) -> Dict[str, Tuple[Callable, List[Tuple[str, Callable]]]]:
+    # Por classe: (fábrica de instância nova, [(método, chamada)])
+    words_path = os.path.join(directory, "words.txt")
+    players_path = os.path.join(directory, "scoreboard.txt")
+    history_path = os.path.join(directory, "history.txt")
+
+    known_word = _word(records // 2)
+    known_player = f"Jogador{records // 2}"
+    history_player = f"Jogador{_history_players(records) // 2}"
+    now = datetime.now()
+    month_ago = now - timedelta(days=30)
+    counter = iter(range(10 ** 12))
+
+    def new_word() -> str:
+        return "NOVA" + _word(next(counter))
+
+    def new_history() -> GameHistory:
+        return GameHistory(now.strftime("%Y-%m-%d %H:%M:%S"), history_player, "PYTHON", "WIN", 2, 30)
+
+    return {
+        'FileWordRepository': (lambda: FileWordRepository(words_path), [
+            ('get_all', lambda r: r.get_all()),
+            ('contains', lambda r: r.contains(known_word)),
+            ('contains(ausente)', lambda r: r.contains("AUSENTEZZZ")),
+            ('random_word', lambda r: r.random_word()),
+            ('add_word', lambda r: r.add_word(new_word())),
+            ('import_words(1000)', lambda r: r.import_words([new_word() for _ in range(1000)])),
+            ('save_membership_index', lambda r: r.save_membership_index()),
+        ]),
+        'FilePlayerRepository': (lambda: FilePlayerRepository(players_path), [
+            ('get_all', lambda r: r.get_all()),
+            ('get_by_name', lambda r: r.get_by_name(known_player)),
+            ('get_ranking(10)', lambda r: r.get_ranking(10)),
+            ('get_ranking', lambda r: r.get_ranking()),
+            ('get_rank', lambda r: r.get_rank(known_player)),
+            ('data_version', lambda r: r.data_version()),
+            ('save', lambda r: r.save(Player(f"Novo{next(counter)}", 1, 0))),
+            ('save_game_result', lambda r: r.save_game_result(known_player, True)),
+            ('save_game_results(100)', lambda r: r.save_game_results(
+                [(f"Jogador{i}", i % 2 == 0) for i in range(100)])),
+            ('compact', lambda r: r.compact()),
+        ]),
+        'FileHistoryRepository': (lambda: FileHistoryRepository(history_path), [
+            ('get_all', lambda r: r.get_all()),
+            ('iter_records', lambda r: sum(1 for _ in r.iter_records())),
+            ('get_by_player', lambda r: r.get_by_player(history_player)),
+            ('get_summary', lambda r: r.get_summary()),
+            ('get_summary(jogador)', lambda r: r.get_summary(history_player)),
+            ('get_between(30 dias)', lambda r: r.get_between(month_ago, now)),
+            ('get_recent(20)', lambda r: r.get_recent(20)),
+            ('data_version', lambda r: r.data_version()),
+            ('save', lambda r: r.save(new_history())),
+            ('save_many(100)', lambda r: r.save_many([new_history() for _ in range(100)])),
+        ]),
+        'ScoreboardUseCase': (lambda: ScoreboardUseCase(FilePlayerRepository(players_path)), [
+            ('get_ranking', lambda u: u.get_ranking()),
+            ('get_top_players_by_win_rate', lambda u: u.get_top_players_by_win_rate()),
+            ('get_player_rank', lambda u: u.get_player_rank(known_player)),
+            ('get_total_players', lambda u: u.get_total_players()),
+            ('get_active_players_count', lambda u: u.get_active_players_count()),
+            ('get_best_player', lambda u: u.get_best_player()),
+            ('snapshot', lambda u: u.snapshot().get_ranking()),
+        ]),
+        'HistoryUseCase': (lambda: HistoryUseCase(FileHistoryRepository(history_path)), [
+            ('get_recent_games', lambda u: u.get_recent_games()),
+            ('get_player_history', lambda u: u.get_player_history(history_player)),
+            ('get_games_between', lambda u: u.get_games_between(month_ago, now)),
+            ('get_victories', lambda u: u.get_victories()),
+            ('get_defeats', lambda u: u.get_defeats()),
+            ('get_victories(jogador)', lambda u: u.get_victories(history_player)),
+            ('get_statistics', lambda u: u.get_statistics()),
+            ('get_player_statistics', lambda u: u.get_player_statistics(history_player)),
+            ('get_statistics_by_player', lambda u: u.get_statistics_by_player()),
+            ('snapshot', lambda u: u.snapshot().get_recent_games()),
+        ]),
+    }
+
+
+def _max_rss_kb() -> Optional[int]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS informa bytes; Linux, kilobytes
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def _timed(func: Callable) -> float:
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+
+def _allocation(func: Callable) -> Tuple[int, int]:
+    # (pico, saldo) em bytes durante a chamada
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        net, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak, net
+
+
+def measure(factory: Callable, call: Callable, repeat: int, budget: float, allocations: bool,
+            cold_samples: int = 3) -> Dict[str, Any]:
+    """
+    Mede um método: frio (mediana de cold_samples instâncias novas), quente
+    (até `repeat` vezes, parando após `budget` segundos mas nunca com menos
+    de MIN_SAMPLES amostras) e alocações
+    """
+    rss_before = _max_rss_kb()
+
+    cold: List[float] = []
+    for _ in range(max(1, cold_samples)):
+        gc.collect()
+        instance = factory()
+        cold.append(_timed(lambda: call(instance)))
+        del instance
+
+    gc.collect()
+    instance = factory()
+    call(instance)  # A primeira chamada é fria e já foi medida acima
+    warm: List[float] = []
+    spent = 0.0
+    while len(warm) < repeat and (spent < budget or len(warm) < MIN_SAMPLES):
+        elapsed = _timed(lambda: call(instance))
+        warm.append(elapsed)
+        spent += elapsed
+    del instance
+
+    result = {
+        'cold_ms': statistics.median(cold) * 1000,
+        'cold_min_ms': min(cold) * 1000,
+        'cold_samples': len(cold),
+        'warm_ms': statistics.median(warm) * 1000,
+        'warm_min_ms': min(warm) * 1000,
+        'mean_ms': statistics.fmean(warm) * 1000,
+        'repeat': len(warm),
+    }
+
+    if allocations:
+        instance = factory()
+        result['alloc_cold_peak_bytes'], result['alloc_cold_net_bytes'] = _allocation(lambda: call(instance))
+        result['alloc_warm_peak_bytes'], result['alloc_warm_net_bytes'] = _allocation(lambda: call(instance))
+        del instance
+
+    rss_after = _max_rss_kb()
+    if rss_after is not None:
+        result['rss_peak_kb'] = rss_after
+        result['rss_growth_kb'] = rss_after - rss_before
+    return result
+
+
+def _run_target(directory: str, records: int, target: str, repeat: int, budget: float, allocations: bool,
+                cold_samples: int):
+    # Executado no subprocesso: uma linha JSON por método na saída padrão
+    factory, methods = _cases(directory, records)[target]
+
+    # Aquecimento do processo (imports tardios, caches do interpretador e do
+    # sistema de arquivos) só com leituras: escritas mudariam os dados medidos
+    instance = factory()
+    for method, call in methods:
+        if method.split('(')[0] not in WRITE_METHODS:
+            call(instance)
+    del instance
+
+    for method, call in methods:
+        result = {'target': target, 'method': method}
+        try:
+            result.update(measure(factory, call, repeat, budget, allocations, cold_samples))
+        except Exception as e:
+            result['error'] = f"{type(e).__name__}: {e}"
+        print(json.dumps(result), flush=True)
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _run_subprocess(directory: str, records: int, target: str, args) -> List[Dict[str, Any]]:
+    #Mede uma classe num processo novo, sobre uma cópia dos dados; uma linha JSON por método
+    # Os casos de escrita alteram os arquivos: cada rodada parte dos dados gerados
+    work = tempfile.mkdtemp(prefix="forca-rodada-")
+    shutil.copytree(directory, work, dirs_exist_ok=True)
+    try:
+        return _run_command(work, records, target, args)
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+
+def _run_command(directory: str, records: int, target: str, args) -> List[Dict[str, Any]]:
+    command = [sys.executable, os.path.abspath(__file__), "_target", directory, str(records), target,
+               "--repeat", str(args.repeat), "--budget", str(args.budget),
+               "--cold-samples", str(args.cold_samples)]
+    if args.no_alloc:
+        command.append("--no-alloc")
+
+    completed = subprocess.run(command, capture_output=True, text=True)
+    if completed.returncode != 0:
+        print(f"{target} falhou:\n{completed.stderr}", file=sys.stderr)
+
+    # Outras linhas são mensagens dos repositórios (ex.: "Erro ...")
+    return [json.loads(line) for line in completed.stdout.splitlines() if line.startswith('{')]
+
+
+def _aggregate(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    #Junta as rodadas de um método: mediana das medianas, mínimo dos mínimos, pico dos picos
+    merged = dict(results[0])
+    merged['processes'] = len(results)
+    for key, value in results[0].items():
+        values = [r[key] for r in results if key in r]
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            continue
+        if key.endswith('_min_ms'):
+            merged[key] = min(values)
+        elif key.startswith('rss_peak'):
+            merged[key] = max(values)
+        elif key in ('repeat', 'cold_samples'):
+            merged[key] = sum(values)
+        else:
+            merged[key] = statistics.median(values)
+    return merged
+
+
+def run(args) -> Dict[str, Any]:
+    report = {
+        'version': 1,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'git': _git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'allocations': not args.no_alloc,
+        'results': [],
+    }
+
+    for scale in args.scales:
+        records = SCALES[scale]
+        directory = os.path.join(args.data_dir, scale) if args.data_dir else tempfile.mkdtemp(prefix=f"forca-{scale}-")
+        try:
+            if not os.path.exists(os.path.join(directory, "history.txt")):
+                started = time.perf_counter()
+                generate(directory, records)
+                prime(directory)
+                print(f"[{scale}] dados gerados em {time.perf_counter() - started:.1f}s", file=sys.stderr)
+
+            # Rodadas intercaladas: a variação entre processos (frequência da CPU,
+            # vizinhos na máquina) se espalha por todas as classes
+            runs: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+            for round_number in range(max(1, args.processes)):
+                for target in args.targets:
+                    for result in _run_subprocess(directory, records, target, args):
+                        runs.setdefault((target, result['method']), []).append(result)
+
+            for (target, method), results in runs.items():
+                result = _aggregate(results)
+                result.update({'scale': scale, 'records': records})
+                report['results'].append(result)
+                print(f"[{scale}] {target}.{method}: "
+                      f"{result.get('warm_ms', float('nan')):.3f} ms quente, "
+                      f"{result.get('cold_ms', float('nan')):.3f} ms frio"
+                      + (f" ERRO {result['error']}" if 'error' in result else ""), file=sys.stderr)
+        finally:
+            if not args.data_dir:
+                shutil.rmtree(directory, ignore_errors=True)
+
+    return report
+
+
+# ==================== Comparação ====================
+
+COMPARED = ['warm_ms', 'cold_ms', 'alloc_warm_peak_bytes', 'alloc_cold_peak_bytes']
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float,
+            min_delta_ms: float, min_delta_bytes: int) -> List[Dict[str, Any]]:
+    """
+    Compara duas execuções caso a caso
+
+    Uma métrica regride quando passa da linha de base em mais de
+    `threshold` (fração) e a diferença absoluta supera o piso de ruído
+    (min_delta_ms para tempos, min_delta_bytes para alocações).
+
+    Returns:
+        Uma linha por (escala, classe, método, métrica) presente nas duas execuções
+    """
+    base = {(r['scale'], r['target'], r['method']): r for r in baseline['results']}
+    rows = []
+    for result in current['results']:
+        key = (result['scale'], result['target'], result['method'])
+        previous = base.get(key)
+        if previous is None:
+            continue
+
+        for metric in COMPARED:
+            if metric not in result or metric not in previous:
+                continue
+            old, new = previous[metric], result[metric]
+            floor = min_delta_ms if metric.endswith('_ms') else min_delta_bytes
+            ratio = new / old if old else float('inf') if new else 1.0
+            if new - old > floor and ratio > 1 + threshold:
+                status = 'REGRESSÃO'
+            elif old - new > floor and ratio < 1 / (1 + threshold):
+                status = 'melhora'
+            else:
+                status = 'ok'
+            rows.append({'scale': key[0], 'target': key[1], 'method': key[2], 'metric': metric,
+                         'baseline': old, 'current': new, 'ratio': ratio, 'status': status})
+    return rows
+
+
+def _print_comparison(rows: List[Dict[str, Any]], show_all: bool):
+    print(f"{'escala':<6} {'caso':<52} {'métrica':<22} {'base':>12} {'atual':>12} {'razão':>7}  status")
+    for row in rows:
+        if row['status'] == 'ok' and not show_all:
+            continue
+        case = f"{row['target']}.{row['method']}"
+        print(f"{row['scale']:<6} {case:<52} {row['metric']:<22} {row['baseline']:>12.3f} "
+              f"{row['current']:>12.3f} {row['ratio']:>6.2f}x  {row['status']}")
+
+    regressions = sum(1 for row in rows if row['status'] == 'REGRESSÃO')
+    improvements = sum(1 for row in rows if row['status'] == 'melhora')
+    print(f"{len(rows)} métricas comparadas: {regressions} regressões, {improvements} melhoras")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-benchmarks dos repositórios e casos de uso")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Gera os dados e mede os métodos")
+    run_parser.add_argument("--scales", nargs="+", choices=list(SCALES), default=["1k", "100k"])
+    run_parser.add_argument("--targets", nargs="+", choices=TARGETS, default=TARGETS)
+    run_parser.add_argument("--repeat", type=int, default=11, help="Repetições quentes por método")
+    run_parser.add_argument("--cold-samples", type=int, default=3, help="Instâncias novas para o tempo frio")
+    run_parser.add_argument("--processes", type=int, default=3, help="Rodadas, cada uma num processo novo")
+    run_parser.add_argument("--budget", type=float, default=2.0, help="Segundos por método antes de parar de repetir")
+    run_parser.add_argument("--no-alloc", action="store_true", help="Pula a passada com tracemalloc")
+    run_parser.add_argument("--data-dir", help="Reaproveita/guarda os dados gerados (uma subpasta por escala)")
+    run_parser.add_argument("--out", default="benchmark-results.json")
+
+    compare_parser = commands.add_parser("compare", help="Acusa regressões contra uma linha de base")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=1.0, help="Piora relativa tolerada")
+    compare_parser.add_argument("--min-delta-ms", type=float, default=1.0, help="Piso de ruído para tempos")
+    compare_parser.add_argument("--min-delta-bytes", type=int, default=4096, help="Piso de ruído para alocações")
+    compare_parser.add_argument("--all", action="store_true", help="Mostra também as métricas sem mudança")
+
+    target_parser = commands.add_parser("_target")  # Uso interno (subprocesso por classe)
+    target_parser.add_argument("directory")
+    target_parser.add_argument("records", type=int)
+    target_parser.add_argument("target", choices=TARGETS)
+    target_parser.add_argument("--repeat", type=int, default=11)
+    target_parser.add_argument("--cold-samples", type=int, default=3)
+    target_parser.add_argument("--budget", type=float, default=2.0)
+    target_parser.add_argument("--no-alloc", action="store_true")
+
+    args = parser.parse_args()
+
+    if args.command == "_target":
+        _run_target(args.directory, args.records, args.target, args.repeat, args.budget, not args.no_alloc,
+                    args.cold_samples)
+    elif args.command == "run":
+        report = run(args)
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"{len(report['results'])} resultados gravados em {args.out}", file=sys.stderr)
+    else:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        with open(args.current, encoding='utf-8') as f:
+            current = json.load(f)
+        rows = compare(baseline, current, args.threshold, args.min_delta_ms, args.min_delta_bytes)
+        _print_comparison(rows, args.all)
+        sys.exit(1 if any(row['status'] == 'REGRESSÃO' for row in rows) else 0)
+
+
+if __name__ == "__main__":
+    main()
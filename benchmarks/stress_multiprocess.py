@@ -0,0 +1,123 @@
+"""
+Teste de estresse multiprocesso dos repositórios em arquivo
+
+Vários processos gravam resultados no mesmo scoreboard.txt/history.txt
+ao mesmo tempo. Ao final confere que nenhuma atualização foi perdida
+(soma de vitórias + derrotas == partidas gravadas) e mede a vazão.
+
+As datas das partidas avançam ao longo da execução (MONTHS meses), então
+os processos viram o mês enquanto outros ainda gravam o anterior: o
+arquivamento em segmentos mensais e a recuperação pelo diário (.roll)
+são exercitados sob concorrência.
+
+Uso:
+    python benchmarks/stress_multiprocess.py [--processes 1 2 4 8] [--games 200]
+"""
+
+import argparse
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.storage import FilePlayerRepository, FileHistoryRepository
+from data.storage.history_segments import HistorySegments
+from domain.entities import GameHistory
+from domain.entities.game_history import DATE_FORMAT
+
+PLAYERS = ["Ana", "Bruno", "Carla", "Diego"]
+START = datetime(2025, 1, 1)
+MONTHS = 3
+
+
+def _worker(directory: str, worker_id: int, games: int, use_delta_log: bool):
+    players = FilePlayerRepository(
+        os.path.join(directory, "scoreboard.txt"), use_delta_log=use_delta_log
+    )
+    history = FileHistoryRepository(os.path.join(directory, "history.txt"))
+
+    for i in range(games):
+        # Todos os processos disputam os mesmos jogadores
+        name = PLAYERS[(worker_id + i) % len(PLAYERS)]
+        won = (worker_id + i) % 3 != 0
+        # A data acompanha o progresso do processo: cada um vira o mês no seu ritmo
+        date = START + timedelta(days=30 * MONTHS * i / games, seconds=worker_id)
+        history.save(GameHistory(
+            date=date.strftime(DATE_FORMAT),
+            player_name=name,
+            word="PYTHON",
+            result='WIN' if won else 'LOSS',
+            attempts_used=i % 7,
+            duration_seconds=i % 60
+        ))
+        players.save_game_result(name, won)
+
+
+def run(processes: int, games: int, use_delta_log: bool) -> dict:
+    directory = tempfile.mkdtemp(prefix="forca-stress-")
+    try:
+        # Cria os arquivos antes de iniciar os processos
+        FilePlayerRepository(os.path.join(directory, "scoreboard.txt"))
+        FileHistoryRepository(os.path.join(directory, "history.txt"))
+
+        workers = [
+            multiprocessing.Process(target=_worker, args=(directory, i, games, use_delta_log))
+            for i in range(processes)
+        ]
+
+        started = time.perf_counter()
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+        elapsed = time.perf_counter() - started
+
+        expected = processes * games
+        ranking = FilePlayerRepository(
+            os.path.join(directory, "scoreboard.txt"), use_delta_log=use_delta_log
+        ).get_ranking()
+        recorded = sum(p.total_games for p in ranking)
+        history = FileHistoryRepository(os.path.join(directory, "history.txt")).get_all()
+        archived = HistorySegments(os.path.join(directory, "history.txt")).months()
+
+        return {
+            'processes': processes,
+            'games': expected,
+            'seconds': elapsed,
+            'games_per_second': expected / elapsed if elapsed else 0.0,
+            'lost_scoreboard_updates': expected - recorded,
+            'lost_history_records': expected - len(history),
+            'archived_months': len(archived),
+        }
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Estresse multiprocesso do placar/histórico")
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--games", type=int, default=200, help="partidas por processo")
+    parser.add_argument("--delta-log", action="store_true", help="usa o log de deltas do placar")
+    args = parser.parse_args()
+
+    print(f"{'procs':>5} {'partidas':>9} {'tempo(s)':>9} {'partidas/s':>11} "
+          f"{'perdas placar':>14} {'perdas hist.':>13} {'meses arq.':>11}")
+
+    failed = False
+    for count in args.processes:
+        r = run(count, args.games, args.delta_log)
+        failed = failed or r['lost_scoreboard_updates'] or r['lost_history_records']
+        print(f"{r['processes']:>5} {r['games']:>9} {r['seconds']:>9.2f} "
+              f"{r['games_per_second']:>11.0f} {r['lost_scoreboard_updates']:>14} "
+              f"{r['lost_history_records']:>13} {r['archived_months']:>11}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,17 +8,39 @@ Exporta interfaces e implementações de repositórios
 from data.repositories.word_repository import IWordRepository
 from data.repositories.player_repository import IPlayerRepository
 from data.repositories.history_repository import IHistoryRepository
+from data.repositories.async_word_repository import IAsyncWordRepository
+from data.repositories.async_player_repository import IAsyncPlayerRepository
+from data.repositories.async_history_repository import IAsyncHistoryRepository
 
 # Implementações
 from data.storage.file_word_repository import FileWordRepository
 from data.storage.file_player_repository import FilePlayerRepository
 from data.storage.file_history_repository import FileHistoryRepository
+from data.storage.sqlite_database import SQLiteDatabase
+from data.storage.sqlite_word_repository import SQLiteWordRepository
+from data.storage.sqlite_player_repository import SQLitePlayerRepository
+from data.storage.sqlite_history_repository import SQLiteHistoryRepository
+from data.storage.binary_history_repository import BinaryHistoryRepository
+from data.storage.async_repositories import (
+    AsyncWordRepository, AsyncPlayerRepository, AsyncHistoryRepository
+)
 
 __all__ = [
     'IWordRepository',
     'IPlayerRepository',
     'IHistoryRepository',
+    'IAsyncWordRepository',
+    'IAsyncPlayerRepository',
+    'IAsyncHistoryRepository',
     'FileWordRepository',
     'FilePlayerRepository',
     'FileHistoryRepository',
+    'SQLiteDatabase',
+    'SQLiteWordRepository',
+    'SQLitePlayerRepository',
+    'SQLiteHistoryRepository',
+    'BinaryHistoryRepository',
+    'AsyncWordRepository',
+    'AsyncPlayerRepository',
+    'AsyncHistoryRepository',
 ]
\ No newline at end of file
@@ -5,11 +5,19 @@ Contém as interfaces (contratos) de repositórios
 """
 
 from data.repositories.word_repository import IWordRepository
-from data.repositories.player_repository import IPlayerRepository
-from data.repositories.history_repository import IHistoryRepository
+from data.repositories.player_repository import IPlayerRepository, PlayerRepositorySnapshot
+from data.repositories.history_repository import IHistoryRepository, HistoryRepositorySnapshot
+from data.repositories.async_word_repository import IAsyncWordRepository
+from data.repositories.async_player_repository import IAsyncPlayerRepository
+from data.repositories.async_history_repository import IAsyncHistoryRepository
 
 __all__ = [
     'IWordRepository',
     'IPlayerRepository',
     'IHistoryRepository',
+    'PlayerRepositorySnapshot',
+    'HistoryRepositorySnapshot',
+    'IAsyncWordRepository',
+    'IAsyncPlayerRepository',
+    'IAsyncHistoryRepository',
 ]
\ No newline at end of file
@@ -0,0 +1,111 @@
+"""
+Interface: IAsyncHistoryRepository
+Definir contrato assíncrono (asyncio) para repositório de histórico
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, List
+
+from domain.entities.game_history import GameHistory
+
+
+class IAsyncHistoryRepository(ABC):
+    """
+    Versão assíncrona de IHistoryRepository
+    Mesmas operações, como corrotinas que não bloqueiam o event loop
+    """
+    
+    @abstractmethod
+    async def get_all(self) -> List[GameHistory]:
+        """
+        Retorna todo o histórico de partidas
+        
+        Returns:
+            Lista de objetos GameHistory
+        """
+        pass
+    
+    @abstractmethod
+    async def save(self, history: GameHistory) -> bool:
+        """
+        Salva um registro de partida no histórico (append-only)
+        
+        Args:
+            history: Objeto GameHistory a ser salvo
+        
+        Returns:
+            True se salvo com sucesso, False caso contrário
+        """
+        pass
+    
+    async def save_many(self, histories: List[GameHistory]) -> bool:
+        """
+        Salva vários registros de partidas
+        Implementação padrão chama save para cada item
+        
+        Args:
+            histories: Lista de GameHistory a salvar
+        
+        Returns:
+            True se todos foram salvos, False caso contrário
+        """
+        ok = True
+        for history in histories:
+            ok = await self.save(history) and ok
+        return ok
+    
+    @abstractmethod
+    async def get_recent(self, limit: int) -> List[GameHistory]:
+        """
+        Retorna as partidas mais recentes
+        
+        Args:
+            limit: Número máximo de registros
+        
+        Returns:
+            Lista de GameHistory (mais recente primeiro)
+        """
+        pass
+    
+    @abstractmethod
+    async def get_by_player(self, player_name: str) -> List[GameHistory]:
+        """
+        Retorna as partidas de um jogador (case-insensitive)
+        
+        Args:
+            player_name: Nome do jogador
+        
+        Returns:
+            Lista de GameHistory na ordem em que foram salvas
+        """
+        pass
+    
+    @abstractmethod
+    async def get_between(self, start: datetime = None, end: datetime = None) -> List[GameHistory]:
+        """
+        Retorna as partidas com data em [start, end)
+        
+        Args:
+            start: Data inicial (inclusiva); None = sem limite
+            end: Data final (exclusiva); None = sem limite
+        
+        Returns:
+            Lista de GameHistory em ordem cronológica
+        """
+        pass
+    
+    @abstractmethod
+    async def get_summary(self, player_name: str = None) -> Dict[str, Any]:
+        """
+        Retorna agregados do histórico (geral ou de um jogador)
+        Mesmo formato de IHistoryRepository.get_summary
+        
+        Args:
+            player_name: Nome do jogador (None = todos)
+        
+        Returns:
+            Dicionário com total_games, wins, losses, attempts_sum,
+            duration_sum e best
+        """
+        pass
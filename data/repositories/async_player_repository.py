@@ -0,0 +1,117 @@
+"""
+Interface: IAsyncPlayerRepository
+Definir contrato assíncrono (asyncio) para repositório de jogadores
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+
+from domain.entities.player import Player
+
+
+class IAsyncPlayerRepository(ABC):
+    """
+    Versão assíncrona de IPlayerRepository
+    Mesmas operações, como corrotinas que não bloqueiam o event loop
+    """
+    
+    @abstractmethod
+    async def get_all(self) -> List[Player]:
+        """
+        Retorna todos os jogadores
+        
+        Returns:
+            Lista de objetos Player
+        """
+        pass
+    
+    @abstractmethod
+    async def get_by_name(self, name: str) -> Optional[Player]:
+        """
+        Busca jogador por nome (case-insensitive)
+        
+        Args:
+            name: Nome do jogador
+        
+        Returns:
+            Objeto Player se encontrado, None caso contrário
+        """
+        pass
+    
+    @abstractmethod
+    async def save(self, player: Player) -> bool:
+        """
+        Salva ou atualiza um jogador
+        
+        Args:
+            player: Objeto Player a ser salvo
+        
+        Returns:
+            True se salvo com sucesso, False caso contrário
+        """
+        pass
+    
+    @abstractmethod
+    async def save_game_result(self, player_name: str, won: bool) -> bool:
+        """
+        Salva resultado de uma partida para um jogador
+        
+        Args:
+            player_name: Nome do jogador
+            won: True se venceu, False se perdeu
+        
+        Returns:
+            True se salvo com sucesso, False caso contrário
+        """
+        pass
+    
+    async def save_game_results(self, results: List[Tuple[str, bool]]) -> bool:
+        """
+        Salva um lote de resultados de partidas
+        Implementação padrão chama save_game_result para cada item
+        
+        Args:
+            results: Lista de tuplas (nome do jogador, venceu)
+        
+        Returns:
+            True se todos foram salvos, False caso contrário
+        """
+        ok = True
+        for player_name, won in results:
+            ok = await self.save_game_result(player_name, won) and ok
+        return ok
+    
+    @abstractmethod
+    async def get_ranking(self, limit: Optional[int] = None) -> List[Player]:
+        """
+        Retorna jogadores ordenados por vitórias (ranking)
+        
+        Args:
+            limit: Número máximo de jogadores a retornar (None = todos)
+        
+        Returns:
+            Lista de Players ordenada por vitórias (decrescente)
+        """
+        pass
+    
+    async def get_rank(self, name: str) -> Optional[int]:
+        """
+        Retorna a posição do jogador no ranking (só jogadores com partidas)
+        Implementação padrão percorre get_ranking
+        
+        Args:
+            name: Nome do jogador (case-insensitive)
+        
+        Returns:
+            Posição no ranking (1-indexed), ou None se não encontrado
+            ou sem partidas
+        """
+        key = name.strip().casefold()
+        position = 0
+        for player in await self.get_ranking():
+            if player.total_games == 0:
+                continue
+            position += 1
+            if player.name.strip().casefold() == key:
+                return position
+        return None
@@ -0,0 +1,62 @@
+"""
+Interface: IAsyncWordRepository
+Definir contrato assíncrono (asyncio) para repositório de palavras
+"""
+
+import random
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+
+class IAsyncWordRepository(ABC):
+    """
+    Versão assíncrona de IWordRepository
+    Mesmas operações, como corrotinas que não bloqueiam o event loop
+    """
+    
+    @abstractmethod
+    async def get_all(self) -> List[str]:
+        """
+        Retorna todas as palavras disponíveis
+        
+        Returns:
+            Lista de palavras em maiúsculas
+        """
+        pass
+    
+    @abstractmethod
+    async def add_word(self, word: str) -> bool:
+        """
+        Adiciona uma nova palavra ao repositório
+        
+        Args:
+            word: Palavra a ser adicionada
+        
+        Returns:
+            True se adicionada com sucesso, False se já existe ou erro
+        """
+        pass
+    
+    async def random_word(self) -> Optional[str]:
+        """
+        Sorteia uma palavra do repositório
+        Implementação padrão usa get_all
+        
+        Returns:
+            Palavra em maiúsculas, ou None se o repositório estiver vazio
+        """
+        words = await self.get_all()
+        return random.choice(words) if words else None
+    
+    async def contains(self, word: str) -> bool:
+        """
+        Verifica se a palavra está no repositório (case-insensitive)
+        Implementação padrão usa get_all
+        
+        Args:
+            word: Palavra a verificar
+        
+        Returns:
+            True se a palavra existe, False caso contrário
+        """
+        return word.strip().upper() in await self.get_all()
@@ -3,10 +3,13 @@ Interface: IHistoryRepository
 Definir contrato para repositório de histórico
 """
 
+import threading
 from abc import ABC, abstractmethod
-from typing import List
+from datetime import datetime
+from typing import Any, Dict, Hashable, Iterator, List, Optional
 
-from domain.entities.game_history import GameHistory
+from domain.entities.game_history import GameHistory, to_epoch
+from domain.services.history_columns import HistoryColumns
 
 
 class IHistoryRepository(ABC):
@@ -15,6 +18,9 @@ class IHistoryRepository(ABC):
     Define operações para gerenciar registros de partidas
     """
     
+    # Snapshot devolvido por snapshot() enquanto data_version não mudar
+    _current_snapshot: Optional['HistoryRepositorySnapshot'] = None
+    
     @abstractmethod
     def get_all(self) -> List[GameHistory]:
         """
@@ -38,3 +44,252 @@ class IHistoryRepository(ABC):
             True se salvo com sucesso, False caso contrário
         """
         pass
+    
+    def save_many(self, histories: List[GameHistory]) -> bool:
+        """
+        Salva vários registros de partida
+        Implementação padrão chama save para cada item;
+        backends podem gravar o lote em uma única operação
+        
+        Args:
+            histories: Lista de GameHistory a serem salvos
+        
+        Returns:
+            True se todos foram salvos, False caso contrário
+        """
+        ok = True
+        for history in histories:
+            ok = self.save(history) and ok
+        return ok
+    
+    def get_recent(self, limit: int) -> List[GameHistory]:
+        """
+        Retorna as últimas partidas salvas
+        Implementação padrão usa get_all; backends podem ler só o final
+        
+        Args:
+            limit: Número máximo de partidas
+        
+        Returns:
+            Lista de GameHistory, da mais recente para a mais antiga
+        """
+        if limit <= 0:
+            return []
+        return list(reversed(self.get_all()[-limit:]))
+    
+    def get_by_player(self, player_name: str) -> List[GameHistory]:
+        """
+        Retorna as partidas de um jogador (case-insensitive)
+        Implementação padrão filtra get_all; backends podem otimizar
+        
+        Args:
+            player_name: Nome do jogador
+        
+        Returns:
+            Lista de GameHistory do jogador, na ordem em que foram salvas
+        """
+        key = player_name.casefold()
+        return [h for h in self.get_all() if h.player_name.casefold() == key]
+    
+    def get_between(self, start: datetime = None, end: datetime = None) -> List[GameHistory]:
+        """
+        Retorna as partidas com data no intervalo [start, end)
+        Implementação padrão faz busca binária na coluna de datas de
+        get_columns; backends podem usar um índice de tempo próprio
+        
+        Args:
+            start: Início do intervalo, inclusivo (None = sem limite)
+            end: Fim do intervalo, exclusivo (None = sem limite)
+        
+        Returns:
+            Lista de GameHistory em ordem cronológica
+        """
+        columns = self.get_columns()
+        return columns.rows(columns.between(
+            to_epoch(start) if start is not None else None,
+            to_epoch(end) if end is not None else None
+        ))
+    
+    def get_summary(self, player_name: str = None) -> Dict[str, Any]:
+        """
+        Retorna agregados do histórico (geral ou de um jogador)
+        
+        Args:
+            player_name: Nome do jogador (None = todos)
+        
+        Returns:
+            Dicionário com agregados brutos:
+            {
+                'total_games': int,
+                'wins': int,
+                'losses': int,
+                'attempts_sum': int,
+                'duration_sum': int,
+                'best': Optional[GameHistory]  # vitória com menos tentativas
+            }
+        """
+        games = self.get_by_player(player_name) if player_name else self.get_all()
+        
+        summary = {
+            'total_games': 0,
+            'wins': 0,
+            'losses': 0,
+            'attempts_sum': 0,
+            'duration_sum': 0,
+            'best': None
+        }
+        
+        for game in games:
+            summary['total_games'] += 1
+            summary['attempts_sum'] += game.attempts_used
+            summary['duration_sum'] += game.duration_seconds
+            
+            if game.result == 'WIN':
+                summary['wins'] += 1
+                best = summary['best']
+                if best is None or game.attempts_used < best.attempts_used:
+                    summary['best'] = game
+            elif game.result == 'LOSS':
+                summary['losses'] += 1
+        
+        return summary
+    
+    def iter_records(self) -> Iterator[GameHistory]:
+        """
+        Gera as partidas sob demanda, na ordem em que foram salvas
+        Implementação padrão percorre get_all; backends podem ler em
+        streaming sem montar a lista inteira
+        
+        Returns:
+            Iterador de GameHistory
+        """
+        return iter(self.get_all())
+    
+    def get_columns(self) -> HistoryColumns:
+        """
+        Retorna o histórico em formato colunar (agregações vetorizadas)
+        Implementação padrão monta as colunas a partir de get_all;
+        backends podem mantê-las em memória e atualizá-las incrementalmente
+        
+        Returns:
+            HistoryColumns com todas as partidas, na ordem em que foram salvas
+        """
+        return HistoryColumns.from_histories(self.get_all())
+    
+    def data_version(self) -> Optional[Hashable]:
+        """
+        Identifica o estado atual dos dados; muda a cada escrita
+        Usado para reaproveitar snapshots. Implementação padrão devolve
+        None (versão desconhecida: o snapshot não é reaproveitado)
+        
+        Returns:
+            Valor comparável entre chamadas, ou None
+        """
+        return None
+    
+    def snapshot(self) -> 'HistoryRepositorySnapshot':
+        """
+        Leitura consistente do histórico para uma tela (unit of work)
+        Consultas repetidas no snapshot são respondidas sem nova leitura.
+        O mesmo snapshot é devolvido enquanto data_version não mudar,
+        ou seja, até a próxima escrita
+        
+        Returns:
+            HistoryRepositorySnapshot sobre este repositório
+        """
+        current = self._current_snapshot
+        if current is None or not current.is_current():
+            current = self._current_snapshot = HistoryRepositorySnapshot(self)
+        return current
+
+
+class HistoryRepositorySnapshot(IHistoryRepository):
+    """
+    Snapshot de um IHistoryRepository
+    
+    O histórico pode ser grande demais para carregar inteiro a cada tela,
+    então o snapshot guarda o resultado de cada consulta feita (por
+    método e argumentos) em vez de chamar get_all. Com get_all já
+    carregado, as partidas recentes e as de um jogador saem da lista em
+    memória. Escritas são repassadas ao repositório e descartam os
+    resultados; repository_calls conta as consultas repassadas ao
+    repositório (cada uma pode ser uma carga completa ou um agregado O(1)).
+    
+    Cada snapshot guarda no máximo MAX_RESULTS consultas distintas; ao
+    passar disso a mais antiga é descartada e volta a ser lida se pedida.
+    """
+    
+    MAX_RESULTS = 32
+    
+    def __init__(self, repository: IHistoryRepository):
+        self.repository = repository
+        self.repository_calls = 0
+        self._lock = threading.RLock()
+        self._version: Optional[Hashable] = None
+        self._results: Dict[tuple, Any] = {}
+    
+    def is_current(self) -> bool:
+        """True se os resultados ainda refletem o repositório (ou nada foi lido)"""
+        if not self._results:
+            return True
+        return self._version is not None and self._version == self.repository.data_version()
+    
+    def snapshot(self) -> 'HistoryRepositorySnapshot':
+        return self
+    
+    def get_all(self) -> List[GameHistory]:
+        return list(self._query('get_all'))
+    
+    def get_recent(self, limit: int) -> List[GameHistory]:
+        if limit <= 0:
+            return []
+        games = self._loaded('get_all')
+        if games is not None:
+            return games[:-limit - 1:-1]
+        return list(self._query('get_recent', limit))
+    
+    def get_by_player(self, player_name: str) -> List[GameHistory]:
+        games = self._loaded('get_all')
+        if games is not None:
+            key = player_name.strip().casefold()
+            return [h for h in games if h.player_name.strip().casefold() == key]
+        return list(self._query('get_by_player', player_name.strip().casefold()))
+    
+    def get_between(self, start: datetime = None, end: datetime = None) -> List[GameHistory]:
+        return list(self._query('get_between', start, end))
+    
+    def get_summary(self, player_name: str = None) -> Dict[str, Any]:
+        key = player_name.strip().casefold() if player_name else None
+        return dict(self._query('get_summary', key))
+    
+    def get_columns(self) -> HistoryColumns:
+        return self._query('get_columns')
+    
+    def save(self, history: GameHistory) -> bool:
+        return self._write(self.repository.save(history))
+    
+    def save_many(self, histories: List[GameHistory]) -> bool:
+        return self._write(self.repository.save_many(histories))
+    
+    def _query(self, method: str, *args):
+        #Resultado guardado por (método, argumentos); só a primeira chamada lê o repositório
+        with self._lock:
+            key = (method,) + args
+            if key not in self._results:
+                if not self._results:
+                    # Versão lida antes dos dados: escrita concorrente invalida o snapshot
+                    self._version = self.repository.data_version()
+                elif len(self._results) >= self.MAX_RESULTS:
+                    del self._results[next(iter(self._results))]
+                self._results[key] = getattr(self.repository, method)(*args)
+                self.repository_calls += 1
+            return self._results[key]
+    
+    def _loaded(self, method: str, *args):
+        with self._lock:
+            return self._results.get((method,) + args)
+    
+    def _write(self, ok: bool) -> bool:
+        with self._lock:
+            self._results = {}
+        return ok
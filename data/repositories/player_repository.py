@@ -3,8 +3,9 @@ Interface: IPlayerRepository
 Definir contrato para repositório de jogadores
 """
 
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Hashable, List, Optional, Tuple
 
 from domain.entities.player import Player
 
@@ -15,6 +16,9 @@ class IPlayerRepository(ABC):
     Define operações CRUD para gerenciar jogadores
     """
     
+    # Snapshot devolvido por snapshot() enquanto data_version não mudar
+    _current_snapshot: Optional['PlayerRepositorySnapshot'] = None
+    
     @abstractmethod
     def get_all(self) -> List[Player]:
         """
@@ -67,6 +71,23 @@ class IPlayerRepository(ABC):
         """
         pass
     
+    def save_game_results(self, results: List[Tuple[str, bool]]) -> bool:
+        """
+        Salva um lote de resultados de partidas
+        Implementação padrão chama save_game_result para cada item;
+        backends podem gravar o lote em uma única operação
+        
+        Args:
+            results: Lista de tuplas (nome do jogador, venceu)
+        
+        Returns:
+            True se todos foram salvos, False caso contrário
+        """
+        ok = True
+        for player_name, won in results:
+            ok = self.save_game_result(player_name, won) and ok
+        return ok
+    
     @abstractmethod
     def get_ranking(self, limit: Optional[int] = None) -> List[Player]:
         """
@@ -79,3 +100,129 @@ class IPlayerRepository(ABC):
             Lista de Players ordenada por vitórias (decrescente)
         """
         pass
+    
+    def get_rank(self, name: str) -> Optional[int]:
+        """
+        Retorna a posição do jogador no ranking (só jogadores com partidas)
+        Implementação padrão percorre get_ranking; backends com ranking
+        ordenado respondem sem montar a lista inteira
+        
+        Args:
+            name: Nome do jogador (case-insensitive)
+        
+        Returns:
+            Posição no ranking (1-indexed), ou None se não encontrado
+            ou sem partidas
+        """
+        key = name.strip().casefold()
+        position = 0
+        for player in self.get_ranking():
+            if player.total_games == 0:
+                continue
+            position += 1
+            if player.name.strip().casefold() == key:
+                return position
+        return None
+    
+    def data_version(self) -> Optional[Hashable]:
+        """
+        Identifica o estado atual dos dados; muda a cada escrita
+        Usado para reaproveitar snapshots. Implementação padrão devolve
+        None (versão desconhecida: o snapshot não é reaproveitado)
+        
+        Returns:
+            Valor comparável entre chamadas, ou None
+        """
+        return None
+    
+    def snapshot(self) -> 'PlayerRepositorySnapshot':
+        """
+        Leitura consistente do placar para uma tela (unit of work)
+        Todas as consultas feitas no snapshot compartilham uma única carga
+        dos jogadores. O mesmo snapshot é devolvido enquanto data_version
+        não mudar, ou seja, até a próxima escrita
+        
+        Returns:
+            PlayerRepositorySnapshot sobre este repositório
+        """
+        current = self._current_snapshot
+        if current is None or not current.is_current():
+            current = self._current_snapshot = PlayerRepositorySnapshot(self)
+        return current
+
+
+class PlayerRepositorySnapshot(IPlayerRepository):
+    """
+    Snapshot em memória de um IPlayerRepository
+    
+    Carrega todos os jogadores uma única vez (get_all) na primeira
+    consulta e responde às demais (busca, ranking, posição) a partir
+    dessa carga. Escritas são repassadas ao repositório e descartam a
+    carga; read_count conta as leituras repassadas ao repositório.
+    """
+    
+    def __init__(self, repository: IPlayerRepository):
+        self.repository = repository
+        self.read_count = 0
+        self._lock = threading.RLock()
+        self._version: Optional[Hashable] = None
+        self._players: Optional[Dict[str, Player]] = None
+        self._ranking: List[Player] = []
+        self._ranks: Dict[str, int] = {}
+    
+    def is_current(self) -> bool:
+        """True se a carga ainda reflete o repositório (ou nada foi carregado)"""
+        if self._players is None:
+            return True
+        return self._version is not None and self._version == self.repository.data_version()
+    
+    def snapshot(self) -> 'PlayerRepositorySnapshot':
+        return self
+    
+    def get_all(self) -> List[Player]:
+        return [self._copy(p) for p in self._load().values()]
+    
+    def get_by_name(self, name: str) -> Optional[Player]:
+        player = self._load().get(name.strip().casefold())
+        return self._copy(player) if player else None
+    
+    def get_ranking(self, limit: Optional[int] = None) -> List[Player]:
+        self._load()
+        selected = self._ranking[:limit] if limit else self._ranking
+        return [self._copy(p) for p in selected]
+    
+    def get_rank(self, name: str) -> Optional[int]:
+        self._load()
+        return self._ranks.get(name.strip().casefold())
+    
+    def save(self, player: Player) -> bool:
+        return self._write(self.repository.save(player))
+    
+    def save_game_result(self, player_name: str, won: bool) -> bool:
+        return self._write(self.repository.save_game_result(player_name, won))
+    
+    def save_game_results(self, results: List[Tuple[str, bool]]) -> bool:
+        return self._write(self.repository.save_game_results(results))
+    
+    def _load(self) -> Dict[str, Player]:
+        with self._lock:
+            if self._players is None:
+                # Versão lida antes dos dados: escrita concorrente invalida o snapshot
+                self._version = self.repository.data_version()
+                players = self.repository.get_all()
+                self.read_count += 1
+                
+                self._ranking = sorted(players, key=Player.ranking_key)
+                active = [p for p in self._ranking if p.total_games > 0]
+                self._ranks = {p.name.strip().casefold(): i for i, p in enumerate(active, start=1)}
+                self._players = {p.name.strip().casefold(): p for p in players}
+            return self._players
+    
+    def _write(self, ok: bool) -> bool:
+        with self._lock:
+            self._players = None
+        return ok
+    
+    @staticmethod
+    def _copy(player: Player) -> Player:
+        return Player(name=player.name, wins=player.wins, losses=player.losses)
@@ -3,8 +3,9 @@ Interface: IWordRepository
 Definir contrato para repositório de palavras
 """
 
+import random
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 
 
 class IWordRepository(ABC):
@@ -35,4 +36,28 @@ class IWordRepository(ABC):
             True se adicionada com sucesso, False se já existe ou erro
         """
         pass
-    
\ No newline at end of file
+    
+    def random_word(self) -> Optional[str]:
+        """
+        Sorteia uma palavra do repositório
+        Implementação padrão usa get_all; backends podem sortear sem
+        materializar a lista inteira
+        
+        Returns:
+            Palavra em maiúsculas, ou None se o repositório estiver vazio
+        """
+        words = self.get_all()
+        return random.choice(words) if words else None
+    
+    def contains(self, word: str) -> bool:
+        """
+        Verifica se a palavra está no repositório (case-insensitive)
+        Implementação padrão usa get_all; backends podem usar índices
+        
+        Args:
+            word: Palavra a verificar
+        
+        Returns:
+            True se a palavra existe, False caso contrário
+        """
+        return word.strip().upper() in self.get_all()
@@ -7,9 +7,27 @@ Contém implementações concretas de repositórios
 from data.storage.file_word_repository import FileWordRepository
 from data.storage.file_player_repository import FilePlayerRepository
 from data.storage.file_history_repository import FileHistoryRepository
+from data.storage.sqlite_database import SQLiteDatabase
+from data.storage.sqlite_word_repository import SQLiteWordRepository
+from data.storage.sqlite_player_repository import SQLitePlayerRepository
+from data.storage.sqlite_history_repository import SQLiteHistoryRepository
+from data.storage.binary_history_repository import BinaryHistoryRepository
+from data.storage.async_repositories import (
+    AsyncWordRepository, AsyncPlayerRepository, AsyncHistoryRepository
+)
+from data.storage.repository_factory import create_repositories
 
 __all__ = [
     'FileWordRepository',
     'FilePlayerRepository',
     'FileHistoryRepository',
+    'SQLiteDatabase',
+    'SQLiteWordRepository',
+    'SQLitePlayerRepository',
+    'SQLiteHistoryRepository',
+    'BinaryHistoryRepository',
+    'AsyncWordRepository',
+    'AsyncPlayerRepository',
+    'AsyncHistoryRepository',
+    'create_repositories',
 ]
\ No newline at end of file
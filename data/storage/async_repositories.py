@@ -0,0 +1,114 @@
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from domain.entities import GameHistory, Player
+from domain.services.async_executor import AsyncExecutor
+from data.repositories import (
+    IWordRepository, IPlayerRepository, IHistoryRepository,
+    IAsyncWordRepository, IAsyncPlayerRepository, IAsyncHistoryRepository
+)
+from data.storage.file_word_repository import FileWordRepository
+from data.storage.file_player_repository import FilePlayerRepository
+from data.storage.file_history_repository import FileHistoryRepository
+
+class _ExecutorBacked:
+    """
+    Base dos repositórios assíncronos sobre um repositório síncrono
+
+    Cada operação roda no pool limitado do AsyncExecutor (compartilhável
+    entre repositórios). Leituras concorrentes com os mesmos argumentos
+    são coalescidas; escritas invalidam as leituras em andamento para
+    que chamadas posteriores vejam o dado gravado.
+    """
+
+    def __init__(self, repository, executor: Optional[AsyncExecutor] = None):
+        self.repository = repository
+        self.executor = executor or AsyncExecutor()
+
+    async def _read(self, method: str, *args):
+        return await self.executor.read((id(self), method) + args,
+                                        getattr(self.repository, method), *args)
+
+    async def _write(self, method: str, *args):
+        try:
+            return await self.executor.run(getattr(self.repository, method), *args)
+        finally:
+            self.executor.invalidate()
+
+class AsyncWordRepository(_ExecutorBacked, IAsyncWordRepository):
+    """Palavras (arquivo por padrão) com I/O fora do event loop"""
+
+    def __init__(self, repository: IWordRepository = None, executor: Optional[AsyncExecutor] = None):
+        repository = repository if repository is not None else FileWordRepository()
+        super().__init__(repository, executor)
+
+    async def get_all(self) -> List[str]:
+        return await self._read('get_all')
+
+    async def add_word(self, word: str) -> bool:
+        return await self._write('add_word', word)
+
+    async def random_word(self) -> Optional[str]:
+        # Sorteios não são coalescidos: cada chamada quer uma palavra própria
+        return await self.executor.run(self.repository.random_word)
+
+    async def contains(self, word: str) -> bool:
+        return await self._read('contains', word.strip().upper())
+
+class AsyncPlayerRepository(_ExecutorBacked, IAsyncPlayerRepository):
+    """Jogadores (arquivo por padrão) com I/O fora do event loop"""
+
+    def __init__(self, repository: IPlayerRepository = None, executor: Optional[AsyncExecutor] = None):
+        repository = repository if repository is not None else FilePlayerRepository()
+        super().__init__(repository, executor)
+
+    async def get_all(self) -> List[Player]:
+        return await self._read('get_all')
+
+    async def get_by_name(self, name: str) -> Optional[Player]:
+        return await self._read('get_by_name', name.strip().casefold())
+
+    async def save(self, player: Player) -> bool:
+        return await self._write('save', player)
+
+    async def save_game_result(self, player_name: str, won: bool) -> bool:
+        return await self._write('save_game_result', player_name, won)
+
+    async def save_game_results(self, results: List[Tuple[str, bool]]) -> bool:
+        return await self._write('save_game_results', results)
+
+    async def get_ranking(self, limit: Optional[int] = None) -> List[Player]:
+        return await self._read('get_ranking', limit)
+
+    async def get_rank(self, name: str) -> Optional[int]:
+        return await self._read('get_rank', name.strip().casefold())
+
+class AsyncHistoryRepository(_ExecutorBacked, IAsyncHistoryRepository):
+    """Histórico (arquivo por padrão) com I/O fora do event loop"""
+
+    def __init__(self, repository: IHistoryRepository = None, executor: Optional[AsyncExecutor] = None):
+        repository = repository if repository is not None else FileHistoryRepository()
+        super().__init__(repository, executor)
+
+    async def get_all(self) -> List[GameHistory]:
+        return await self._read('get_all')
+
+    async def save(self, history: GameHistory) -> bool:
+        return await self._write('save', history)
+
+    async def save_many(self, histories: List[GameHistory]) -> bool:
+        return await self._write('save_many', histories)
+
+    async def get_recent(self, limit: int) -> List[GameHistory]:
+        return await self._read('get_recent', limit)
+
+    async def get_by_player(self, player_name: str) -> List[GameHistory]:
+        return await self._read('get_by_player', player_name.strip().casefold())
+
+    async def get_between(self, start: datetime = None, end: datetime = None) -> List[GameHistory]:
+        return await self._read('get_between', start, end)
+
+    async def get_summary(self, player_name: str = None) -> Dict[str, Any]:
+        key = player_name.strip().casefold() if player_name else None
+        summary = await self._read('get_summary', key)
+        return dict(summary)
@@ -0,0 +1,123 @@
+"""
+Conversão sem perdas entre o histórico texto e o formato binário
+
+Os arquivos são processados em streaming, em lotes de chunk_size
+registros, incluindo os segmentos mensais arquivados do histórico texto.
+Linhas que o formato binário não representa (resultado diferente de
+WIN/LOSS, data fora do padrão) são contadas e ignoradas.
+
+A volta gera um único history.txt; o repositório em arquivo o divide
+de novo em segmentos mensais ao ser aberto.
+
+Uso:
+    python -m data.storage.binary_history_convert to-binary assets/history.txt assets/history.bin
+    python -m data.storage.binary_history_convert to-text assets/history.bin assets/history.txt
+"""
+
+import argparse
+import os
+from typing import Dict, Iterator
+
+from domain.entities import GameHistory
+from data.storage.binary_history_repository import BinaryHistoryRepository
+from data.storage.file_lock import atomic_write
+from data.storage.history_segments import HistorySegments
+from data.storage.text_streams import chunks, history_lines
+
+TEXT_HEADER = "# Histórico - Formato: data|jogador|palavra|resultado|tentativas|duracao\n"
+
+
+def _remove_binary(path: str):
+    #Remove o arquivo binário e suas tabelas de strings
+    for suffix in ("", ".players", ".words"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+
+def _parse_lines(text_path: str, counts: Dict[str, int]) -> Iterator[GameHistory]:
+    for line in history_lines(text_path):
+        try:
+            history = GameHistory.from_file_format(line)
+        except Exception:
+            counts['skipped'] += 1
+            continue
+
+        if history.result not in BinaryHistoryRepository.RESULTS:
+            counts['skipped'] += 1
+            continue
+        yield history
+
+
+def text_to_binary(text_path: str, binary_path: str, chunk_size: int = 10000) -> Dict[str, int]:
+    """
+    Converte history.txt para o formato binário (substitui o destino)
+
+    Args:
+        text_path: Histórico texto de origem
+        binary_path: Arquivo binário de destino
+        chunk_size: Registros por escrita
+
+    Returns:
+        Dicionário com registros convertidos e linhas ignoradas
+    """
+    counts = {'converted': 0, 'skipped': 0}
+    _remove_binary(binary_path)
+    repository = BinaryHistoryRepository(binary_path)
+
+    for chunk in chunks(_parse_lines(text_path, counts), chunk_size):
+        try:
+            if not repository.save_many(chunk):
+                counts['skipped'] += len(chunk)
+                continue
+        except Exception:
+            counts['skipped'] += len(chunk)
+            continue
+        counts['converted'] += len(chunk)
+
+    return counts
+
+
+def binary_to_text(binary_path: str, text_path: str) -> Dict[str, int]:
+    """
+    Converte o formato binário de volta para history.txt (escrita atômica)
+
+    Args:
+        binary_path: Arquivo binário de origem
+        text_path: Histórico texto de destino
+
+    Returns:
+        Dicionário com a quantidade de registros convertidos
+    """
+    if HistorySegments(text_path).months():
+        raise ValueError(f"O destino já possui segmentos arquivados: {text_path}")
+
+    repository = BinaryHistoryRepository(binary_path)
+    converted = 0
+
+    with atomic_write(text_path, 'w', encoding='utf-8') as f:
+        f.write(TEXT_HEADER)
+        for history in repository.iter_records():
+            f.write(history.to_file_format() + "\n")
+            converted += 1
+
+    return {'converted': converted, 'skipped': 0}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Converte o histórico entre texto e binário")
+    parser.add_argument("direction", choices=["to-binary", "to-text"])
+    parser.add_argument("source", help="arquivo de origem")
+    parser.add_argument("target", help="arquivo de destino")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="registros por escrita")
+    args = parser.parse_args()
+
+    if args.direction == "to-binary":
+        counts = text_to_binary(args.source, args.target, args.chunk_size)
+    else:
+        counts = binary_to_text(args.source, args.target)
+
+    print(f"{counts['converted']} registros convertidos, {counts['skipped']} ignorados")
+
+
+if __name__ == "__main__":
+    main()
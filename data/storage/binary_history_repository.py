@@ -0,0 +1,266 @@
+
+import os
+import struct
+import sys
+import threading
+from typing import Any, Dict, Iterator, List
+
+from domain.entities import GameHistory
+from domain.entities.game_history import DATE_FORMAT, date_to_epoch, from_epoch
+from domain.services.history_columns import HistoryColumns
+from data.repositories import IHistoryRepository
+from data.storage.file_lock import InterProcessLock, append_all
+
+
+class StringTable:
+    """
+    Tabela de strings internadas persistida em arquivo (uma por linha)
+
+    O id de cada string é a sua linha; novas strings são apenas anexadas.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._values: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._covered = 0
+
+    def sync(self):
+        """Lê entradas anexadas por outros processos"""
+        if not os.path.exists(self.path):
+            return
+
+        if os.path.getsize(self.path) < self._covered:
+            # Tabela recriada: descarta (em place, a lista pode estar compartilhada)
+            del self._values[:]
+            self._ids.clear()
+            self._covered = 0
+
+        with open(self.path, 'rb') as f:
+            f.seek(self._covered)
+            for raw in f:
+                if not raw.endswith(b'\n'):
+                    break
+                self._add(raw[:-1].decode('utf-8'))
+                self._covered += len(raw)
+
+    def get(self, value_id: int) -> str:
+        return self._values[value_id]
+
+    def intern(self, value: str) -> int:
+        """Retorna o id da string, gravando-a se for nova"""
+        value_id = self._ids.get(value)
+        if value_id is not None:
+            return value_id
+
+        data = (value + '\n').encode('utf-8')
+        with open(self.path, 'ab') as f:
+            f.write(data)
+        self._covered += len(data)
+        return self._add(value)
+
+    @property
+    def values(self) -> List[str]:
+        """Lista das strings por id (somente leitura)"""
+        return self._values
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def _add(self, value: str) -> int:
+        value = sys.intern(value)
+        self._ids[value] = len(self._values)
+        self._values.append(value)
+        return self._ids[value]
+
+
+class BinaryHistoryRepository(IHistoryRepository):
+    """
+    Repositório de histórico em formato binário compacto
+
+    Cada partida é um registro de largura fixa (struct) com a data em
+    segundos, ids de jogador/palavra, resultado, tentativas e duração.
+    Nomes e palavras ficam uma única vez em tabelas internadas
+    (`<arquivo>.players` e `<arquivo>.words`). Objetos GameHistory só são
+    criados quando solicitados (iter_records); agregados e filtros por
+    jogador usam uma visão colunar mantida em memória e completada apenas
+    com os registros novos.
+    """
+
+    MAGIC = b'FHB1'
+    RECORD = struct.Struct('<qIIBHI')  # epoch, jogador, palavra, vitória, tentativas, duração
+    RESULTS = ('LOSS', 'WIN')
+    READ_CHUNK_RECORDS = 4096
+
+    def __init__(self, file_path: str = "assets/history.bin"):
+        self.file_path = file_path
+        self.players = StringTable(f"{file_path}.players")
+        self.words = StringTable(f"{file_path}.words")
+        self._lock = threading.RLock()
+        self._file_lock = InterProcessLock(file_path)
+        self._columns = HistoryColumns(self.players.values, self.words.values)
+        self._ensure_file_exists()
+
+    def _ensure_file_exists(self):
+        #Cria o arquivo com o cabeçalho se não existir
+        directory = os.path.dirname(self.file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        if not os.path.exists(self.file_path):
+            with open(self.file_path, 'wb') as f:
+                f.write(self.MAGIC)
+
+    # ==================== IHistoryRepository ====================
+
+    def get_all(self) -> List[GameHistory]:
+        #Materializa todo o histórico
+        try:
+            return list(self.iter_records())
+        except Exception as e:
+            print(f"Erro ao ler histórico: {e}")
+            return []
+
+    def save(self, history: GameHistory) -> bool:
+        #Adiciona um registro
+        return self.save_many([history])
+
+    def save_many(self, histories: List[GameHistory]) -> bool:
+        #Adiciona vários registros em uma única escrita
+        try:
+            with self._lock, self._file_lock.exclusive():
+                self._sync_tables()
+                data = b''.join(self._pack(h) for h in histories)
+                # Falha na escrita não deixa registros: repetir o lote é seguro
+                append_all(self.file_path, data)
+            return True
+        except Exception as e:
+            print(f"Erro ao salvar histórico: {e}")
+            return False
+
+    def get_recent(self, limit: int) -> List[GameHistory]:
+        #Registros de largura fixa: os últimos são lidos diretamente
+        if limit <= 0:
+            return []
+
+        try:
+            with self._lock, self._file_lock.shared():
+                self._sync_tables()
+                size = self._record_count()
+                count = min(limit, size)
+
+                with open(self.file_path, 'rb') as f:
+                    f.seek(len(self.MAGIC) + (size - count) * self.RECORD.size)
+                    data = f.read(count * self.RECORD.size)
+
+                records = [self._unpack(r) for r in self.RECORD.iter_unpack(data)]
+            return list(reversed(records))
+        except Exception as e:
+            print(f"Erro ao ler histórico: {e}")
+            return []
+
+    def get_by_player(self, player_name: str) -> List[GameHistory]:
+        #Filtra pela coluna de jogadores antes de criar objetos
+        try:
+            with self._lock:
+                columns = self.get_columns()
+                return columns.rows(columns.filter(player_name))
+        except Exception as e:
+            print(f"Erro ao ler histórico: {e}")
+            return []
+
+    def get_summary(self, player_name: str = None) -> Dict[str, Any]:
+        #Agregados calculados sobre as colunas
+        try:
+            with self._lock:
+                return self.get_columns().summary(player_name)
+        except Exception as e:
+            print(f"Erro ao ler histórico: {e}")
+            return super().get_summary(player_name)
+
+    def get_columns(self) -> HistoryColumns:
+        #Completa a visão colunar com os registros gravados desde a última leitura
+        with self._lock, self._file_lock.shared():
+            self._sync_tables()
+            count = self._record_count()
+            loaded = len(self._columns)
+
+            if count < loaded:
+                # Arquivo substituído (ex.: nova conversão): recarrega tudo
+                self._columns = HistoryColumns(self.players.values, self.words.values)
+                loaded = 0
+
+            if count > loaded:
+                self._columns.extend_raw(self._iter_raw(count, start=loaded))
+
+            return self._columns
+
+    def data_version(self) -> tuple:
+        #Arquivo append-only: tamanho e inode mudam a cada escrita ou conversão
+        st = os.stat(self.file_path)
+        return st.st_ino, st.st_size, st.st_mtime_ns
+
+    # ==================== Leitura preguiçosa ====================
+
+    def iter_records(self) -> Iterator[GameHistory]:
+        """Gera GameHistory sob demanda, na ordem de gravação"""
+        with self._lock, self._file_lock.shared():
+            self._sync_tables()
+            count = self._record_count()
+
+        # Registros anexados depois do sync podem citar ids ainda não lidos
+        for raw in self._iter_raw(count):
+            yield self._unpack(raw)
+
+    def _iter_raw(self, count: int = None, start: int = 0) -> Iterator[tuple]:
+        #Tuplas cruas (epoch, jogador, palavra, vitória, tentativas, duração)
+        if count is None:
+            count = self._record_count()
+        count -= start
+
+        with open(self.file_path, 'rb') as f:
+            if f.read(len(self.MAGIC)) != self.MAGIC:
+                raise ValueError(f"Arquivo de histórico binário inválido: {self.file_path}")
+            f.seek(start * self.RECORD.size, os.SEEK_CUR)
+
+            while count > 0:
+                batch = min(count, self.READ_CHUNK_RECORDS)
+                data = f.read(batch * self.RECORD.size)
+                usable = len(data) - len(data) % self.RECORD.size
+                if not usable:
+                    return
+                yield from self.RECORD.iter_unpack(data[:usable])
+                count -= usable // self.RECORD.size
+
+    def _record_count(self) -> int:
+        return (os.path.getsize(self.file_path) - len(self.MAGIC)) // self.RECORD.size
+
+    def _sync_tables(self):
+        self.players.sync()
+        self.words.sync()
+
+    def _pack(self, history: GameHistory) -> bytes:
+        if history.result not in self.RESULTS:
+            raise ValueError(f"Resultado não suportado no formato binário: {history.result}")
+
+        return self.RECORD.pack(
+            date_to_epoch(history.date),
+            self.players.intern(history.player_name),
+            self.words.intern(history.word),
+            self.RESULTS.index(history.result),
+            history.attempts_used,
+            history.duration_seconds
+        )
+
+    def _unpack(self, raw: tuple) -> GameHistory:
+        epoch, player_id, word_id, won, attempts, duration = raw
+        timestamp = from_epoch(epoch)
+        return GameHistory(
+            date=timestamp.strftime(DATE_FORMAT),
+            player_name=self.players.get(player_id),
+            word=self.words.get(word_id),
+            result=self.RESULTS[won],
+            attempts_used=attempts,
+            duration_seconds=duration,
+            timestamp=timestamp
+        )
@@ -0,0 +1,83 @@
+
+import hashlib
+import math
+import struct
+from typing import Optional, Tuple
+from data.storage.file_lock import atomic_write
+
+class BloomFilter:
+    """
+    Filtro de Bloom persistível (pertinência aproximada em O(k))
+
+    Sem falsos negativos; a taxa de falsos positivos é definida na criação.
+    O arquivo guarda um cabeçalho com os parâmetros e a "origem" (inode e
+    bytes do arquivo de palavras já incluídos), permitindo atualizar o
+    filtro apenas com o final do arquivo de origem.
+    """
+
+    MAGIC = b'FBLM'
+    _HEADER = struct.Struct('<4sQIQQQQ')  # magic, bits, hashes, capacidade, count, ino, coberto
+
+    def __init__(self, capacity: int = 100000, error_rate: float = 0.001):
+        capacity = max(capacity, 1)
+        self.capacity = capacity
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+        self.source: Tuple[int, int] = (0, 0)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1, h2 = struct.unpack('<QQ', digest)
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item: str):
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def is_saturated(self) -> bool:
+        """Indica se já recebeu mais itens que a capacidade planejada"""
+        return self.count > self.capacity
+
+    def save(self, path: str):
+        """Grava o filtro (troca atômica)"""
+        with atomic_write(path) as f:
+            f.write(self._HEADER.pack(self.MAGIC, self.num_bits, self.num_hashes,
+                                      self.capacity, self.count, *self.source))
+            f.write(self.bits)
+
+    @classmethod
+    def load(cls, path: str) -> Optional['BloomFilter']:
+        """Carrega um filtro salvo; None se ausente ou corrompido"""
+        try:
+            with open(path, 'rb') as f:
+                header = f.read(cls._HEADER.size)
+                magic, num_bits, num_hashes, capacity, count, ino, covered = \
+                    cls._HEADER.unpack(header)
+                if magic != cls.MAGIC:
+                    return None
+                bits = bytearray(f.read())
+        except (OSError, struct.error):
+            return None
+
+        if len(bits) != (num_bits + 7) // 8:
+            return None
+
+        bloom = cls.__new__(cls)
+        bloom.num_bits = num_bits
+        bloom.num_hashes = num_hashes
+        bloom.capacity = capacity
+        bloom.bits = bits
+        bloom.count = count
+        bloom.source = (ino, covered)
+        return bloom
@@ -1,15 +1,63 @@
 
 import os
-from typing import List
-from domain.entities import GameHistory
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+from domain.entities import GameHistory, LazyGameHistory
+from domain.entities.game_history import DATE_FORMAT, date_to_epoch, to_epoch
 from data.repositories import IHistoryRepository
+from data.storage.file_lock import InterProcessLock, append_all, atomic_write
+from data.storage.history_index import HistoryPlayerIndex
+from data.storage.history_segments import HistorySegments
+from data.storage.history_stats import HistoryStatsStore
+from data.storage.history_time_index import HistoryTimeIndex
 
 class FileHistoryRepository(IHistoryRepository):
-    """Repositório de histórico em arquivo texto"""
+    """
+    Repositório de histórico em arquivo texto
+
+    Anexos usam trava exclusiva entre processos (fcntl); leituras usam
+    trava compartilhada. Consultas que atualizam os arquivos auxiliares
+    (índice por jogador e agregados) também usam a trava exclusiva.
+
+    Com segmentação mensal (padrão), history.txt guarda só o mês corrente:
+    ao chegar uma partida de um mês novo, as anteriores são arquivadas em
+    segmentos mensais com manifestos de resumo (ver HistorySegments),
+    comprimidos com segment_codec ('gzip', 'lzma' ou None). Um history.txt
+    antigo com vários meses é migrado ao abrir o repositório.
+    Índices e agregados incrementais valem para o arquivo quente; os
+    segmentos entram pelas somas dos manifestos.
+
+    Com lazy_records=True (padrão), get_all e iter_records devolvem
+    LazyGameHistory: a linha é guardada e cada campo só é decodificado
+    quando lido, então filtros por um campo não convertem os demais.
+    """
+    
+    # Tamanho dos blocos lidos de trás para frente em get_recent
+    TAIL_BLOCK_SIZE = 8192
+    
+    # Tamanho dos blocos lidos em iter_records
+    READ_BLOCK_SIZE = 1024 * 1024
     
-    def __init__(self, file_path: str = "assets/history.txt"):
+    def __init__(self, file_path: str = "assets/history.txt", segment_by_month: bool = True,
+                 segment_codec: Optional[str] = 'gzip', lazy_records: bool = True):
         self.file_path = file_path
+        self._record_type = LazyGameHistory if lazy_records else GameHistory
         self._ensure_file_exists()
+        
+        self._lock = threading.RLock()
+        self._file_lock = InterProcessLock(file_path)
+        self._player_index = HistoryPlayerIndex(file_path)
+        self._stats = HistoryStatsStore(file_path)
+        self._time_index = HistoryTimeIndex(file_path)
+        self._segments = HistorySegments(file_path, segment_codec) if segment_by_month else None
+        
+        if self._segments:
+            with self._lock, self._file_lock.exclusive():
+                self._segments.recover(os.stat(self.file_path).st_ino)
+                self._migrate()
+                self._segments.compress_cold()
     
     def _ensure_file_exists(self):
         #Cria o arquivo se não existir
@@ -22,14 +70,19 @@ class FileHistoryRepository(IHistoryRepository):
     def get_all(self) -> List[GameHistory]:
         #Lê todo o histórico
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
             history = []
+            with self._file_lock.shared():
+                # Segmentos arquivados (mais antigos) antes do arquivo quente
+                for month in self._months():
+                    history.extend(self._segments.iter_histories(month, self._record_type))
+                
+                with open(self.file_path, 'r', encoding='utf-8') as f:
+                    lines = f.readlines()
+            
             for line in lines:
                 if line.strip() and not line.startswith('#'):
                     try:
-                        h = GameHistory.from_file_format(line)
+                        h = self._record_type.from_file_format(line)
                         history.append(h)
                     except Exception:
                         continue  # Ignora linhas inválidas
@@ -40,15 +93,327 @@ class FileHistoryRepository(IHistoryRepository):
             print(f"Erro ao ler histórico: {e}")
             return []
     
+    def iter_records(self) -> Iterator[GameHistory]:
+        #Gera as partidas sob demanda (segmentos e depois o arquivo quente)
+        with self._file_lock.shared():
+            months = self._months()
+            # O descritor mantém o arquivo lido mesmo se um arquivamento o substituir
+            hot = open(self.file_path, 'rb')
+            size = os.fstat(hot.fileno()).st_size
+        
+        with hot:
+            for month in months:
+                yield from self._segments.iter_histories(month, self._record_type)
+            
+            # Para no tamanho visto na abertura (anexos posteriores ficam de fora)
+            for line in self._iter_lines(hot, size):
+                if line.strip() and not line.startswith('#'):
+                    try:
+                        yield self._record_type.from_file_format(line)
+                    except Exception:
+                        continue  # Ignora linhas inválidas
+    
     def save(self, history: GameHistory) -> bool:
         #Adiciona registro ao histórico
+        return self.save_many([history])
+    
+    def save_many(self, histories: List[GameHistory]) -> bool:
+        #Adiciona vários registros com uma única escrita no arquivo
         try:
-            with open(self.file_path, 'a', encoding='utf-8') as f:
-                f.write(history.to_file_format() + '\n')
+            lines = [(h.to_file_format() + '\n').encode('utf-8') for h in histories]
+            
+            with self._lock, self._file_lock.exclusive():
+                if self._segments and histories:
+                    self._roll_if_new_month(max(h.date[:7] for h in histories))
+                
+                # Falha na escrita não deixa linhas: repetir o lote é seguro
+                start = append_all(self.file_path, b''.join(lines))
+                
+                # Linhas já gravadas: erro nos índices não pode virar False,
+                # senão quem repete o lote duplicaria as partidas
+                try:
+                    offset = start
+                    for history, data in zip(histories, lines):
+                        end = offset + len(data)
+                        self._player_index.record(history.player_name, offset, end)
+                        self._stats.record(history, offset, end)
+                        self._time_index.record(history, offset, end)
+                        offset = end
+                except Exception as e:
+                    print(f"Erro ao atualizar índices do histórico: {e}")
+                    self._invalidate_sidecars()
             
             return True
         
         except Exception as e:
             print(f"Erro ao salvar histórico: {e}")
             return False
-        
\ No newline at end of file
+    
+    def get_by_player(self, player_name: str) -> List[GameHistory]:
+        #Lê apenas as linhas do jogador usando o índice lateral
+        try:
+            with self._lock, self._reading(self._player_index) as exclusive:
+                games = []
+                key = player_name.strip().casefold()
+                
+                # Só abre os segmentos cujo manifesto cita o jogador
+                for month in self._months():
+                    if key in self._segments.manifest(month, exclusive)['players']:
+                        games.extend(h for h in self._segments.iter_histories(month)
+                                     if h.player_name.strip().casefold() == key)
+                
+                offsets = self._player_index.offsets_for(player_name)
+                with open(self.file_path, 'rb') as f:
+                    for offset in offsets:
+                        f.seek(offset)
+                        line = f.readline().decode('utf-8', errors='replace')
+                        try:
+                            games.append(GameHistory.from_file_format(line))
+                        except Exception:
+                            continue  # Ignora linhas inválidas
+            
+            return games
+        
+        except Exception as e:
+            print(f"Erro ao ler histórico: {e}")
+            return []
+    
+    def get_summary(self, player_name: str = None) -> Dict[str, Any]:
+        #Agregados mantidos incrementalmente (O(1) após o primeiro sync)
+        try:
+            with self._lock, self._reading(self._stats) as exclusive:
+                hot = self._stats.summary(player_name)
+                if not self._segments:
+                    return hot
+                return self._merge_summaries(self._segments.summary(player_name, exclusive), hot)
+        
+        except Exception as e:
+            print(f"Erro ao ler histórico: {e}")
+            return super().get_summary(player_name)
+    
+    def get_between(self, start: datetime = None, end: datetime = None) -> List[GameHistory]:
+        #Busca binária no índice de tempo em memória; lê só as linhas do intervalo
+        try:
+            with self._lock, self._file_lock.shared():
+                games = self._segments_between(start, end)
+                
+                offsets = self._time_index.offsets_between(
+                    to_epoch(start) if start is not None else None,
+                    to_epoch(end) if end is not None else None
+                )
+                
+                with open(self.file_path, 'rb') as f:
+                    for offset in offsets:
+                        f.seek(offset)
+                        line = f.readline().decode('utf-8', errors='replace')
+                        try:
+                            games.append(GameHistory.from_file_format(line))
+                        except Exception:
+                            continue  # Ignora linhas inválidas
+            
+            # Partidas atrasadas podem estar fora de ordem entre segmentos. Datas
+            # válidas (AAAA-MM-DD hh:mm:ss) ordenam como texto: sem criar datetime
+            if any(a.date > b.date for a, b in zip(games, games[1:])):
+                games.sort(key=lambda h: h.date)
+            return games
+        
+        except Exception as e:
+            print(f"Erro ao ler histórico: {e}")
+            return []
+    
+    def get_recent(self, limit: int) -> List[GameHistory]:
+        #Lê o arquivo de trás para frente até juntar `limit` registros válidos
+        if limit <= 0:
+            return []
+        
+        try:
+            recent = []
+            with self._file_lock.shared():
+                with open(self.file_path, 'rb') as f:
+                    for raw in self._iter_lines_reversed(f):
+                        line = raw.decode('utf-8', errors='replace')
+                        if not line.strip() or line.startswith('#'):
+                            continue
+                        try:
+                            recent.append(GameHistory.from_file_format(line))
+                        except Exception:
+                            continue  # Ignora linhas inválidas
+                        
+                        if len(recent) >= limit:
+                            return recent
+                
+                # Faltou: segmentos do mais novo ao mais antigo (leitura em streaming)
+                for month in reversed(self._months()):
+                    tail = self._segments.tail_histories(month, limit - len(recent))
+                    recent.extend(reversed(tail))
+                    if len(recent) >= limit:
+                        break
+            
+            return recent
+        
+        except Exception as e:
+            print(f"Erro ao ler histórico: {e}")
+            return []
+    
+    def data_version(self) -> tuple:
+        #Anexos mudam o tamanho do arquivo quente; o arquivamento troca o inode
+        st = os.stat(self.file_path)
+        return st.st_ino, st.st_size, st.st_mtime_ns
+    
+    @contextmanager
+    def _reading(self, side_index) -> Iterator[bool]:
+        #Trava compartilhada se o índice lateral já cobre o arquivo; senão exclusiva,
+        #pois o sync grava o arquivo do índice. Devolve True se a trava é exclusiva
+        with self._file_lock.shared():
+            if side_index.is_current():
+                yield False
+                return
+        
+        with self._file_lock.exclusive():
+            yield True
+    
+    def _iter_lines(self, f, size: int) -> Iterator[str]:
+        #Gera as linhas dos primeiros `size` bytes, decodificando em blocos
+        remainder = b''
+        while size > 0:
+            block = f.read(min(self.READ_BLOCK_SIZE, size))
+            if not block:
+                break
+            size -= len(block)
+            
+            block = remainder + block
+            cut = block.rfind(b'\n') + 1
+            remainder = block[cut:]
+            yield from block[:cut].decode('utf-8', errors='replace').splitlines(True)
+        
+        if remainder:
+            yield remainder.decode('utf-8', errors='replace')
+    
+    def _iter_lines_reversed(self, f) -> Iterator[bytes]:
+        #Gera as linhas do arquivo (bytes) da última para a primeira
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        remainder = b''
+        
+        while position > 0:
+            size = min(self.TAIL_BLOCK_SIZE, position)
+            position -= size
+            f.seek(position)
+            block = f.read(size) + remainder
+            
+            lines = block.split(b'\n')
+            # A primeira linha do bloco pode estar incompleta
+            remainder = lines.pop(0)
+            
+            for line in reversed(lines):
+                if line:
+                    yield line
+        
+        if remainder:
+            yield remainder
+    
+    # ==================== Segmentos mensais ====================
+    
+    def _months(self) -> List[str]:
+        return self._segments.months() if self._segments else []
+    
+    def _segments_between(self, start: datetime = None, end: datetime = None) -> List[GameHistory]:
+        #Lê só os segmentos cujo intervalo de datas (manifesto) cruza [start, end)
+        low = start.strftime(DATE_FORMAT) if start is not None else None
+        high = end.strftime(DATE_FORMAT) if end is not None else None
+        
+        games = []
+        for month in self._months():
+            # Sob a trava compartilhada: o manifesto recalculado fica só em memória
+            manifest = self._segments.manifest(month, persist=False)
+            if manifest['min_date'] is None:
+                continue
+            if (low is not None and manifest['max_date'] < low) or \
+               (high is not None and manifest['min_date'] >= high):
+                continue
+            
+            # As linhas do arquivo quente vêm do índice de tempo, que já descarta
+            # datas inválidas; as dos segmentos são conferidas aqui
+            games.extend(h for h in self._segments.iter_histories(month)
+                         if (low is None or h.date >= low) and (high is None or h.date < high)
+                         and self._has_valid_date(h))
+        return games
+    
+    @staticmethod
+    def _has_valid_date(history: GameHistory) -> bool:
+        try:
+            date_to_epoch(history.date)
+            return True
+        except ValueError:
+            return False
+    
+    def _merge_summaries(self, segments: List[Dict[str, Any]], hot: Dict[str, Any]) -> Dict[str, Any]:
+        #Soma os manifestos (em ordem cronológica) e o arquivo quente
+        summary = {key: hot[key] for key in ('total_games', 'wins', 'losses',
+                                             'attempts_sum', 'duration_sum')}
+        best = None
+        best_attempts = -1
+        
+        for counters in segments:
+            for key in summary:
+                summary[key] += counters[key]
+            # Empate mantém a vitória mais antiga
+            if counters['best'] and (best_attempts < 0 or counters['best_attempts'] < best_attempts):
+                best, best_attempts = counters['best'], counters['best_attempts']
+        
+        if best is not None:
+            best = GameHistory.from_file_format(best)
+        if hot['best'] is not None and (best is None or hot['best'].attempts_used < best_attempts):
+            best = hot['best']
+        
+        summary['best'] = best
+        return summary
+    
+    def _hot_months(self, reverse: bool = False) -> Iterator[str]:
+        #Meses das linhas do arquivo quente (do início ou do fim)
+        with open(self.file_path, 'rb') as f:
+            lines = self._iter_lines_reversed(f) if reverse else f
+            for raw in lines:
+                month = HistorySegments.month_of(raw)
+                if month:
+                    yield month
+    
+    def _migrate(self):
+        #history.txt com vários meses (formato antigo): arquiva todos menos o último
+        first = next(self._hot_months(), None)
+        last = next(self._hot_months(reverse=True), None)
+        if first and last and first < last:
+            self._roll(last)
+    
+    def _roll_if_new_month(self, newest: str):
+        #Partida de um mês posterior ao início do arquivo quente: arquiva os anteriores
+        first = next(self._hot_months(), None)
+        if first and newest > first:
+            self._roll(newest)
+    
+    def _roll(self, keep_from: str):
+        #Move as linhas de meses anteriores a keep_from para os segmentos
+        def archived():
+            with open(self.file_path, 'rb') as src:
+                for raw in src:
+                    month = HistorySegments.month_of(raw)
+                    if month and month < keep_from:
+                        yield month, raw if raw.endswith(b'\n') else raw + b'\n'
+        
+        self._segments.archive(archived(), os.stat(self.file_path).st_ino)
+        
+        # Reescreve o arquivo quente só com o cabeçalho e as linhas mantidas
+        with open(self.file_path, 'rb') as src, atomic_write(self.file_path) as dst:
+            for raw in src:
+                month = HistorySegments.month_of(raw)
+                if not (month and month < keep_from):
+                    dst.write(raw)
+        
+        self._segments.finish_archive()
+        self._invalidate_sidecars()
+    
+    def _invalidate_sidecars(self):
+        #Descarta índices e agregados em memória; o próximo sync os refaz
+        self._player_index.invalidate()
+        self._stats.invalidate()
+        self._time_index.invalidate()
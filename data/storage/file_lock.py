@@ -0,0 +1,111 @@
+
+import os
+import struct
+import tempfile
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: sem travas consultivas entre processos
+    fcntl = None
+
+class InterProcessLock:
+    """
+    Trava consultiva (fcntl.flock) entre processos para um arquivo de dados
+
+    A trava fica em `<arquivo>.lock`, que sobrevive às substituições
+    atômicas do arquivo de dados. O lock file também guarda um contador
+    de versão incrementado a cada escrita, usado pelos caches para
+    detectar alterações feitas por outros processos mesmo quando mtime e
+    tamanho não mudam.
+    """
+
+    _VERSION = struct.Struct('<Q')
+
+    def __init__(self, path: str):
+        self.lock_path = f"{path}.lock"
+
+    @contextmanager
+    def shared(self):
+        """Trava compartilhada (leitura)"""
+        with self._acquire(fcntl.LOCK_SH if fcntl else None):
+            yield
+
+    @contextmanager
+    def exclusive(self):
+        """Trava exclusiva (escrita)"""
+        with self._acquire(fcntl.LOCK_EX if fcntl else None):
+            yield
+
+    def version(self) -> int:
+        """Contador de escritas registrado no lock file"""
+        try:
+            with open(self.lock_path, 'rb') as f:
+                data = f.read(self._VERSION.size)
+        except FileNotFoundError:
+            return 0
+        return self._VERSION.unpack(data)[0] if len(data) == self._VERSION.size else 0
+
+    def bump_version(self) -> int:
+        """Incrementa o contador (chamar com a trava exclusiva)"""
+        version = self.version() + 1
+        with open(self.lock_path, 'r+b') as f:
+            f.write(self._VERSION.pack(version))
+        return version
+
+    @contextmanager
+    def _acquire(self, operation):
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if operation is not None:
+                fcntl.flock(fd, operation)
+            yield
+        finally:
+            # Fechar o descritor libera a trava
+            os.close(fd)
+
+
+@contextmanager
+def atomic_write(path: str, mode: str = 'wb', encoding: str = None):
+    """
+    Escreve em um arquivo temporário no mesmo diretório e o renomeia
+    sobre `path` ao final; leitores nunca veem um arquivo pela metade
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory
+    )
+
+    try:
+        with os.fdopen(fd, mode, encoding=encoding) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+
+        existing_mode = os.stat(path).st_mode & 0o777 if os.path.exists(path) else 0o644
+        os.chmod(temp_path, existing_mode)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def append_all(path: str, data: bytes) -> int:
+    """
+    Anexa `data` ao final de `path` e retorna o offset inicial; se a escrita
+    falhar no meio, o arquivo volta ao tamanho anterior (tudo ou nada)
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        start = os.lseek(fd, 0, os.SEEK_END)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        except BaseException:
+            os.ftruncate(fd, start)
+            raise
+        return start
+    finally:
+        os.close(fd)
@@ -1,15 +1,71 @@
 
 import os
-from typing import List, Optional
+import sys
+import threading
+from typing import Dict, List, Optional, Tuple
 from domain.entities import Player
 from data.repositories import IPlayerRepository
+from data.storage.file_lock import InterProcessLock, append_all, atomic_write
+from data.storage.ranking_index import RankingIndex
 
 class FilePlayerRepository(IPlayerRepository):
-    """Repositório de jogadores em arquivo texto"""
+    """
+    Repositório de jogadores em arquivo texto
     
-    def __init__(self, file_path: str = "assets/scoreboard.txt"):
+    Mantém um índice residente (nome case-folded -> Player) carregado uma
+    única vez e invalidado quando o mtime/tamanho do arquivo muda.
+    Resultados de partidas são gravados no próprio registro do jogador
+    (mesmo tamanho) ou anexados ao fim do arquivo, sem reescrever o placar
+    inteiro a cada partida.
+    
+    Com use_delta_log=True, cada resultado vira um registro de delta
+    (nome|+vitorias|+derrotas) anexado a um log ao lado do placar. A leitura
+    aplica os deltas sobre o último snapshot compactado e a compactação
+    reescreve o snapshot e zera o log ao atingir compact_threshold deltas.
+    
+    Vários processos podem compartilhar o arquivo: leituras usam trava
+    compartilhada, escritas trava exclusiva (fcntl) e reescritas completas
+    são feitas em arquivo temporário renomeado atomicamente.
+    
+    O ranking fica ordenado em memória (RankingIndex) e é atualizado a
+    cada resultado: top-K é uma fatia e a posição de um jogador é uma
+    busca binária, sem reordenar todos os jogadores a cada consulta.
+    """
+    
+    HEADER = "# Placar - Formato: nome|vitorias|derrotas\n"
+    
+    # Compacta o arquivo quando os bytes mortos (linhas substituídas)
+    # ultrapassam este mínimo e também o volume de bytes vivos
+    COMPACT_MIN_DEAD_BYTES = 64 * 1024
+    
+    DELTA_HEADER = "# Deltas gen={gen} - Formato: nome|+vitorias|+derrotas\n"
+    SNAPSHOT_MARKER = "# delta-log: "
+    
+    def __init__(self, file_path: str = "assets/scoreboard.txt",
+                 use_delta_log: bool = False,
+                 compact_threshold: int = 1000,
+                 background_compaction: bool = True):
         self.file_path = file_path
+        self.log_path = f"{file_path}.log"
+        self.use_delta_log = use_delta_log
+        self.compact_threshold = compact_threshold
+        self.background_compaction = background_compaction
         self._ensure_file_exists()
+        
+        self._lock = threading.RLock()
+        self._file_lock = InterProcessLock(file_path)
+        self._players: Dict[str, Player] = {}
+        self._ranking = RankingIndex()
+        self._offsets: Dict[str, Tuple[int, int]] = {}  # chave -> (offset, tamanho)
+        self._signature: Optional[Tuple[int, int]] = None
+        self._file_size = 0
+        self._dead_bytes = 0
+        
+        # Estado do log de deltas
+        self._generation = 0
+        self._pending_deltas = 0
+        self._compacting = False
+        self._log_needs_reset = False
     
     def _ensure_file_exists(self):
         #Cria o arquivo se não existir
@@ -17,57 +73,84 @@ class FilePlayerRepository(IPlayerRepository):
         
         if not os.path.exists(self.file_path):
             with open(self.file_path, 'w', encoding='utf-8') as f:
-                f.write("# Placar - Formato: nome|vitorias|derrotas\n")
+                f.write(self.HEADER)
     
     def get_all(self) -> List[Player]:
-        #Lê todos os jogadores do arquivo
+        #Retorna cópias dos jogadores do índice
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            players = [
-                self._parse_player_line(line)
-                for line in lines
-                if line.strip() and not line.startswith('#')
-            ]
-            
-            # Filtra None
-            return [p for p in players if p is not None]
+            with self._lock, self._file_lock.shared():
+                self._refresh()
+                return [self._copy(p) for p in self._players.values()]
         
         except Exception as e:
             print(f"Erro ao ler jogadores: {e}")
             return []
     
     def get_by_name(self, name: str) -> Optional[Player]:
-        #Busca jogador por nome
-        all_players = self.get_all()
-        
-        # List comprehension com filtro
-        matches = [p for p in all_players if p.name.lower() == name.lower()]
+        #Busca jogador por nome em O(1)
+        try:
+            with self._lock, self._file_lock.shared():
+                self._refresh()
+                player = self._players.get(self._key(name))
+                return self._copy(player) if player else None
         
-        return matches[0] if matches else None
+        except Exception as e:
+            print(f"Erro ao ler jogadores: {e}")
+            return None
     
     def save(self, player: Player) -> bool:
         #Salva ou atualiza jogador
         try:
-            all_players = self.get_all()
+            with self._lock, self._file_lock.exclusive():
+                self._refresh()
+                self._store(self._copy(player))
             
-            # Atualiza se existe, adiciona se não
-            player_exists = False
-            for i, p in enumerate(all_players):
-                if p.name.lower() == player.name.lower():
-                    all_players[i] = player
-                    player_exists = True
-                    break
-            
-            if not player_exists:
-                all_players.append(player)
+            return True
+        
+        except Exception as e:
+            print(f"Erro ao salvar jogador: {e}")
+            return False
+    
+    def save_game_result(self, player_name: str, won: bool) -> bool:
+        #Salva resultado de uma partida atualizando o registro no lugar
+        try:
+            with self._lock, self._file_lock.exclusive():
+                self._refresh()
+                player = self._current_or_new(player_name)
+                
+                if won:
+                    player.wins += 1
+                else:
+                    player.losses += 1
+                
+                self._store(player)
             
-            # Reescreve arquivo
-            with open(self.file_path, 'w', encoding='utf-8') as f:
-                f.write("# Placar - Formato: nome|vitorias|derrotas\n")
-                for p in all_players:
-                    f.write(f"{p.name}|{p.wins}|{p.losses}\n")
+            return True
+        
+        except Exception as e:
+            print(f"Erro ao salvar jogador: {e}")
+            return False
+    
+    def save_game_results(self, results: List[Tuple[str, bool]]) -> bool:
+        #Aplica um lote de resultados com uma única abertura do arquivo
+        try:
+            with self._lock, self._file_lock.exclusive():
+                self._refresh()
+                
+                updated: Dict[str, Player] = {}
+                for player_name, won in results:
+                    key = self._key(player_name)
+                    player = updated.get(key)
+                    if player is None:
+                        player = updated[key] = self._current_or_new(player_name)
+                    
+                    if won:
+                        player.wins += 1
+                    else:
+                        player.losses += 1
+                
+                if updated:
+                    self._store_many(list(updated.values()))
             
             return True
         
@@ -75,26 +158,310 @@ class FilePlayerRepository(IPlayerRepository):
             print(f"Erro ao salvar jogador: {e}")
             return False
     
-    def save_game_result(self, player_name: str, won: bool) -> bool:
-        #Salva resultado de uma partida
-        player = self.get_by_name(player_name)
+    def compact(self) -> bool:
+        """
+        Incorpora o log de deltas ao snapshot e trunca o log
+        
+        Returns:
+            True se compactado com sucesso, False caso contrário
+        """
+        try:
+            with self._lock, self._file_lock.exclusive():
+                self._refresh()
+                self._compact()
+            return True
+        
+        except Exception as e:
+            print(f"Erro ao compactar placar: {e}")
+            return False
+        finally:
+            self._compacting = False
+    
+    def get_ranking(self, limit: Optional[int] = None) -> List[Player]:
+        #Top-K do ranking já ordenado (fatia, sem ordenar todos os jogadores)
+        try:
+            with self._lock, self._file_lock.shared():
+                self._refresh()
+                return [self._copy(self._players[key]) for key in self._ranking.top(limit)]
+        
+        except Exception as e:
+            print(f"Erro ao ler jogadores: {e}")
+            return []
+    
+    def get_rank(self, name: str) -> Optional[int]:
+        #Posição por busca binária no ranking ordenado
+        try:
+            with self._lock, self._file_lock.shared():
+                self._refresh()
+                return self._ranking.rank(self._key(name))
+        
+        except Exception as e:
+            print(f"Erro ao ler jogadores: {e}")
+            return None
+    
+    def data_version(self) -> Tuple[int, ...]:
+        #Mesma assinatura que invalida o índice residente
+        return self._stat_signature()
+    
+    # ==================== Índice ====================
+    
+    @staticmethod
+    def _key(name: str) -> str:
+        return name.strip().casefold()
+    
+    @staticmethod
+    def _copy(player: Player) -> Player:
+        return Player(name=player.name, wins=player.wins, losses=player.losses)
+    
+    def _current_or_new(self, player_name: str) -> Player:
+        #Cópia do jogador registrado ou novo jogador com o nome sem espaços nas pontas
+        current = self._players.get(self._key(player_name))
+        return self._copy(current) if current else Player(name=player_name.strip())
+    
+    @staticmethod
+    def _format_line(player: Player) -> bytes:
+        return f"{player.name}|{player.wins}|{player.losses}\n".encode('utf-8')
+    
+    def _stat_signature(self) -> Tuple[int, ...]:
+        # A versão do lock file detecta escritas de outros processos
+        # mesmo quando mtime e tamanho coincidem
+        st = os.stat(self.file_path)
+        signature = (self._file_lock.version(), st.st_ino, st.st_mtime_ns, st.st_size)
+        if not self.use_delta_log:
+            return signature
+        
+        try:
+            log = os.stat(self.log_path)
+            return signature + (log.st_mtime_ns, log.st_size)
+        except FileNotFoundError:
+            return signature + (0, 0)
+    
+    def _mark_written(self):
+        #Publica a escrita para outros processos e atualiza a assinatura
+        self._file_lock.bump_version()
+        self._signature = self._stat_signature()
+    
+    def _refresh(self):
+        #Recarrega o índice se o arquivo mudou desde a última leitura
+        if not os.path.exists(self.file_path):
+            self._ensure_file_exists()
+        
+        if self._signature != self._stat_signature():
+            self._load()
+    
+    def _load(self):
+        #Lê o arquivo uma vez, registrando offset e tamanho de cada linha
+        players: Dict[str, Player] = {}
+        offsets: Dict[str, Tuple[int, int]] = {}
+        dead_bytes = 0
+        offset = 0
+        snapshot_generation = 0
+        
+        with open(self.file_path, 'rb') as f:
+            for raw in f:
+                length = len(raw)
+                line = raw.decode('utf-8', errors='replace')
+                
+                if line.startswith(self.SNAPSHOT_MARKER):
+                    snapshot_generation = self._parse_generation(
+                        line[len(self.SNAPSHOT_MARKER):]
+                    )
+                
+                if line.strip() and not line.startswith('#'):
+                    player = self._parse_player_line(line)
+                    
+                    if player is None:
+                        dead_bytes += length
+                    else:
+                        key = self._key(player.name)
+                        
+                        # A última ocorrência prevalece (registro mais novo)
+                        if key in offsets:
+                            dead_bytes += offsets[key][1]
+                        
+                        players[key] = player
+                        offsets[key] = (offset, length)
+                else:
+                    dead_bytes += length
+                
+                offset += length
+            
+            f.seek(0, os.SEEK_END)
+            self._file_size = f.tell()
+        
+        self._players = players
+        self._ranking.rebuild(players)
+        self._offsets = offsets
+        self._dead_bytes = dead_bytes
+        self._generation = snapshot_generation
+        self._pending_deltas = 0
+        
+        if self.use_delta_log:
+            self._load_deltas(snapshot_generation)
+        
+        self._signature = self._stat_signature()
+    
+    def _load_deltas(self, snapshot_generation: int):
+        #Aplica os deltas do log sobre o snapshot carregado
+        self._log_needs_reset = False
+        
+        if not os.path.exists(self.log_path):
+            self._log_needs_reset = True
+            return
+        
+        with open(self.log_path, 'r', encoding='utf-8', errors='replace') as f:
+            first = f.readline()
+            log_generation = self._parse_generation(first.split('gen=', 1)[-1])
+            
+            # Log de geração anterior já foi incorporado ao snapshot
+            # (compactação interrompida antes de truncar o log)
+            if log_generation < snapshot_generation:
+                self._log_needs_reset = True
+                return
+            
+            for line in f:
+                delta = self._parse_player_line(line)
+                if delta is None:
+                    continue
+                
+                self._apply_delta(delta.name, delta.wins, delta.losses)
+                self._pending_deltas += 1
+    
+    def _apply_delta(self, name: str, wins: int, losses: int):
+        key = self._key(name)
+        player = self._players.get(key)
         
         if player is None:
-            player = Player(name=player_name)
+            player = Player(name=name)
+            self._players[key] = player
+        
+        player.wins += wins
+        player.losses += losses
+        self._ranking.update(key, player)
+    
+    def _append_deltas(self, deltas: List[Tuple[str, int, int]]):
+        #Grava deltas no log em uma única escrita: custo constante por partida
+        data = ''.join(
+            f"{name}|{wins:+d}|{losses:+d}\n" for name, wins, losses in deltas
+        )
+        
+        # Log ausente ou de geração já compactada: recomeça com cabeçalho
+        if self._log_needs_reset:
+            self._write_log_header(self._generation)
+            self._log_needs_reset = False
+        
+        # Falha na escrita não deixa deltas: repetir o lote é seguro
+        append_all(self.log_path, data.encode('utf-8'))
+        
+        for name, wins, losses in deltas:
+            self._apply_delta(name, wins, losses)
+        self._pending_deltas += len(deltas)
+        self._mark_written()
+        
+        if self._pending_deltas >= self.compact_threshold and not self._compacting:
+            self._compacting = True
+            if self.background_compaction:
+                threading.Thread(target=self.compact, daemon=True).start()
+            else:
+                # Já com a trava exclusiva: flock não é reentrante entre descritores
+                # Deltas já gravados: compactar de novo fica para a próxima escrita
+                try:
+                    self._compact()
+                except Exception as e:
+                    print(f"Erro ao compactar placar: {e}")
+                finally:
+                    self._compacting = False
+    
+    def _write_log_header(self, generation: int):
+        with atomic_write(self.log_path, 'w', encoding='utf-8') as f:
+            f.write(self.DELTA_HEADER.format(gen=generation))
+    
+    @staticmethod
+    def _parse_generation(text: str) -> int:
+        try:
+            return int(text.split()[0])
+        except (ValueError, IndexError):
+            return 0
+    
+    def _store(self, player: Player):
+        #Persiste um único jogador sem reescrever o arquivo inteiro
+        self._store_many([player])
+    
+    def _store_many(self, players: List[Player]):
+        #Persiste vários jogadores abrindo o arquivo uma única vez
+        if self.use_delta_log:
+            deltas = []
+            for player in players:
+                current = self._players.get(self._key(player.name))
+                deltas.append((
+                    player.name,
+                    player.wins - (current.wins if current else 0),
+                    player.losses - (current.losses if current else 0)
+                ))
+            self._append_deltas(deltas)
+            return
+        
+        with open(self.file_path, 'r+b') as f:
+            for player in players:
+                self._write_player(f, player)
+        
+        self._mark_written()
+        
+        live_bytes = self._file_size - self._dead_bytes
+        if self._dead_bytes > max(self.COMPACT_MIN_DEAD_BYTES, live_bytes):
+            self._compact()
+    
+    def _write_player(self, f, player: Player):
+        #Grava um jogador: no lugar (mesmo tamanho) ou anexado ao fim
+        key = self._key(player.name)
+        line = self._format_line(player)
+        previous = self._offsets.get(key)
         
-        if won:
-            player.wins += 1
+        if previous and previous[1] == len(line):
+            # Mesmo tamanho: sobrescreve o registro no lugar
+            f.seek(previous[0])
+            f.write(line)
         else:
-            player.losses += 1
+            # Anexa o novo registro antes de invalidar o antigo
+            f.seek(0, os.SEEK_END)
+            end = f.tell()
+            
+            if end > 0:
+                f.seek(end - 1)
+                if f.read(1) != b'\n':
+                    f.write(b'\n')
+                    end += 1
+            
+            f.write(line)
+            self._offsets[key] = (end, len(line))
+            self._file_size = end + len(line)
+            
+            if previous:
+                # Marca a linha antiga como comentário (ignorada na leitura)
+                f.seek(previous[0])
+                f.write(b'#' + b' ' * (previous[1] - 2) + b'\n')
+                self._dead_bytes += previous[1]
         
-        return self.save(player)
+        self._players[key] = player
+        self._ranking.update(key, player)
     
-    def get_ranking(self, limit: Optional[int] = None) -> List[Player]:
-        #Retorna ranking ordenado por vitórias
-        players = self.get_all()
-        players.sort(reverse=True)
+    def _compact(self):
+        #Reescreve o arquivo apenas com os registros vivos (troca atômica)
+        generation = self._generation + 1 if self.use_delta_log else 0
+        
+        with atomic_write(self.file_path) as f:
+            f.write(self.HEADER.encode('utf-8'))
+            if self.use_delta_log:
+                # O snapshot já inclui todos os deltas das gerações < generation
+                f.write(f"{self.SNAPSHOT_MARKER}{generation}\n".encode('utf-8'))
+            for player in self._players.values():
+                f.write(self._format_line(player))
+        
+        if self.use_delta_log:
+            self._write_log_header(generation)
         
-        return players[:limit] if limit else players
+        self._file_lock.bump_version()
+        self._load()
     
     def _parse_player_line(self, line: str) -> Optional[Player]:
         #Converte linha do arquivo em objeto Player
@@ -104,8 +471,9 @@ class FilePlayerRepository(IPlayerRepository):
                 return None
             
             name, wins, losses = parts
+            # Deltas repetem o nome a cada partida: uma string por jogador
             return Player(
-                name=name.strip(),
+                name=sys.intern(name.strip()),
                 wins=int(wins),
                 losses=int(losses)
             )
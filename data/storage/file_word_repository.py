@@ -1,14 +1,68 @@
 
+import mmap
 import os
-from typing import List
+import random
+import re
+import threading
+import unicodedata
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from data.repositories import IWordRepository
+from data.storage.bloom_filter import BloomFilter
+from data.storage.file_lock import InterProcessLock, append_all
+
+def normalize_word(word: str, min_length: int = 3) -> Optional[str]:
+    """
+    Normaliza uma palavra para o dicionário: maiúsculas, sem acentos
+    (COMPUTAÇÃO -> COMPUTACAO) e apenas letras A-Z
+    
+    Returns:
+        Palavra normalizada, ou None se inválida/curta demais
+    """
+    decomposed = unicodedata.normalize('NFKD', word.strip())
+    folded = ''.join(c for c in decomposed if not unicodedata.combining(c)).upper()
+    
+    if not folded.isascii() or not folded.isalpha() or len(folded) < min_length:
+        return None
+    return folded
 
 class FileWordRepository(IWordRepository):
-    """Repositório de palavras em arquivo texto"""
+    """
+    Repositório de palavras em arquivo texto
+    
+    random_word() mapeia o arquivo em memória (mmap) e mantém apenas um
+    array compacto com o offset de cada palavra válida, reconstruído
+    quando o arquivo muda. O sorteio lê uma única linha.
+    
+    contains() e add_word() usam um índice de pertinência residente:
+    um set exato (padrão) ou, com bloom_path, um filtro de Bloom salvo
+    em disco para dicionários muito grandes. Positivos do filtro são
+    confirmados por busca no mmap. Palavras anexadas depois da última
+    carga são incorporadas lendo apenas o final do arquivo.
     
-    def __init__(self, file_path: str = "assets/words.txt"):
+    Escritas usam trava exclusiva entre processos (InterProcessLock) e
+    leituras, trava compartilhada: a checagem de duplicata vê as palavras
+    gravadas por outros processos e ninguém indexa uma linha pela metade.
+    """
+    
+    def __init__(self, file_path: str = "assets/words.txt",
+                 bloom_path: Optional[str] = None,
+                 bloom_error_rate: float = 0.001):
         self.file_path = file_path
+        self.bloom_path = bloom_path
+        self.bloom_error_rate = bloom_error_rate
         self._ensure_file_exists()
+        
+        self._lock = threading.RLock()
+        self._file_lock = InterProcessLock(file_path)
+        self._mmap: Optional[mmap.mmap] = None
+        self._offsets: Optional[array] = None
+        self._signature: Optional[Tuple[int, int, int]] = None
+        
+        # Índice de pertinência
+        self._members: Optional[Set[str]] = None
+        self._bloom: Optional[BloomFilter] = None
+        self._members_source: Tuple[int, int] = (0, 0)  # (inode, bytes cobertos)
     
     def _ensure_file_exists(self):
         #Cria o arquivo com palavras padrão se não existir
@@ -32,7 +86,7 @@ class FileWordRepository(IWordRepository):
     def get_all(self) -> List[str]:
         #Lê todas as palavras do arquivo
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
+            with self._file_lock.shared(), open(self.file_path, 'r', encoding='utf-8') as f:
 
                 words = [
                     line.strip().upper() 
@@ -45,21 +99,314 @@ class FileWordRepository(IWordRepository):
             return []
     
     def add_word(self, word: str) -> bool:
-        #Adiciona nova palavra ao arquivo
+        #Adiciona nova palavra ao arquivo (verificação em O(1))
         try:
             word = word.strip().upper()
             if not word or not word.isalpha():
                 return False
             
-            # Verifica se já existe
-            existing = self.get_all()
-            if word in existing:
-                return False
-            
-            with open(self.file_path, 'a', encoding='utf-8') as f:
-                f.write(f'\n{word}')
+            with self._lock, self._file_lock.exclusive():
+                # Verifica se já existe (inclusive palavras de outros processos)
+                if self._contains(word):
+                    return False
+                
+                append_all(self.file_path, f'\n{word}'.encode('utf-8'))
+                
+                self._add_member(word)
             
             return True
         except Exception as e:
             print(f"Erro ao adicionar palavra: {e}")
             return False
+    
+    def contains(self, word: str) -> bool:
+        #Verifica se a palavra está no dicionário
+        try:
+            word = word.strip().upper()
+            if not word:
+                return False
+            
+            with self._lock, self._file_lock.shared():
+                return self._contains(word)
+        except Exception as e:
+            print(f"Erro ao consultar palavra: {e}")
+            return False
+    
+    def import_words(self, words: Iterable[str], min_length: int = 3,
+                     chunk_size: int = 65536,
+                     expected_words: int = 0) -> Dict[str, int]:
+        """
+        Importa palavras em lote (streaming)
+        
+        Normaliza cada palavra (maiúsculas, sem acentos, só A-Z, tamanho
+        mínimo), descarta as que já existem e grava as aceitas com uma
+        única abertura do arquivo, em blocos de chunk_size palavras.
+        Duplicadas dentro da própria importação são barradas pelo índice
+        de pertinência (set ou Bloom confirmado no arquivo); só o bloco
+        ainda não gravado fica num set à parte, então a memória extra é
+        limitada a chunk_size palavras.
+        
+        Args:
+            words: Iterável de palavras (ex.: linhas de um arquivo)
+            min_length: Tamanho mínimo aceito
+            chunk_size: Palavras acumuladas por escrita
+            expected_words: Estimativa de palavras novas (dimensiona o Bloom)
+        
+        Returns:
+            Contadores: read, accepted, rejected_invalid, rejected_short,
+            rejected_duplicate
+        """
+        counts = {'read': 0, 'accepted': 0, 'rejected_invalid': 0,
+                  'rejected_short': 0, 'rejected_duplicate': 0}
+        
+        with self._lock, self._file_lock.exclusive():
+            self._refresh_members()
+            self._refresh_mapping()
+            if self._bloom is not None and \
+                    self._bloom.count + expected_words > self._bloom.capacity:
+                self._grow_bloom(self._bloom.count + expected_words)
+            pending: List[str] = []
+            pending_set: Set[str] = set()
+            remap = False  # Blocos gravados que o mmap ainda não enxerga
+            
+            with open(self.file_path, 'a', encoding='utf-8', buffering=1024 * 1024) as f:
+                for raw in words:
+                    raw = raw.strip()
+                    if not raw:
+                        continue
+                    counts['read'] += 1
+                    
+                    word = normalize_word(raw, min_length=0)
+                    if word is None:
+                        counts['rejected_invalid'] += 1
+                        continue
+                    if len(word) < min_length:
+                        counts['rejected_short'] += 1
+                        continue
+                    if word in pending_set:
+                        counts['rejected_duplicate'] += 1
+                        continue
+                    if remap and self._bloom is not None and word in self._bloom:
+                        # Positivo do Bloom: a confirmação precisa ver os blocos já gravados
+                        f.flush()
+                        self._refresh_mapping()
+                        remap = False
+                    if self._contains_indexed(word):
+                        counts['rejected_duplicate'] += 1
+                        continue
+                    
+                    pending_set.add(word)
+                    pending.append(word)
+                    
+                    if self._members is not None:
+                        self._members.add(word)
+                    else:
+                        self._bloom.add(word)
+                    
+                    saturated = self._bloom is not None and self._bloom.is_saturated
+                    if len(pending) >= chunk_size or saturated:
+                        f.write('\n' + '\n'.join(pending))
+                        counts['accepted'] += len(pending)
+                        pending.clear()
+                        pending_set.clear()
+                        remap = True
+                    
+                    if saturated:
+                        f.flush()
+                        self._grow_bloom()
+                
+                if pending:
+                    f.write('\n' + '\n'.join(pending))
+                    counts['accepted'] += len(pending)
+            
+            st = os.stat(self.file_path)
+            self._members_source = (st.st_ino, st.st_size)
+            self.save_membership_index()
+        
+        return counts
+    
+    def save_membership_index(self):
+        """Persiste o filtro de Bloom (quando em uso) com os bytes cobertos"""
+        with self._lock:
+            if self._bloom is not None and self.bloom_path:
+                self._bloom.source = self._members_source
+                self._bloom.save(self.bloom_path)
+    
+    def random_word(self) -> Optional[str]:
+        #Sorteia uma palavra lendo só a linha escolhida no mmap
+        try:
+            with self._lock, self._file_lock.shared():
+                self._refresh_mapping()
+                
+                if self._offsets is None:
+                    self._offsets = self._build_offsets(self._mmap) if self._mmap else array('I')
+                
+                if not self._offsets:
+                    return None
+                
+                start = self._offsets[random.randrange(len(self._offsets))]
+                return self._read_word(start)
+        
+        except Exception as e:
+            print(f"Erro ao sortear palavra: {e}")
+            return None
+    
+    # ==================== Mapeamento ====================
+    
+    def _refresh_mapping(self):
+        #Remapeia o arquivo se ele mudou (offsets refeitos sob demanda)
+        st = os.stat(self.file_path)
+        signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+        
+        if signature == self._signature:
+            return
+        
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._offsets = None
+        
+        if st.st_size > 0:
+            with open(self.file_path, 'rb') as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        self._signature = signature
+    
+    @staticmethod
+    def _build_offsets(data: mmap.mmap) -> array:
+        #Offset do início de cada linha com palavra válida
+        offsets = array('I')
+        size = len(data)
+        start = 0
+        
+        while start < size:
+            end = data.find(b'\n', start)
+            if end < 0:
+                end = size
+            
+            word = data[start:end].decode('utf-8', errors='replace').strip()
+            if word and word.isalpha():
+                offsets.append(start)
+            
+            start = end + 1
+        
+        return offsets
+    
+    def _read_word(self, start: int) -> str:
+        end = self._mmap.find(b'\n', start)
+        if end < 0:
+            end = len(self._mmap)
+        return self._mmap[start:end].decode('utf-8').strip().upper()
+    
+    # ==================== Pertinência ====================
+    
+    def _contains(self, word: str) -> bool:
+        self._refresh_members()
+        self._refresh_mapping()
+        return self._contains_indexed(word)
+    
+    def _contains_indexed(self, word: str) -> bool:
+        #Consulta o índice já carregado
+        if self._members is not None:
+            return word in self._members
+        
+        if word not in self._bloom:
+            return False  # Filtro de Bloom não tem falsos negativos
+        
+        # Possível falso positivo: confirma no arquivo mapeado
+        return self._scan_for(word)
+    
+    def _add_member(self, word: str):
+        #Atualiza o índice com a palavra recém-anexada
+        if self._members is not None:
+            self._members.add(word)
+        else:
+            self._bloom.add(word)
+            if self._bloom.is_saturated:
+                self._grow_bloom()
+        
+        st = os.stat(self.file_path)
+        self._members_source = (st.st_ino, st.st_size)
+    
+    def _grow_bloom(self, capacity: int = 0):
+        #Recria o filtro maior (dobrar a capacidade mantém custo amortizado O(1))
+        st = os.stat(self.file_path)
+        capacity = max(capacity, self._bloom.capacity * 2)
+        bloom = BloomFilter(capacity=capacity, error_rate=self.bloom_error_rate)
+        for word in self._iter_words(0):
+            bloom.add(word)
+        
+        self._bloom = bloom
+        self._members_source = (st.st_ino, st.st_size)
+    
+    def _refresh_members(self):
+        #Carrega/atualiza o índice lendo só o que mudou no arquivo
+        st = os.stat(self.file_path)
+        ino, covered = self._members_source
+        loaded = self._members is not None or self._bloom is not None
+        
+        if loaded and ino == st.st_ino and covered == st.st_size:
+            return
+        
+        if not loaded or ino != st.st_ino or covered > st.st_size:
+            covered = self._load_members(st)
+        
+        for word in self._iter_words(covered):
+            if self._members is not None:
+                self._members.add(word)
+            else:
+                self._bloom.add(word)
+        
+        self._members_source = (st.st_ino, st.st_size)
+    
+    def _load_members(self, st: os.stat_result) -> int:
+        #Inicializa o índice; retorna o byte a partir do qual indexar
+        if not self.bloom_path:
+            self._members = set()
+            return 0
+        
+        bloom = BloomFilter.load(self.bloom_path)
+        if bloom is not None and bloom.source[0] == st.st_ino and bloom.source[1] <= st.st_size:
+            self._bloom = bloom
+            return bloom.source[1]
+        
+        # Filtro ausente ou de outro arquivo: reconstrói e persiste
+        self._bloom = BloomFilter(
+            capacity=max(st.st_size // 6, 1000), error_rate=self.bloom_error_rate
+        )
+        for word in self._iter_words(0):
+            self._bloom.add(word)
+        
+        self._members_source = (st.st_ino, st.st_size)
+        self.save_membership_index()
+        return st.st_size
+    
+    def _iter_words(self, start: int) -> Iterator[str]:
+        #Palavras válidas do arquivo a partir de um byte
+        with open(self.file_path, 'rb') as f:
+            f.seek(start)
+            for raw in f:
+                word = raw.decode('utf-8', errors='replace').strip()
+                if word and word.isalpha():
+                    yield word.upper()
+    
+    def _scan_for(self, word: str) -> bool:
+        #Confirma a palavra no arquivo mapeado comparando linhas normalizadas
+        if self._mmap is None:
+            return False
+        
+        # Mesma normalização do índice (strip + upper): espaços, CRLF e
+        # minúsculas não geram falso negativo. A regex roda em C sobre o mmap
+        pattern = re.compile(
+            rb'^[ \t\r\f\v]*' + re.escape(word.encode('utf-8')) + rb'[ \t\r\f\v]*$',
+            re.MULTILINE | re.IGNORECASE
+        )
+        if pattern.search(self._mmap):
+            return True
+        if word.isascii():
+            return False
+        
+        # IGNORECASE em bytes só cobre ASCII: letras acentuadas linha a linha
+        if self._offsets is None:
+            self._offsets = self._build_offsets(self._mmap)
+        return any(self._read_word(start) == word for start in self._offsets)
@@ -0,0 +1,151 @@
+
+import os
+from array import array
+from typing import Dict, List, Optional
+from data.storage.file_lock import atomic_write
+
+class HistoryPlayerIndex:
+    """
+    Índice lateral (sidecar) do histórico: jogador -> offsets das linhas
+
+    Persistido em `<historico>.idx` no formato `offset|jogador`, apenas com
+    anexos. O cabeçalho guarda o inode do histórico; se o arquivo foi
+    substituído ou encolheu, o índice é reconstruído. Linhas anexadas por
+    outros escritores são indexadas a partir do último byte coberto.
+    """
+
+    HEADER = "# Índice de histórico ino={ino} - Formato: offset|jogador\n"
+
+    def __init__(self, history_path: str):
+        self.history_path = history_path
+        self.index_path = f"{history_path}.idx"
+        self._offsets: Dict[str, array] = {}
+        self._covered = 0
+        self._inode: Optional[int] = None
+
+    @staticmethod
+    def key(player_name: str) -> str:
+        return player_name.strip().casefold()
+
+    def offsets_for(self, player_name: str) -> List[int]:
+        """Offsets (em ordem de gravação) das partidas do jogador"""
+        self.sync()
+        return list(self._offsets.get(self.key(player_name), ()))
+
+    def record(self, player_name: str, offset: int, end: int):
+        """Registra uma linha recém-anexada ao histórico (atualização incremental)"""
+        if self._inode is None or offset != self._covered:
+            return  # Será indexada pelo próximo sync()
+
+        self._add(self.key(player_name), offset)
+        self._covered = end
+        with open(self.index_path, 'a', encoding='utf-8') as f:
+            f.write(f"{offset}|{self.key(player_name)}\n")
+
+    def sync(self):
+        """Garante que o índice cobre todo o histórico"""
+        st = os.stat(self.history_path)
+
+        if self._inode != st.st_ino or st.st_size < self._covered:
+            if not self._load(st.st_ino, st.st_size):
+                self._rebuild(st.st_ino)
+
+        if st.st_size > self._covered:
+            self._index_tail()
+
+    def is_current(self) -> bool:
+        """Indica se a memória já cobre todo o histórico (sync não gravaria nada)"""
+        st = os.stat(self.history_path)
+        return self._inode == st.st_ino and self._covered == st.st_size
+
+    def invalidate(self):
+        """Descarta o índice em memória (ex.: histórico reescrito)"""
+        self._offsets = {}
+        self._covered = 0
+        self._inode = None
+
+    # ==================== Persistência ====================
+
+    def _add(self, key: str, offset: int):
+        offsets = self._offsets.get(key)
+        if offsets is None:
+            offsets = self._offsets[key] = array('Q')
+        offsets.append(offset)
+
+    def _load(self, inode: int, size: int) -> bool:
+        #Carrega o sidecar; retorna False se ausente ou desatualizado
+        self.invalidate()
+
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                header = f.readline()
+                if header != self.HEADER.format(ino=inode):
+                    return False
+
+                last = None
+                for line in f:
+                    offset, _, key = line.rstrip('\n').partition('|')
+                    if not key:
+                        continue
+                    # Entradas repetidas (outro processo indexou o mesmo
+                    # trecho) aparecem com offset não crescente
+                    if last is not None and int(offset) <= last[0]:
+                        continue
+                    self._add(key, int(offset))
+                    last = (int(offset), key)
+        except (OSError, ValueError):
+            return False
+
+        self._inode = inode
+        if last is None:
+            return True
+
+        # Confere se a última entrada aponta para a linha esperada
+        with open(self.history_path, 'rb') as f:
+            f.seek(last[0])
+            raw = f.readline()
+
+        parts = raw.decode('utf-8', errors='replace').split('|')
+        if len(parts) < 2 or self.key(parts[1]) != last[1] or last[0] + len(raw) > size:
+            self.invalidate()
+            return False
+
+        self._covered = last[0] + len(raw)
+        return True
+
+    def _rebuild(self, inode: int):
+        #Recria o sidecar varrendo o histórico inteiro
+        self.invalidate()
+        self._inode = inode
+
+        with atomic_write(self.index_path, 'w', encoding='utf-8') as f:
+            f.write(self.HEADER.format(ino=inode))
+
+        self._index_tail()
+
+    def _index_tail(self):
+        #Indexa as linhas do histórico posteriores ao último byte coberto
+        entries = []
+
+        with open(self.history_path, 'rb') as f:
+            f.seek(self._covered)
+            offset = self._covered
+
+            for raw in f:
+                if not raw.endswith(b'\n'):
+                    break  # Linha ainda sendo escrita
+
+                line = raw.decode('utf-8', errors='replace')
+                if line.strip() and not line.startswith('#'):
+                    parts = line.split('|')
+                    if len(parts) == 6:
+                        key = self.key(parts[1])
+                        self._add(key, offset)
+                        entries.append(f"{offset}|{key}\n")
+
+                offset += len(raw)
+
+        self._covered = offset
+        if entries:
+            with open(self.index_path, 'a', encoding='utf-8') as f:
+                f.writelines(entries)
@@ -0,0 +1,357 @@
+
+import gzip
+import json
+import lzma
+import os
+from collections import deque
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from domain.entities import GameHistory
+from data.storage.file_lock import atomic_write
+
+class HistorySegments:
+    """
+    Segmentos mensais do histórico com manifestos de resumo
+
+    Partidas de meses encerrados saem do arquivo quente (history.txt) e
+    vão para `<historico>.d/AAAA-MM.txt`, no mesmo formato de linha. Cada
+    segmento tem um manifesto `AAAA-MM.json` com contagens, somas, datas
+    mínima/máxima, melhor vitória e os mesmos agregados por jogador; assim
+    agregados e consultas por intervalo ou jogador só abrem os segmentos
+    necessários. O manifesto guarda o tamanho do segmento e é recalculado
+    se não corresponder. Um diário (`.roll`) permite desfazer um
+    arquivamento interrompido antes da troca do arquivo quente.
+
+    Segmentos são frios: com um codec (gzip ou lzma) ficam comprimidos
+    (`AAAA-MM.txt.gz` / `.txt.xz`) e são lidos por descompressão em
+    streaming. Novos anexos viram um novo membro/fluxo concatenado ao
+    arquivo, o que os dois formatos aceitam na leitura.
+    """
+
+    # Codec -> sufixo do segmento
+    CODECS = {None: ".txt", 'gzip': ".txt.gz", 'lzma': ".txt.xz"}
+    MANIFEST_SUFFIX = ".json"
+    JOURNAL_NAME = ".roll"
+
+    def __init__(self, history_path: str, codec: Optional[str] = 'gzip'):
+        if codec not in self.CODECS:
+            raise ValueError(f"Codec não suportado: {codec}")
+
+        self.history_path = history_path
+        self.codec = codec
+        self.directory = f"{os.path.splitext(history_path)[0]}.d"
+        self.journal_path = os.path.join(self.directory, self.JOURNAL_NAME)
+        self._manifests: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+    @staticmethod
+    def month_of(line: bytes) -> Optional[str]:
+        """Mês (AAAA-MM) de uma linha de dados; None para cabeçalho/linha inválida"""
+        if len(line) < 8 or line[4:5] != b'-' or not line[:4].isdigit() or not line[5:7].isdigit():
+            return None
+        return line[:7].decode('ascii')
+
+    def months(self) -> List[str]:
+        """Meses arquivados, em ordem cronológica"""
+        return sorted(self._segment_files())
+
+    def segment_path(self, month: str) -> str:
+        """Arquivo do segmento: o existente (qualquer codec) ou um novo no codec atual"""
+        for codec in (self.codec, None, 'gzip', 'lzma'):
+            path = os.path.join(self.directory, month + self.CODECS[codec])
+            if os.path.exists(path):
+                return path
+        return os.path.join(self.directory, month + self.CODECS[self.codec])
+
+    def manifest_path(self, month: str) -> str:
+        return os.path.join(self.directory, month + self.MANIFEST_SUFFIX)
+
+    # ==================== Leitura ====================
+
+    def manifest(self, month: str, persist: bool = True) -> Dict[str, Any]:
+        """
+        Manifesto do segmento (recalculado se ausente ou desatualizado)
+
+        O recálculo só é gravado com persist=True: quem lê sob a trava
+        compartilhada guarda o manifesto apenas em memória.
+        """
+        size = os.path.getsize(self.segment_path(month))
+        cached = self._manifests.get(month)
+        if cached and cached[0] == size:
+            return cached[1]
+
+        manifest = self._load_manifest(month)
+        if manifest is None or manifest['size'] != size:
+            manifest = self._build_manifest(month)
+            if persist:
+                self._write_manifest(month, manifest)
+
+        self._manifests[month] = (size, manifest)
+        return manifest
+
+    def iter_lines(self, month: str) -> Iterator[str]:
+        """Linhas de dados do segmento, em streaming (descomprimindo se preciso)"""
+        with self._open(self.segment_path(month), 'rt') as f:
+            for line in f:
+                if line.strip() and not line.startswith('#'):
+                    yield line
+
+    def iter_histories(self, month: str, record_type=GameHistory) -> Iterator[GameHistory]:
+        for line in self.iter_lines(month):
+            try:
+                yield record_type.from_file_format(line)
+            except Exception:
+                continue  # Ignora linhas inválidas
+
+    def tail_histories(self, month: str, count: int) -> List[GameHistory]:
+        """Últimas `count` partidas válidas do segmento (mais antiga primeiro)"""
+        if count <= 0:
+            return []
+        return list(deque(self.iter_histories(month), maxlen=count))
+
+    def summary(self, player_name: str = None, persist: bool = True) -> List[Dict[str, Any]]:
+        """Agregados de cada segmento (geral ou do jogador), em ordem cronológica"""
+        key = player_name.strip().casefold() if player_name else None
+        summaries = []
+        for month in self.months():
+            manifest = self.manifest(month, persist)
+            counters = manifest['players'].get(key) if key else manifest
+            if counters:
+                summaries.append(counters)
+        return summaries
+
+    # ==================== Arquivamento ====================
+
+    def archive(self, lines: Iterator[Tuple[str, bytes]], hot_inode: int):
+        """
+        Anexa linhas (mês, linha) aos segmentos e atualiza os manifestos
+
+        O tamanho anterior de cada segmento tocado é registrado no diário
+        antes da escrita; finish_archive() deve ser chamado depois que o
+        arquivo quente for substituído.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        handles = {}
+        manifests = {}
+
+        with open(self.journal_path, 'w', encoding='utf-8') as journal:
+            journal.write(f"{hot_inode}\n")
+
+            try:
+                for month, raw in lines:
+                    handle = handles.get(month)
+                    if handle is None:
+                        path = self.segment_path(month)
+                        size = os.path.getsize(path) if os.path.exists(path) else 0
+                        manifests[month] = self.manifest(month) if size else self._empty_manifest()
+
+                        journal.write(f"{month}|{size}\n")
+                        journal.flush()
+                        os.fsync(journal.fileno())
+                        handle = handles[month] = self._open_append(path)
+
+                    handle[1].write(raw)
+                    self._apply_line(manifests[month], raw)
+            finally:
+                for raw_file, writer in handles.values():
+                    writer.close()
+                    raw_file.flush()
+                    os.fsync(raw_file.fileno())
+                    raw_file.close()
+
+        for month, manifest in manifests.items():
+            manifest['size'] = os.path.getsize(self.segment_path(month))
+            self._write_manifest(month, manifest)
+            self._manifests[month] = (manifest['size'], manifest)
+
+    def finish_archive(self):
+        """Conclui o arquivamento (o arquivo quente já foi substituído)"""
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+
+    def recover(self, hot_inode: int):
+        """Desfaz um arquivamento (ou compressão) interrompido"""
+        self._drop_compressed_duplicates()
+
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                journal_inode = f.readline().strip()
+                entries = [line.rstrip('\n').partition('|') for line in f]
+        except OSError:
+            return
+
+        if journal_inode == str(hot_inode):
+            # O arquivo quente ainda tem as linhas: remove as cópias
+            for month, _, size in entries:
+                if not size:
+                    continue
+                path = self.segment_path(month)
+                if os.path.exists(path):
+                    with open(path, 'r+b') as seg:
+                        seg.truncate(int(size))
+                    if int(size) == 0:
+                        os.remove(path)
+                if os.path.exists(self.manifest_path(month)):
+                    os.remove(self.manifest_path(month))
+                self._manifests.pop(month, None)
+
+        self.finish_archive()
+
+    def compress_cold(self):
+        """Comprime os segmentos em texto com o codec atual"""
+        if self.codec is None:
+            return
+
+        for month in self.months():
+            plain = self.segment_path(month)
+            if not plain.endswith(self.CODECS[None]):
+                continue
+
+            manifest = self.manifest(month)
+            target = os.path.join(self.directory, month + self.CODECS[self.codec])
+            with open(plain, 'rb') as src, atomic_write(target) as dst:
+                writer = self._open_writer(dst, self.codec)
+                for raw in src:
+                    writer.write(raw)
+                writer.close()
+            os.remove(plain)
+
+            manifest['size'] = os.path.getsize(target)
+            self._write_manifest(month, manifest)
+            self._manifests[month] = (manifest['size'], manifest)
+
+    # ==================== Arquivos ====================
+
+    def _segment_files(self) -> Dict[str, str]:
+        #Mês -> nome do arquivo do segmento (qualquer codec)
+        if not os.path.isdir(self.directory):
+            return {}
+
+        files = {}
+        for name in os.listdir(self.directory):
+            if name.startswith('.'):
+                continue
+            for suffix in self.CODECS.values():
+                if name.endswith(suffix) and len(name) == 7 + len(suffix):
+                    files[name[:7]] = name
+        return files
+
+    @classmethod
+    def _codec_of(cls, path: str) -> Optional[str]:
+        for codec, suffix in cls.CODECS.items():
+            if codec and path.endswith(suffix):
+                return codec
+        return None
+
+    @classmethod
+    def _open(cls, path: str, mode: str = 'rb'):
+        #Abre o segmento para leitura conforme a extensão
+        encoding = 'utf-8' if 't' in mode else None
+        codec = cls._codec_of(path)
+        if codec == 'gzip':
+            return gzip.open(path, mode, encoding=encoding)
+        if codec == 'lzma':
+            return lzma.open(path, mode, encoding=encoding)
+        return open(path, mode, encoding=encoding)
+
+    @staticmethod
+    def _open_writer(raw_file, codec: Optional[str]):
+        #Escritor (comprimido ou não) sobre um arquivo binário já aberto
+        if codec == 'gzip':
+            return gzip.GzipFile(fileobj=raw_file, mode='wb', compresslevel=6)
+        if codec == 'lzma':
+            return lzma.LZMAFile(raw_file, 'wb')
+        return _Uncompressed(raw_file)
+
+    def _open_append(self, path: str):
+        #Anexo em um segmento: um novo membro/fluxo no fim do arquivo
+        raw_file = open(path, 'ab')
+        return raw_file, self._open_writer(raw_file, self._codec_of(path))
+
+    def _drop_compressed_duplicates(self):
+        #Compressão interrompida após a troca atômica: descarta a cópia em texto
+        for month in self.months():
+            plain = os.path.join(self.directory, month + self.CODECS[None])
+            if os.path.exists(plain) and any(
+                os.path.exists(os.path.join(self.directory, month + suffix))
+                for codec, suffix in self.CODECS.items() if codec
+            ):
+                os.remove(plain)
+
+    # ==================== Manifestos ====================
+
+    @staticmethod
+    def _empty_counters() -> Dict[str, Any]:
+        # best_attempts = -1: nenhuma vitória; best guarda a linha da vitória
+        return {'total_games': 0, 'wins': 0, 'losses': 0,
+                'attempts_sum': 0, 'duration_sum': 0,
+                'best_attempts': -1, 'best': None}
+
+    def _empty_manifest(self) -> Dict[str, Any]:
+        manifest = self._empty_counters()
+        manifest.update({'size': 0, 'min_date': None, 'max_date': None, 'players': {}})
+        return manifest
+
+    def _apply_line(self, manifest: Dict[str, Any], raw: bytes):
+        line = raw.decode('utf-8', errors='replace')
+        try:
+            history = GameHistory.from_file_format(line)
+        except Exception:
+            return  # Ignora linhas inválidas
+
+        if manifest['min_date'] is None or history.date < manifest['min_date']:
+            manifest['min_date'] = history.date
+        if manifest['max_date'] is None or history.date > manifest['max_date']:
+            manifest['max_date'] = history.date
+
+        key = history.player_name.strip().casefold()
+        player = manifest['players'].get(key)
+        if player is None:
+            player = manifest['players'][key] = self._empty_counters()
+
+        for counters in (manifest, player):
+            counters['total_games'] += 1
+            counters['attempts_sum'] += history.attempts_used
+            counters['duration_sum'] += history.duration_seconds
+
+            if history.result == 'WIN':
+                counters['wins'] += 1
+                # Empate mantém a vitória mais antiga
+                if counters['best_attempts'] < 0 or history.attempts_used < counters['best_attempts']:
+                    counters['best_attempts'] = history.attempts_used
+                    counters['best'] = line.rstrip('\n')
+            elif history.result == 'LOSS':
+                counters['losses'] += 1
+
+    def _build_manifest(self, month: str) -> Dict[str, Any]:
+        #Recalcula o manifesto varrendo o segmento
+        manifest = self._empty_manifest()
+        with self._open(self.segment_path(month)) as f:
+            for raw in f:
+                if raw.strip() and not raw.startswith(b'#'):
+                    self._apply_line(manifest, raw)
+        manifest['size'] = os.path.getsize(self.segment_path(month))
+        return manifest
+
+    def _load_manifest(self, month: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.manifest_path(month), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_manifest(self, month: str, manifest: Dict[str, Any]):
+        with atomic_write(self.manifest_path(month), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, separators=(',', ':'))
+
+
+class _Uncompressed:
+    """Escritor sem compressão com a mesma interface dos escritores gzip/lzma"""
+
+    def __init__(self, raw_file):
+        self._raw_file = raw_file
+
+    def write(self, data: bytes) -> int:
+        return self._raw_file.write(data)
+
+    def close(self):
+        pass  # O arquivo subjacente é fechado por quem o abriu
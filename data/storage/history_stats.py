@@ -0,0 +1,187 @@
+
+import json
+import os
+from typing import Any, Dict, Optional
+
+from domain.entities import GameHistory
+from data.storage.file_lock import atomic_write
+
+class HistoryStatsStore:
+    """
+    Agregados incrementais do histórico (geral e por jogador)
+
+    Mantém contagens e somas em memória, atualizadas a cada partida salva.
+    Um checkpoint em `<historico>.stats` (JSON) registra o byte do histórico
+    até onde os agregados valem; ao reiniciar, apenas o final do arquivo é
+    reprocessado. A melhor vitória é guardada pelo offset da linha.
+    """
+
+    # Grava o checkpoint a cada N partidas aplicadas
+    CHECKPOINT_INTERVAL = 100
+
+    def __init__(self, history_path: str):
+        self.history_path = history_path
+        self.stats_path = f"{history_path}.stats"
+        self._global: Dict[str, int] = self._empty()
+        self._players: Dict[str, Dict[str, int]] = {}
+        self._covered = 0
+        self._inode: Optional[int] = None
+        self._since_checkpoint = 0
+
+    @staticmethod
+    def _empty() -> Dict[str, int]:
+        # best_attempts/best_offset = -1: nenhuma vitória
+        return {'total_games': 0, 'wins': 0, 'losses': 0,
+                'attempts_sum': 0, 'duration_sum': 0,
+                'best_attempts': -1, 'best_offset': -1}
+
+    def summary(self, player_name: str = None) -> Dict[str, Any]:
+        """Agregados no formato de IHistoryRepository.get_summary (O(1))"""
+        self.sync()
+
+        if player_name:
+            counters = self._players.get(player_name.strip().casefold(), self._empty())
+        else:
+            counters = self._global
+
+        return {
+            'total_games': counters['total_games'],
+            'wins': counters['wins'],
+            'losses': counters['losses'],
+            'attempts_sum': counters['attempts_sum'],
+            'duration_sum': counters['duration_sum'],
+            'best': self._read_record(counters['best_offset'])
+        }
+
+    def record(self, history: GameHistory, offset: int, end: int):
+        """Aplica uma partida recém-anexada ao histórico"""
+        if self._inode is None or offset != self._covered:
+            return  # Será aplicada pelo próximo sync()
+
+        self._apply(history, offset)
+        self._covered = end
+        self._maybe_checkpoint()
+
+    def sync(self):
+        """Garante que os agregados cobrem todo o histórico"""
+        st = os.stat(self.history_path)
+
+        if self._inode != st.st_ino or st.st_size < self._covered:
+            if not self._load(st.st_ino, st.st_size):
+                self._reset(st.st_ino)
+
+        if st.st_size > self._covered:
+            self._replay_tail()
+
+    def is_current(self) -> bool:
+        """Indica se a memória já cobre todo o histórico (sync não gravaria nada)"""
+        st = os.stat(self.history_path)
+        return self._inode == st.st_ino and self._covered == st.st_size
+
+    def checkpoint(self):
+        """Persiste os agregados e o byte coberto (escrita atômica)"""
+        if self._inode is None:
+            return
+
+        state = {
+            'ino': self._inode,
+            'covered': self._covered,
+            'global': self._global,
+            'players': self._players
+        }
+
+        with atomic_write(self.stats_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False, separators=(',', ':'))
+
+        self._since_checkpoint = 0
+
+    def invalidate(self):
+        """Descarta os agregados em memória (ex.: histórico reescrito)"""
+        self._reset(None)
+
+    # ==================== Interno ====================
+
+    def _reset(self, inode: Optional[int]):
+        self._global = self._empty()
+        self._players = {}
+        self._covered = 0
+        self._inode = inode
+        self._since_checkpoint = 0
+
+    def _apply(self, history: GameHistory, offset: int):
+        key = history.player_name.strip().casefold()
+        player = self._players.get(key)
+        if player is None:
+            player = self._players[key] = self._empty()
+
+        won = history.result == 'WIN'
+        for counters in (self._global, player):
+            counters['total_games'] += 1
+            counters['attempts_sum'] += history.attempts_used
+            counters['duration_sum'] += history.duration_seconds
+
+            if won:
+                counters['wins'] += 1
+                # Empate mantém a vitória mais antiga
+                if counters['best_attempts'] < 0 or history.attempts_used < counters['best_attempts']:
+                    counters['best_attempts'] = history.attempts_used
+                    counters['best_offset'] = offset
+            elif history.result == 'LOSS':
+                counters['losses'] += 1
+
+        self._since_checkpoint += 1
+
+    def _maybe_checkpoint(self):
+        if self._since_checkpoint >= self.CHECKPOINT_INTERVAL:
+            self.checkpoint()
+
+    def _load(self, inode: int, size: int) -> bool:
+        #Carrega o checkpoint; retorna False se ausente ou inválido
+        try:
+            with open(self.stats_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        if state.get('ino') != inode or state.get('covered', 0) > size:
+            return False
+
+        self._global = state['global']
+        self._players = state['players']
+        self._covered = state['covered']
+        self._inode = inode
+        self._since_checkpoint = 0
+        return True
+
+    def _replay_tail(self):
+        #Aplica as linhas do histórico após o checkpoint
+        with open(self.history_path, 'rb') as f:
+            f.seek(self._covered)
+            offset = self._covered
+
+            for raw in f:
+                if not raw.endswith(b'\n'):
+                    break  # Linha ainda sendo escrita
+
+                line = raw.decode('utf-8', errors='replace')
+                if line.strip() and not line.startswith('#'):
+                    try:
+                        self._apply(GameHistory.from_file_format(line), offset)
+                    except Exception:
+                        pass  # Ignora linhas inválidas
+
+                offset += len(raw)
+
+        self._covered = offset
+        self._maybe_checkpoint()
+
+    def _read_record(self, offset: int) -> Optional[GameHistory]:
+        if offset < 0:
+            return None
+
+        try:
+            with open(self.history_path, 'rb') as f:
+                f.seek(offset)
+                return GameHistory.from_file_format(f.readline().decode('utf-8'))
+        except Exception:
+            return None
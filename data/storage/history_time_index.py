@@ -0,0 +1,105 @@
+
+import os
+from array import array
+from bisect import bisect_left
+from typing import List, Optional
+
+from domain.entities import GameHistory
+from domain.entities.game_history import date_to_epoch, to_epoch
+
+class HistoryTimeIndex:
+    """
+    Índice de tempo do histórico em memória: data (segundos) -> offset
+
+    O histórico é append-only e normalmente já está em ordem cronológica;
+    nesse caso consultas por intervalo são duas buscas binárias. Se alguma
+    linha vier fora de ordem, uma permutação ordenada é montada uma vez e
+    mantida até a próxima linha nova. Linhas anexadas por outros processos
+    são indexadas a partir do último byte coberto.
+    """
+
+    def __init__(self, history_path: str):
+        self.history_path = history_path
+        self._epochs = array('q')
+        self._offsets = array('Q')
+        self._covered = 0
+        self._inode: Optional[int] = None
+        self.is_sorted = True
+        self._order: Optional[tuple] = None  # (posições, datas) em ordem cronológica
+
+    def offsets_between(self, start: int = None, end: int = None) -> List[int]:
+        """Offsets das linhas com data em [start, end), em ordem cronológica"""
+        self.sync()
+
+        if self.is_sorted:
+            epochs, positions = self._epochs, None
+        else:
+            if self._order is None:
+                order = sorted(range(len(self._epochs)), key=self._epochs.__getitem__)
+                self._order = (order, array('q', (self._epochs[i] for i in order)))
+            positions, epochs = self._order
+
+        low = bisect_left(epochs, start) if start is not None else 0
+        high = bisect_left(epochs, end) if end is not None else len(epochs)
+        if positions is None:
+            return self._offsets[low:high].tolist()
+        return [self._offsets[i] for i in positions[low:high]]
+
+    def record(self, history: GameHistory, offset: int, end: int):
+        """Registra uma linha recém-anexada ao histórico"""
+        if self._inode is None or offset != self._covered:
+            return  # Será indexada pelo próximo sync()
+
+        timestamp = history.timestamp
+        if timestamp is not None:  # Data inválida: fica fora de qualquer intervalo (get_all ainda a retorna)
+            self._add(to_epoch(timestamp), offset)
+        self._covered = end
+
+    def sync(self):
+        """Garante que o índice cobre todo o histórico"""
+        st = os.stat(self.history_path)
+
+        if self._inode != st.st_ino or st.st_size < self._covered:
+            self.invalidate()
+            self._inode = st.st_ino
+
+        if st.st_size > self._covered:
+            self._index_tail()
+
+    def invalidate(self):
+        """Descarta o índice (ex.: histórico reescrito)"""
+        self._epochs = array('q')
+        self._offsets = array('Q')
+        self._covered = 0
+        self._inode = None
+        self.is_sorted = True
+        self._order = None
+
+    # ==================== Interno ====================
+
+    def _add(self, epoch: int, offset: int):
+        if self._epochs and epoch < self._epochs[-1]:
+            self.is_sorted = False
+        self._order = None
+        self._epochs.append(epoch)
+        self._offsets.append(offset)
+
+    def _index_tail(self):
+        #Indexa as linhas posteriores ao último byte coberto
+        with open(self.history_path, 'rb') as f:
+            f.seek(self._covered)
+            offset = self._covered
+
+            for raw in f:
+                if not raw.endswith(b'\n'):
+                    break  # Linha ainda sendo escrita
+
+                if raw.strip() and not raw.startswith(b'#') and raw.count(b'|') == 5:
+                    try:
+                        self._add(date_to_epoch(raw[:raw.index(b'|')].decode('ascii')), offset)
+                    except ValueError:
+                        pass  # Data inválida: fica fora de qualquer intervalo (get_all ainda a retorna)
+
+                offset += len(raw)
+
+        self._covered = offset
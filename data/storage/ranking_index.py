@@ -0,0 +1,69 @@
+
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Tuple
+
+from domain.entities import Player
+
+class RankingIndex:
+    """
+    Ranking mantido ordenado em memória
+
+    Guarda a chave de ordenação de cada jogador (Player.ranking_key) em
+    uma lista ordenada. Cada resultado atualiza só o jogador afetado
+    (busca binária para remover e reinserir), o top-K é uma fatia e a
+    posição de um jogador é uma busca binária. Jogadores sem partidas
+    ficam no ranking, mas não recebem posição; os nomes deles ficam em
+    uma lista ordenada à parte para descontá-los da posição.
+    """
+
+    def __init__(self):
+        self._keys: List[Tuple] = []
+        self._by_name: Dict[str, Tuple] = {}
+        self._idle: List[str] = []
+
+    def rebuild(self, players: Dict[str, Player]):
+        """Recria o ranking a partir do índice de jogadores (chave -> Player)"""
+        self._by_name = {name: player.ranking_key() for name, player in players.items()}
+        self._keys = sorted(self._by_name.values())
+        self._idle = sorted(name for name, player in players.items() if not player.total_games)
+
+    def update(self, name_key: str, player: Player):
+        """Reposiciona um jogador após alterar seu placar"""
+        self.remove(name_key)
+
+        key = player.ranking_key()
+        self._by_name[name_key] = key
+        insort(self._keys, key)
+        if not player.total_games:
+            insort(self._idle, name_key)
+
+    def remove(self, name_key: str):
+        key = self._by_name.pop(name_key, None)
+        if key is None:
+            return
+
+        del self._keys[bisect_left(self._keys, key)]
+        if self._is_idle(name_key):
+            del self._idle[bisect_left(self._idle, name_key)]
+
+    def top(self, limit: Optional[int] = None) -> List[str]:
+        """Chaves (nome case-folded) dos primeiros colocados"""
+        selected = self._keys[:limit] if limit else self._keys
+        return [key[-1] for key in selected]
+
+    def rank(self, name_key: str) -> Optional[int]:
+        """Posição (1 = primeiro) entre os jogadores com partidas, em O(log n)"""
+        key = self._by_name.get(name_key)
+        if key is None or self._is_idle(name_key):
+            return None
+
+        # Jogadores sem partidas só ficam à frente de quem tem zero vitórias
+        ahead_idle = bisect_left(self._idle, name_key) if key[0] == 0 else 0
+        return bisect_left(self._keys, key) - ahead_idle + 1
+
+    def _is_idle(self, name_key: str) -> bool:
+        position = bisect_left(self._idle, name_key)
+        return position < len(self._idle) and self._idle[position] == name_key
+
+    def __len__(self) -> int:
+        return len(self._keys)
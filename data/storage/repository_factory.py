@@ -0,0 +1,48 @@
+"""
+Fábrica dos repositórios do backend configurado
+Compartilhada pelos pontos de entrada (main.py e server.py)
+"""
+
+import os
+from typing import Optional, Tuple
+
+from data.repositories import IHistoryRepository, IPlayerRepository, IWordRepository
+from data.storage.file_history_repository import FileHistoryRepository
+from data.storage.file_player_repository import FilePlayerRepository
+from data.storage.file_word_repository import FileWordRepository
+from data.storage.sqlite_database import SQLiteDatabase
+from data.storage.sqlite_history_repository import SQLiteHistoryRepository
+from data.storage.sqlite_player_repository import SQLitePlayerRepository
+from data.storage.sqlite_word_repository import SQLiteWordRepository
+
+# Configuração do backend de persistência
+# HANGMAN_STORAGE: "file" (padrão, assets/*.txt) ou "sqlite"
+# HANGMAN_DB_PATH: caminho do banco quando HANGMAN_STORAGE=sqlite
+STORAGE_BACKEND = os.environ.get("HANGMAN_STORAGE", "file").lower()
+DB_PATH = os.environ.get("HANGMAN_DB_PATH", "assets/hangman.db")
+
+
+def create_repositories(backend: Optional[str] = None, db_path: Optional[str] = None
+                        ) -> Tuple[IWordRepository, IPlayerRepository, IHistoryRepository]:
+    """
+    Instancia os repositórios do backend configurado
+    
+    Args:
+        backend: "file" ou "sqlite" (None = HANGMAN_STORAGE)
+        db_path: Caminho do banco SQLite (None = HANGMAN_DB_PATH)
+    
+    Returns:
+        (repositório de palavras, de jogadores, de histórico)
+    
+    Raises:
+        ValueError: Se o backend for desconhecido
+    """
+    backend = backend or STORAGE_BACKEND
+    if backend == "sqlite":
+        database = SQLiteDatabase(db_path or DB_PATH)
+        return (SQLiteWordRepository(database), SQLitePlayerRepository(database),
+                SQLiteHistoryRepository(database))
+    if backend == "file":
+        return (FileWordRepository("assets/words.txt"), FilePlayerRepository("assets/scoreboard.txt"),
+                FileHistoryRepository("assets/history.txt"))
+    raise ValueError(f"Backend de armazenamento desconhecido: {backend}")
@@ -0,0 +1,79 @@
+
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+class SQLiteDatabase:
+    """
+    Conexão SQLite compartilhada pelos repositórios SQL
+
+    Usa WAL (leitores não bloqueiam o escritor) e uma única conexão
+    protegida por lock, pois o jogo persiste a partir de threads.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS words (
+            word TEXT PRIMARY KEY
+        );
+
+        CREATE TABLE IF NOT EXISTS players (
+            name_key TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            wins INTEGER NOT NULL DEFAULT 0,
+            losses INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS idx_players_ranking
+            ON players (wins DESC, losses ASC);
+
+        CREATE TABLE IF NOT EXISTS history (
+            id INTEGER PRIMARY KEY,
+            date TEXT NOT NULL,
+            player_name TEXT NOT NULL,
+            player_key TEXT NOT NULL,
+            word TEXT NOT NULL,
+            result TEXT NOT NULL,
+            attempts_used INTEGER NOT NULL,
+            duration_seconds INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_history_player
+            ON history (player_key, id);
+        CREATE INDEX IF NOT EXISTS idx_history_result
+            ON history (result, attempts_used);
+        CREATE INDEX IF NOT EXISTS idx_history_date
+            ON history (date);
+
+        CREATE TABLE IF NOT EXISTS migration_progress (
+            source TEXT PRIMARY KEY,
+            lines INTEGER NOT NULL
+        );
+    """
+
+    def __init__(self, db_path: str = "assets/hangman.db"):
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self.connection = sqlite3.connect(db_path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(self.SCHEMA)
+
+    @contextmanager
+    def cursor(self):
+        """Cursor exclusivo dentro de uma transação (commit/rollback automático)"""
+        with self._lock:
+            with self.connection:
+                yield self.connection.cursor()
+
+    def data_version(self) -> tuple:
+        """Muda a cada commit: desta conexão (total_changes) ou de outras (PRAGMA data_version)"""
+        with self._lock:
+            version = self.connection.execute("PRAGMA data_version").fetchone()[0]
+            return version, self.connection.total_changes
+
+    def close(self):
+        with self._lock:
+            self.connection.close()
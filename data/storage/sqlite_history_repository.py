@@ -0,0 +1,160 @@
+
+import sys
+from datetime import datetime
+from typing import Any, Dict, List
+from domain.entities import GameHistory
+from domain.entities.game_history import DATE_FORMAT
+from data.repositories import IHistoryRepository
+from data.storage.sqlite_database import SQLiteDatabase
+
+class SQLiteHistoryRepository(IHistoryRepository):
+    """Repositório de histórico em SQLite (filtros e agregados no banco)"""
+
+    COLUMNS = "date, player_name, word, result, attempts_used, duration_seconds"
+
+    def __init__(self, database: SQLiteDatabase):
+        self.database = database
+
+    def get_all(self) -> List[GameHistory]:
+        #Lê todo o histórico na ordem de inserção
+        try:
+            with self.database.cursor() as cur:
+                rows = cur.execute(
+                    f"SELECT {self.COLUMNS} FROM history ORDER BY id"
+                ).fetchall()
+            return [self._to_history(row) for row in rows]
+        except Exception as e:
+            print(f"Erro ao ler histórico: {e}")
+            return []
+
+    def save(self, history: GameHistory) -> bool:
+        #Adiciona registro ao histórico
+        try:
+            with self.database.cursor() as cur:
+                cur.execute(
+                    f"INSERT INTO history ({self.COLUMNS}, player_key) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    self._to_row(history)
+                )
+            return True
+        except Exception as e:
+            print(f"Erro ao salvar histórico: {e}")
+            return False
+
+    def save_many(self, histories: List[GameHistory]) -> bool:
+        #Insere vários registros em uma única transação
+        try:
+            with self.database.cursor() as cur:
+                cur.executemany(
+                    f"INSERT INTO history ({self.COLUMNS}, player_key) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [self._to_row(h) for h in histories]
+                )
+            return True
+        except Exception as e:
+            print(f"Erro ao salvar histórico: {e}")
+            return False
+
+    def get_recent(self, limit: int) -> List[GameHistory]:
+        #Últimos registros pela chave primária
+        try:
+            with self.database.cursor() as cur:
+                rows = cur.execute(
+                    f"SELECT {self.COLUMNS} FROM history ORDER BY id DESC LIMIT ?",
+                    (max(limit, 0),)
+                ).fetchall()
+            return [self._to_history(row) for row in rows]
+        except Exception as e:
+            print(f"Erro ao ler histórico: {e}")
+            return []
+
+    def get_by_player(self, player_name: str) -> List[GameHistory]:
+        #Usa o índice (player_key, id)
+        try:
+            with self.database.cursor() as cur:
+                rows = cur.execute(
+                    f"SELECT {self.COLUMNS} FROM history WHERE player_key = ? ORDER BY id",
+                    (player_name.strip().casefold(),)
+                ).fetchall()
+            return [self._to_history(row) for row in rows]
+        except Exception as e:
+            print(f"Erro ao ler histórico: {e}")
+            return []
+
+    def get_between(self, start: datetime = None, end: datetime = None) -> List[GameHistory]:
+        #Intervalo pelo índice em date (o formato fixo ordena como texto)
+        conditions, params = [], []
+        if start is not None:
+            conditions.append("date >= ?")
+            params.append(start.strftime(DATE_FORMAT))
+        if end is not None:
+            conditions.append("date < ?")
+            params.append(end.strftime(DATE_FORMAT))
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        try:
+            with self.database.cursor() as cur:
+                rows = cur.execute(
+                    f"SELECT {self.COLUMNS} FROM history {where} ORDER BY date, id",
+                    params
+                ).fetchall()
+            return [self._to_history(row) for row in rows]
+        except Exception as e:
+            print(f"Erro ao ler histórico: {e}")
+            return []
+
+    def get_summary(self, player_name: str = None) -> Dict[str, Any]:
+        #Agregados calculados pelo banco
+        where, params = ("WHERE player_key = ?", (player_name.strip().casefold(),)) if player_name else ("", ())
+
+        try:
+            with self.database.cursor() as cur:
+                total, wins, losses, attempts, duration = cur.execute(
+                    f"""
+                    SELECT COUNT(*),
+                           COALESCE(SUM(result = 'WIN'), 0),
+                           COALESCE(SUM(result = 'LOSS'), 0),
+                           COALESCE(SUM(attempts_used), 0),
+                           COALESCE(SUM(duration_seconds), 0)
+                    FROM history {where}
+                    """,
+                    params
+                ).fetchone()
+
+                best_where = f"{where} AND result = 'WIN'" if where else "WHERE result = 'WIN'"
+                best = cur.execute(
+                    f"SELECT {self.COLUMNS} FROM history {best_where} "
+                    f"ORDER BY attempts_used, id LIMIT 1",
+                    params
+                ).fetchone()
+
+            return {
+                'total_games': total,
+                'wins': wins,
+                'losses': losses,
+                'attempts_sum': attempts,
+                'duration_sum': duration,
+                'best': self._to_history(best) if best else None
+            }
+        except Exception as e:
+            print(f"Erro ao ler histórico: {e}")
+            return super().get_summary(player_name)
+
+    def data_version(self) -> tuple:
+        return self.database.data_version()
+
+    @staticmethod
+    def _to_row(history: GameHistory) -> tuple:
+        return (history.date, history.player_name, history.word, history.result,
+                history.attempts_used, history.duration_seconds,
+                history.player_name.strip().casefold())
+
+    @staticmethod
+    def _to_history(row) -> GameHistory:
+        # Nomes, palavras e resultados repetidos compartilham a mesma string
+        return GameHistory(
+            date=row[0],
+            player_name=sys.intern(row[1]),
+            word=sys.intern(row[2]),
+            result=sys.intern(row[3]),
+            attempts_used=row[4],
+            duration_seconds=row[5]
+        )
@@ -0,0 +1,154 @@
+"""
+Migração dos arquivos texto (assets/*.txt) para SQLite
+
+Lê cada arquivo em streaming e grava em lotes (chunk_size linhas por
+transação), sem carregar o arquivo inteiro em memória (o placar, já indexado em
+memória pelo FilePlayerRepository, inclui os deltas do log). Pode ser
+executada de novo: palavras e jogadores são upserts e o histórico
+retoma da última linha importada (migration_progress).
+
+Uso:
+    python -m data.storage.sqlite_migration [--assets assets] [--db assets/hangman.db]
+"""
+
+import argparse
+import os
+from itertools import islice
+from typing import Callable, Dict, Iterator, Optional
+
+from domain.entities import GameHistory
+from data.storage.file_player_repository import FilePlayerRepository
+from data.storage.sqlite_database import SQLiteDatabase
+from data.storage.text_streams import chunks, data_lines, history_lines
+
+
+def _parse_word(line: str) -> Optional[tuple]:
+    word = line.strip().upper()
+    return (word,) if word.isalpha() else None
+
+
+def _parse_history(line: str) -> Optional[tuple]:
+    try:
+        h = GameHistory.from_file_format(line)
+    except Exception:
+        return None
+    return (h.date, h.player_name, h.player_name.strip().casefold(), h.word,
+            h.result, h.attempts_used, h.duration_seconds)
+
+
+def _import_file(database: SQLiteDatabase, path: str, sql: str,
+                 parse: Callable[[str], Optional[tuple]], chunk_size: int,
+                 read_lines: Callable[[str], Iterator[str]] = data_lines,
+                 progress_key: Optional[str] = None) -> int:
+    #Importa um arquivo em lotes; retorna o número de registros gravados
+    if not os.path.exists(path):
+        return 0
+
+    lines = read_lines(path)
+    done = 0
+    if progress_key is not None:
+        # Fonte só recebe linhas no final (segmentos em ordem + arquivo quente):
+        # as já importadas são sempre as primeiras
+        with database.cursor() as cur:
+            row = cur.execute(
+                "SELECT lines FROM migration_progress WHERE source = ?", (progress_key,)
+            ).fetchone()
+        done = row[0] if row else 0
+        lines = islice(lines, done, None)
+
+    imported = 0
+    for chunk in chunks(lines, chunk_size):
+        rows = [row for row in map(parse, chunk) if row is not None]
+        done += len(chunk)
+        with database.cursor() as cur:
+            cur.executemany(sql, rows)
+            if progress_key is not None:
+                # Mesma transação do lote: interrupção não duplica nem perde linhas
+                cur.execute(
+                    "INSERT INTO migration_progress (source, lines) VALUES (?, ?) "
+                    "ON CONFLICT(source) DO UPDATE SET lines = excluded.lines",
+                    (progress_key, done)
+                )
+        imported += len(rows)
+
+    return imported
+
+
+def _import_players(database: SQLiteDatabase, path: str, chunk_size: int) -> int:
+    #Importa o placar já com os deltas do scoreboard.txt.log aplicados
+    if not os.path.exists(path):
+        return 0
+
+    # O repositório aplica o log sobre o snapshot (e ignora log já compactado)
+    players = FilePlayerRepository(path, use_delta_log=True).get_all()
+    rows = ((p.name.strip().casefold(), p.name.strip(), p.wins, p.losses) for p in players)
+
+    imported = 0
+    for chunk in chunks(rows, chunk_size):
+        with database.cursor() as cur:
+            cur.executemany(
+                """
+                INSERT INTO players (name_key, name, wins, losses) VALUES (?, ?, ?, ?)
+                ON CONFLICT(name_key) DO UPDATE SET
+                    name = excluded.name, wins = excluded.wins, losses = excluded.losses
+                """,
+                chunk
+            )
+        imported += len(chunk)
+
+    return imported
+
+
+def migrate(assets_dir: str = "assets", db_path: str = "assets/hangman.db",
+            chunk_size: int = 10000) -> Dict[str, int]:
+    """
+    Importa words.txt, scoreboard.txt e history.txt para o banco SQLite
+
+    Args:
+        assets_dir: Diretório com os arquivos texto
+        db_path: Caminho do banco de destino
+        chunk_size: Linhas por transação
+
+    Returns:
+        Dicionário com a quantidade de registros importados por tabela
+    """
+    database = SQLiteDatabase(db_path)
+
+    try:
+        return {
+            'words': _import_file(
+                database, os.path.join(assets_dir, "words.txt"),
+                "INSERT OR IGNORE INTO words (word) VALUES (?)",
+                _parse_word, chunk_size
+            ),
+            'players': _import_players(
+                database, os.path.join(assets_dir, "scoreboard.txt"), chunk_size
+            ),
+            'history': _import_file(
+                database, os.path.join(assets_dir, "history.txt"),
+                """
+                INSERT INTO history (date, player_name, player_key, word, result,
+                                     attempts_used, duration_seconds)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                _parse_history, chunk_size, history_lines, progress_key='history'
+            ),
+        }
+    finally:
+        database.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Migra assets/*.txt para SQLite")
+    parser.add_argument("--assets", default="assets", help="diretório dos arquivos texto")
+    parser.add_argument("--db", default="assets/hangman.db", help="banco SQLite de destino")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="linhas por transação")
+    args = parser.parse_args()
+
+    counts = migrate(args.assets, args.db, args.chunk_size)
+    for table, count in counts.items():
+        print(f"{table}: {count} registros importados")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+
+from typing import List, Optional, Tuple
+from domain.entities import Player
+from data.repositories import IPlayerRepository
+from data.storage.sqlite_database import SQLiteDatabase
+
+class SQLitePlayerRepository(IPlayerRepository):
+    """Repositório de jogadores em SQLite (ranking calculado no banco)"""
+
+    # Taxa de vitória calculada no banco (0.0 sem partidas)
+    RATE = "(CASE WHEN wins + losses = 0 THEN 0.0 ELSE CAST(wins AS REAL) / (wins + losses) END)"
+
+    # Mesma ordem do ranking em arquivo (Player.ranking_key): vitórias,
+    # taxa de vitória e, no empate, o nome
+    RANKING_ORDER = f"ORDER BY wins DESC, {RATE} DESC, name_key ASC"
+
+    def __init__(self, database: SQLiteDatabase):
+        self.database = database
+
+    def get_all(self) -> List[Player]:
+        #Lê todos os jogadores
+        try:
+            with self.database.cursor() as cur:
+                rows = cur.execute(
+                    "SELECT name, wins, losses FROM players ORDER BY rowid"
+                ).fetchall()
+            return [Player(name=n, wins=w, losses=l) for n, w, l in rows]
+        except Exception as e:
+            print(f"Erro ao ler jogadores: {e}")
+            return []
+
+    def get_by_name(self, name: str) -> Optional[Player]:
+        #Busca jogador pela chave primária (nome case-folded)
+        try:
+            with self.database.cursor() as cur:
+                row = cur.execute(
+                    "SELECT name, wins, losses FROM players WHERE name_key = ?",
+                    (name.strip().casefold(),)
+                ).fetchone()
+            return Player(name=row[0], wins=row[1], losses=row[2]) if row else None
+        except Exception as e:
+            print(f"Erro ao ler jogadores: {e}")
+            return None
+
+    def save(self, player: Player) -> bool:
+        #Salva ou atualiza jogador (upsert)
+        try:
+            with self.database.cursor() as cur:
+                cur.execute(
+                    """
+                    INSERT INTO players (name_key, name, wins, losses)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(name_key) DO UPDATE SET
+                        name = excluded.name,
+                        wins = excluded.wins,
+                        losses = excluded.losses
+                    """,
+                    (player.name.strip().casefold(), player.name.strip(), player.wins, player.losses)
+                )
+            return True
+        except Exception as e:
+            print(f"Erro ao salvar jogador: {e}")
+            return False
+
+    def save_game_result(self, player_name: str, won: bool) -> bool:
+        #Incrementa o resultado no próprio banco (sem ler antes)
+        return self.save_game_results([(player_name, won)])
+
+    def save_game_results(self, results: List[Tuple[str, bool]]) -> bool:
+        #Incrementa um lote de resultados em uma única transação
+        try:
+            with self.database.cursor() as cur:
+                cur.executemany(
+                    """
+                    INSERT INTO players (name_key, name, wins, losses)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(name_key) DO UPDATE SET
+                        wins = wins + excluded.wins,
+                        losses = losses + excluded.losses
+                    """,
+                    [(name.strip().casefold(), name.strip(), 1 if won else 0, 0 if won else 1)
+                     for name, won in results]
+                )
+            return True
+        except Exception as e:
+            print(f"Erro ao salvar jogador: {e}")
+            return False
+
+    def get_ranking(self, limit: Optional[int] = None) -> List[Player]:
+        #Ranking ordenado e limitado pelo banco
+        try:
+            with self.database.cursor() as cur:
+                rows = cur.execute(
+                    f"SELECT name, wins, losses FROM players {self.RANKING_ORDER} LIMIT ?",
+                    (limit if limit else -1,)
+                ).fetchall()
+            return [Player(name=n, wins=w, losses=l) for n, w, l in rows]
+        except Exception as e:
+            print(f"Erro ao ler jogadores: {e}")
+            return []
+
+    def data_version(self) -> tuple:
+        return self.database.data_version()
+
+    def get_rank(self, name: str) -> Optional[int]:
+        #Posição = 1 + jogadores ativos à frente na ordem do ranking
+        try:
+            with self.database.cursor() as cur:
+                row = cur.execute(
+                    "SELECT wins, losses, name_key FROM players WHERE name_key = ?",
+                    (name.strip().casefold(),)
+                ).fetchone()
+                if row is None or row[0] + row[1] == 0:
+                    return None
+
+                wins, losses, key = row
+                rate = wins / (wins + losses)
+                ahead = cur.execute(
+                    f"""
+                    SELECT COUNT(*) FROM players
+                    WHERE wins + losses > 0 AND (
+                        wins > ?
+                        OR (wins = ? AND {self.RATE} > ?)
+                        OR (wins = ? AND {self.RATE} = ? AND name_key < ?)
+                    )
+                    """,
+                    (wins, wins, rate, wins, rate, key)
+                ).fetchone()[0]
+            return ahead + 1
+        except Exception as e:
+            print(f"Erro ao ler jogadores: {e}")
+            return None
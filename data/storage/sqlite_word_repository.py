@@ -0,0 +1,62 @@
+
+from typing import List, Optional
+from data.repositories import IWordRepository
+from data.storage.sqlite_database import SQLiteDatabase
+
+class SQLiteWordRepository(IWordRepository):
+    """Repositório de palavras em SQLite"""
+
+    def __init__(self, database: SQLiteDatabase):
+        self.database = database
+
+    def get_all(self) -> List[str]:
+        #Lê todas as palavras da tabela
+        try:
+            with self.database.cursor() as cur:
+                rows = cur.execute("SELECT word FROM words ORDER BY rowid").fetchall()
+            return [row[0] for row in rows]
+        except Exception as e:
+            print(f"Erro ao ler palavras: {e}")
+            return []
+
+    def add_word(self, word: str) -> bool:
+        #Adiciona nova palavra (a chave primária garante unicidade)
+        try:
+            word = word.strip().upper()
+            if not word or not word.isalpha():
+                return False
+
+            with self.database.cursor() as cur:
+                cur.execute("INSERT OR IGNORE INTO words (word) VALUES (?)", (word,))
+                return cur.rowcount == 1
+        except Exception as e:
+            print(f"Erro ao adicionar palavra: {e}")
+            return False
+
+    def contains(self, word: str) -> bool:
+        #Busca pela chave primária
+        try:
+            with self.database.cursor() as cur:
+                row = cur.execute(
+                    "SELECT 1 FROM words WHERE word = ?", (word.strip().upper(),)
+                ).fetchone()
+            return row is not None
+        except Exception as e:
+            print(f"Erro ao consultar palavra: {e}")
+            return False
+
+    def random_word(self) -> Optional[str]:
+        #Sorteia pelo rowid (busca na chave, sem ORDER BY RANDOM())
+        try:
+            with self.database.cursor() as cur:
+                row = cur.execute(
+                    """
+                    SELECT word FROM words
+                    WHERE rowid >= (abs(random()) % (SELECT max(rowid) FROM words)) + 1
+                    ORDER BY rowid LIMIT 1
+                    """
+                ).fetchone()
+            return row[0] if row else None
+        except Exception as e:
+            print(f"Erro ao sortear palavra: {e}")
+            return None
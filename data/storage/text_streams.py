@@ -0,0 +1,35 @@
+"""
+Leitura em streaming dos arquivos texto, compartilhada pelas conversões
+(migração para SQLite e histórico binário)
+"""
+
+from itertools import islice
+from typing import Iterable, Iterator, List
+
+from data.storage.history_segments import HistorySegments
+
+
+def data_lines(path: str) -> Iterator[str]:
+    """Linhas de dados do arquivo (ignora vazias e comentários)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip() and not line.startswith('#'):
+                yield line
+
+
+def history_lines(path: str) -> Iterator[str]:
+    """Linhas do histórico: segmentos mensais arquivados e depois o arquivo quente"""
+    segments = HistorySegments(path)
+    for month in segments.months():
+        yield from segments.iter_lines(month)
+    yield from data_lines(path)
+
+
+def chunks(items: Iterable, size: int) -> Iterator[List]:
+    """Agrupa os itens em listas de até `size` elementos"""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
@@ -0,0 +1,50 @@
+"""
+Importação em lote de palavras para o dicionário (words.txt)
+
+Lê a origem em streaming (arquivo ou stdin), normaliza, descarta
+duplicadas e grava as aceitas de uma vez no dicionário.
+
+Uso:
+    python -m data.storage.word_import lista.txt [--words assets/words.txt]
+    cat lista.txt | python -m data.storage.word_import -
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from data.storage.file_word_repository import FileWordRepository
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Importa palavras para o dicionário")
+    parser.add_argument("source", help="arquivo de origem (uma palavra por linha) ou - para stdin")
+    parser.add_argument("--words", default="assets/words.txt", help="dicionário de destino")
+    parser.add_argument("--min-length", type=int, default=3, help="tamanho mínimo da palavra")
+    parser.add_argument("--bloom", default=None,
+                        help="usa filtro de Bloom neste caminho (dicionários muito grandes)")
+    args = parser.parse_args()
+
+    repository = FileWordRepository(args.words, bloom_path=args.bloom)
+
+    started = time.perf_counter()
+    if args.source == "-":
+        counts = repository.import_words(sys.stdin, min_length=args.min_length)
+    else:
+        # Estimativa grosseira (~8 bytes por linha) para dimensionar o Bloom
+        expected = os.path.getsize(args.source) // 8
+        with open(args.source, 'r', encoding='utf-8', errors='replace') as source:
+            counts = repository.import_words(
+                source, min_length=args.min_length, expected_words=expected
+            )
+    elapsed = time.perf_counter() - started
+
+    rejected = counts['read'] - counts['accepted']
+    print(f"Lidas: {counts['read']} | Aceitas: {counts['accepted']} | Rejeitadas: {rejected} "
+          f"(inválidas: {counts['rejected_invalid']}, curtas: {counts['rejected_short']}, "
+          f"duplicadas: {counts['rejected_duplicate']}) em {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
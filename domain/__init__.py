@@ -14,6 +14,13 @@ from domain.entities.game_mode import GameMode
 from domain.use_cases.hangman_game_use_case import HangmanGameUseCase
 from domain.use_cases.scoreboard_use_case import ScoreboardUseCase
 from domain.use_cases.history_use_case import HistoryUseCase
+from domain.use_cases.async_use_case import AsyncUseCase
+
+# Exporta serviços
+from domain.services.game_result_writer import GameResultWriter
+from domain.services.history_columns import HistoryColumns
+from domain.services.async_executor import AsyncExecutor
+from domain.services.game_session_manager import GameSessionManager
 
 __all__ = [
     'Player',
@@ -23,4 +30,9 @@ __all__ = [
     'HangmanGameUseCase',
     'ScoreboardUseCase',
     'HistoryUseCase',
+    'AsyncUseCase',
+    'GameResultWriter',
+    'HistoryColumns',
+    'AsyncExecutor',
+    'GameSessionManager',
 ]
\ No newline at end of file
@@ -6,12 +6,13 @@ Contém todas as entidades do domínio
 
 from domain.entities.player import Player
 from domain.entities.game_state import GameState
-from domain.entities.game_history import GameHistory
+from domain.entities.game_history import GameHistory, LazyGameHistory
 from domain.entities.game_mode import GameMode
 
 __all__ = [
     'Player',
     'GameState',
     'GameHistory',
+    'LazyGameHistory',
     'GameMode',
 ]
\ No newline at end of file
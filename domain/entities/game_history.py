@@ -1,26 +1,93 @@
 
-from dataclasses import dataclass, field
-from datetime import datetime
-from typing import List
+import calendar
+import sys
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import List, Optional
 from .game_state import GameState
 
-@dataclass
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+def to_epoch(moment: datetime) -> int:
+    """Segundos do relógio de parede (sem fuso), comparáveis entre registros"""
+    return calendar.timegm(moment.timetuple())
+
+def from_epoch(epoch: int) -> datetime:
+    """Inverso de to_epoch (datetime sem fuso)"""
+    return datetime.fromtimestamp(epoch, timezone.utc).replace(tzinfo=None)
+
+@lru_cache(maxsize=4096)
+def _day_epoch(day: str) -> int:
+    # fromisoformat valida mês/dia, mas também aceita outras formas ISO
+    if len(day) != 10 or day[4] != '-' or day[7] != '-':
+        raise ValueError(f"Data inválida: {day!r}")
+    return to_epoch(datetime.fromisoformat(day))
+
+def date_to_epoch(date: str) -> int:
+    """
+    Converte a data gravada em segundos sem criar datetime (dia cacheado)
+
+    Levanta ValueError para o que strptime(DATE_FORMAT) também rejeitaria
+    (ex.: "2025-11-21 25:99:99")
+    """
+    clock = date[11:]
+    if (len(date) != 19 or date[10] != ' ' or clock[2] != ':' or clock[5] != ':'
+            or not (clock[:2] + clock[3:5] + clock[6:]).isdecimal()):
+        raise ValueError(f"Data inválida: {date!r}")
+
+    hours, minutes, seconds = int(clock[:2]), int(clock[3:5]), int(clock[6:])
+    if hours > 23 or minutes > 59 or seconds > 59:
+        raise ValueError(f"Data inválida: {date!r}")
+    return _day_epoch(date[:10]) + hours * 3600 + minutes * 60 + seconds
+
+def parse_date(date: str) -> Optional[datetime]:
+    """Converte a data gravada ("AAAA-MM-DD hh:mm:ss") em datetime; None se for inválida"""
+    try:
+        return from_epoch(date_to_epoch(date))
+    except (ValueError, TypeError, OverflowError):
+        return None
+
 class GameHistory:
-    """Representa um registro de partida no histórico"""
+    """
+    Representa um registro de partida no histórico
     
-    date: str
-    player_name: str
-    word: str
-    result: str
-    attempts_used: int
-    duration_seconds: int
-    timestamp: datetime = field(default_factory=datetime.now)
+    Classe com __slots__ (sem __dict__ por instância): históricos com
+    milhões de registros ficam bem menores em memória. O timestamp só é
+    guardado quando informado; caso contrário é calculado da data gravada
+    ao ser lido (None se a data gravada for inválida).
+    """
+    
+    __slots__ = ('date', 'player_name', 'word', 'result',
+                 'attempts_used', 'duration_seconds', '_timestamp')
+    
+    def __init__(self, date: str, player_name: str, word: str, result: str,
+                 attempts_used: int, duration_seconds: int,
+                 timestamp: Optional[datetime] = None):
+        self.date = date
+        self.player_name = player_name
+        self.word = word
+        self.result = result
+        self.attempts_used = attempts_used
+        self.duration_seconds = duration_seconds
+        self._timestamp = timestamp
+    
+    @property
+    def timestamp(self) -> Optional[datetime]:
+        # Sem timestamp explícito, usa a data gravada (não o momento da leitura);
+        # data malformada vira None e quem filtra por data ignora o registro
+        if self._timestamp is None:
+            return parse_date(self.date)
+        return self._timestamp
+    
+    @timestamp.setter
+    def timestamp(self, value: Optional[datetime]):
+        self._timestamp = value
     
     @classmethod
     def from_game_state(cls, game_state: GameState) -> 'GameHistory':
         """Factory method: cria histórico a partir do estado do jogo"""
         return cls(
-            date=game_state.start_time.strftime("%Y-%m-%d %H:%M:%S"),
+            date=game_state.start_time.strftime(DATE_FORMAT),
             player_name=game_state.player_name,
             word=game_state.word,
             result='WIN' if game_state.is_won else 'LOSS',
@@ -35,20 +102,33 @@ class GameHistory:
     
     @classmethod
     def from_file_format(cls, line: str) -> 'GameHistory':
-        """Cria objeto a partir de uma linha do arquivo"""
+        """
+        Cria objeto a partir de uma linha do arquivo
+        
+        Nome, palavra e resultado se repetem entre linhas: são internados
+        (sys.intern) para que os registros compartilhem a mesma string
+        """
         parts = line.strip().split('|')
         if len(parts) != 6:
             raise ValueError(f"Formato inválido: {line}")
         
         return cls(
             date=parts[0],
-            player_name=parts[1],
-            word=parts[2],
-            result=parts[3],
+            player_name=sys.intern(parts[1]),
+            word=sys.intern(parts[2]),
+            result=sys.intern(parts[3]),
             attempts_used=int(parts[4]),
             duration_seconds=int(parts[5])
         )
     
+    def is_victory(self) -> bool:
+        """Indica se a partida foi vencida"""
+        return self.result == 'WIN'
+    
+    def is_defeat(self) -> bool:
+        """Indica se a partida foi perdida"""
+        return self.result == 'LOSS'
+    
     # Métodos Mágicos
     def __str__(self) -> str:
         result_emoji = "✓" if self.result == 'WIN' else "✗"
@@ -68,3 +148,74 @@ class GameHistory:
     def __add__(self, other: 'GameHistory') -> List['GameHistory']:
         """Combina dois históricos em uma lista"""
         return [self, other]
+
+
+
+def _lazy_field(index: int, convert=None):
+    #Propriedade que lê o campo da linha; a partir da segunda leitura usa as partes guardadas
+    def getter(self):
+        parts = self._parts
+        if parts is None:
+            # Primeira leitura: split só até o campo, sem guardar nada (filtros de uma passada)
+            self._parts = False
+            value = self._line.split('|', index + 1)[index]
+        else:
+            if parts is False:
+                # Registro lido de novo: divide uma vez e guarda. Tupla de strings: o
+                # coletor de ciclos deixa de rastreá-la (uma lista pesava em get_all)
+                parts = self._parts = tuple(self._line.split('|'))
+            value = parts[index]
+        return convert(value) if convert else value
+    
+    def setter(self, value):
+        parts = self._line.split('|')
+        parts[index] = str(value)
+        self._parts = tuple(parts)
+        self._line = '|'.join(parts)
+    
+    return property(getter, setter)
+
+
+class LazyGameHistory(GameHistory):
+    """
+    GameHistory que guarda só a linha do arquivo e decodifica campos sob demanda
+    
+    A criação confere o número de separadores e se os dois campos inteiros
+    são válidos (mesmas linhas que GameHistory rejeita). A primeira leitura de
+    campo divide a linha só até ele, sem guardar nada: filtros de uma
+    passada sobre um campo (ex.: result) não pagam pelos demais nem por
+    memória extra. A partir da segunda leitura a linha é dividida uma vez
+    e as partes ficam guardadas, então leituras repetidas não a dividem
+    de novo. Inteiros são convertidos só quando lidos.
+    """
+    
+    __slots__ = ('_line', '_parts')
+    
+    def __init__(self, line: str):
+        self._line = line
+        self._parts = None
+        self._timestamp = None
+    
+    @classmethod
+    def from_file_format(cls, line: str) -> 'LazyGameHistory':
+        """Cria o registro sem decodificar os campos de texto"""
+        line = line.strip()
+        if line.count('|') != 5:
+            raise ValueError(f"Formato inválido: {line}")
+        
+        # Tentativas e duração ficam no fim da linha; isdecimal cobre o caso comum
+        # e int() decide o resto (sinal, espaços), levantando ValueError como GameHistory
+        _, attempts, duration = line.rsplit('|', 2)
+        if not (attempts.isdecimal() and duration.isdecimal()):
+            int(attempts), int(duration)
+        return cls(line)
+    
+    def to_file_format(self) -> str:
+        return self._line
+    
+    date = _lazy_field(0)
+    player_name = _lazy_field(1)
+    word = _lazy_field(2)
+    result = _lazy_field(3)
+    attempts_used = _lazy_field(4, int)
+    duration_seconds = _lazy_field(5, int)
@@ -7,6 +7,10 @@ class GameState:
     
     MAX_ATTEMPTS = 6  # Número máximo de erros permitidos
     
+    # Sem __dict__ por instância: muitas sessões simultâneas em memória
+    __slots__ = ('word', 'player_name', 'guessed_letters', 'wrong_attempts',
+                 'start_time', 'end_time')
+    
     def __init__(self, word: str, player_name: str):
         self.word = word.upper()
         self.player_name = player_name
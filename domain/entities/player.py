@@ -2,6 +2,9 @@
 class Player:
     """Representa um jogador com score e estatísticas"""
     
+    # Sem __dict__ por instância: placares grandes ocupam menos memória
+    __slots__ = ('name', 'wins', 'losses')
+    
     def __init__(self, name: str, wins: int = 0, losses: int = 0):
         self.name = name
         self.wins = wins
@@ -17,6 +20,16 @@ class Player:
             return 0.0
         return (self.wins / self.total_games) * 100
     
+    def ranking_key(self) -> tuple:
+        """
+        Chave de ordenação do ranking (menor = melhor colocado)
+        
+        Vitórias (decrescente), taxa de vitória (decrescente) e, no empate,
+        o nome case-folded: a mesma ordem do ranking no SQLite
+        """
+        total = self.total_games
+        return (-self.wins, -(self.wins / total) if total else 0.0, self.name.strip().casefold())
+    
     # Métodos Mágicos
     def __str__(self) -> str:
         """Representação textual do jogador"""
@@ -27,13 +40,11 @@ class Player:
     
     def __gt__(self, other: 'Player') -> bool:
         """Comparação para ordenar por vitórias (decrescente)"""
-        if self.wins != other.wins:
-            return self.wins > other.wins
-        return self.win_rate > other.win_rate
+        return self.ranking_key() < other.ranking_key()
     
     def __lt__(self, other: 'Player') -> bool:
         """Comparação menor que"""
-        return not self.__gt__(other) and self != other
+        return self.ranking_key() > other.ranking_key()
     
     def __eq__(self, other: object) -> bool:
         """Igualdade baseada no nome"""
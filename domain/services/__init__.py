@@ -0,0 +1,17 @@
+
+"""
+Domain Services Package
+Contém serviços de suporte aos casos de uso
+"""
+
+from domain.services.game_result_writer import GameResultWriter
+from domain.services.history_columns import HistoryColumns
+from domain.services.async_executor import AsyncExecutor
+from domain.services.game_session_manager import GameSessionManager
+
+__all__ = [
+    'GameResultWriter',
+    'HistoryColumns',
+    'AsyncExecutor',
+    'GameSessionManager',
+]
\ No newline at end of file
@@ -0,0 +1,97 @@
+"""
+Serviço: AsyncExecutor
+Single Responsibility: Executar chamadas bloqueantes fora do event loop
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class AsyncExecutor:
+    """
+    Ponte entre código bloqueante (arquivos, SQLite) e asyncio
+
+    As chamadas rodam em um pool de threads de tamanho fixo, então o
+    número de operações de I/O simultâneas é limitado, não importa
+    quantas corrotinas aguardem. Leituras idênticas concorrentes (mesma
+    chave) são coalescidas: só a primeira vai ao pool e as demais
+    aguardam o mesmo resultado. invalidate() deve ser chamado após uma
+    escrita para que leituras seguintes não reaproveitem uma leitura
+    iniciada antes dela.
+    """
+
+    def __init__(self, max_workers: int = 4, executor: Optional[ThreadPoolExecutor] = None):
+        """
+        Args:
+            max_workers: Threads do pool criado quando executor não é informado
+            executor: Pool já existente (compartilhado entre repositórios)
+        """
+        self._owns_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="AsyncExecutor"
+        )
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self._metrics_lock = threading.Lock()
+        self._metrics = {
+            'calls': 0,
+            'reads': 0,
+            'coalesced': 0,
+        }
+
+    async def run(self, func: Callable, *args) -> Any:
+        """Executa func(*args) no pool e aguarda o resultado"""
+        with self._metrics_lock:
+            self._metrics['calls'] += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    async def read(self, key: Hashable, func: Callable, *args) -> Any:
+        """
+        Executa uma leitura, coalescendo chamadas concorrentes de mesma chave
+
+        Args:
+            key: Identifica a leitura (ex.: nome do método e argumentos)
+            func: Função bloqueante
+            *args: Argumentos de func
+
+        Returns:
+            Resultado de func(*args); listas são copiadas para cada chamada coalescida
+        """
+        loop = asyncio.get_running_loop()
+        key = (id(loop), key)
+
+        future = self._in_flight.get(key)
+        if future is not None:
+            with self._metrics_lock:
+                self._metrics['coalesced'] += 1
+            # shield: cancelar um dos que aguardam não cancela a leitura dos outros
+            result = await asyncio.shield(future)
+            # Cada chamador recebe a própria lista (os itens são compartilhados)
+            return list(result) if isinstance(result, list) else result
+
+        with self._metrics_lock:
+            self._metrics['reads'] += 1
+        future = loop.run_in_executor(self.executor, func, *args)
+        self._in_flight[key] = future
+        future.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(future)
+
+    def invalidate(self) -> None:
+        """Novas leituras não reaproveitam as que já estão em andamento"""
+        self._in_flight = {}
+
+    def metrics(self) -> Dict[str, int]:
+        """Chamadas, leituras executadas e leituras coalescidas"""
+        with self._metrics_lock:
+            return dict(self._metrics)
+
+    def close(self, wait: bool = True) -> None:
+        """Encerra o pool, se foi criado por este executor"""
+        if self._owns_executor:
+            self.executor.shutdown(wait=wait)
+
+    def _forget(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
@@ -0,0 +1,238 @@
+"""
+Serviço: GameResultWriter
+Single Responsibility: Persistir resultados de partidas em segundo plano
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from domain.entities.game_history import GameHistory
+
+
+class GameResultWriter:
+    """
+    Escritor único de resultados (group commit)
+
+    Uma única thread de longa duração consome uma fila limitada e grava
+    cada lote com um append no histórico e uma atualização no placar.
+    Quando a fila está cheia, submit() bloqueia (backpressure) e a espera
+    é contabilizada nas métricas. close() esvazia a fila antes de sair.
+
+    Uma gravação que falha é repetida até max_retries vezes, com espera
+    crescente. Histórico e placar são repetidos em separado, para que a
+    parte já gravada não se duplique; os repositórios só retornam False
+    quando nada do lote foi persistido. Se ainda assim falhar, os resultados
+    do lote são perdidos: o erro é registrado e o próximo flush() ou
+    close() levanta RuntimeError com a quantidade perdida.
+    """
+
+    _STOP = object()
+
+    def __init__(self, history_repository, player_repository,
+                 flush_interval: float = 0.2,
+                 max_queue_size: int = 1000,
+                 max_batch_size: int = 500,
+                 max_retries: int = 3,
+                 retry_delay: float = 0.05):
+        """
+        Args:
+            history_repository: Implementação de IHistoryRepository
+            player_repository: Implementação de IPlayerRepository
+            flush_interval: Tempo máximo (s) acumulando um lote antes de gravar
+            max_queue_size: Capacidade da fila de resultados pendentes
+            max_batch_size: Número máximo de resultados por gravação
+            max_retries: Novas tentativas de uma gravação que falhou
+            retry_delay: Espera (s) antes da primeira repetição, dobrada a cada uma
+        """
+        self.history_repository = history_repository
+        self.player_repository = player_repository
+        self.flush_interval = flush_interval
+        self.max_batch_size = max_batch_size
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._metrics_lock = threading.Lock()
+        self._closed = False
+        self._unreported_failures = 0
+        self._metrics = {
+            'submitted': 0,
+            'written': 0,
+            'failed': 0,
+            'retries': 0,
+            'batches': 0,
+            'max_pending': 0,
+            'blocked_submits': 0,
+            'blocked_seconds': 0.0,
+            'last_flush_seconds': 0.0,
+        }
+
+        self._thread = threading.Thread(
+            target=self._run, name="GameResultWriter", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, history: GameHistory, player_name: str, won: bool) -> None:
+        """
+        Enfileira o resultado de uma partida para gravação
+
+        Raises:
+            RuntimeError: Se o escritor já foi encerrado
+        """
+        if self._closed:
+            raise RuntimeError("GameResultWriter encerrado")
+
+        item = (history, player_name, won)
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            # Backpressure: aguarda espaço na fila
+            started = time.perf_counter()
+            self._queue.put(item)
+            with self._metrics_lock:
+                self._metrics['blocked_submits'] += 1
+                self._metrics['blocked_seconds'] += time.perf_counter() - started
+
+        with self._metrics_lock:
+            self._metrics['submitted'] += 1
+            self._metrics['max_pending'] = max(
+                self._metrics['max_pending'], self._queue.qsize()
+            )
+
+    def flush(self) -> None:
+        """
+        Bloqueia até que todos os resultados enfileirados sejam processados
+
+        Raises:
+            RuntimeError: Se resultados foram perdidos desde o último flush/close
+        """
+        self._queue.join()
+        self._raise_failures()
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Esvazia a fila, grava os pendentes e encerra a thread
+
+        Raises:
+            RuntimeError: Se resultados foram perdidos desde o último flush/close
+        """
+        if self._closed:
+            return
+
+        self._closed = True
+        self._queue.put(self._STOP)
+        self._thread.join(timeout)
+        self._raise_failures()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Retorna métricas de vazão e backpressure"""
+        with self._metrics_lock:
+            metrics = dict(self._metrics)
+
+        metrics['pending'] = self._queue.qsize()
+        metrics['average_batch_size'] = (
+            metrics['written'] / metrics['batches'] if metrics['batches'] else 0.0
+        )
+        return metrics
+
+    # ==================== Thread de escrita ====================
+
+    def _run(self) -> None:
+        stopping = False
+
+        while not stopping:
+            first = self._queue.get()
+            if first is self._STOP:
+                self._queue.task_done()
+                break
+
+            batch = [first]
+            deadline = time.monotonic() + self.flush_interval
+
+            # Acumula resultados até o intervalo de flush ou o lote encher
+            while len(batch) < self.max_batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = self._queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+
+                if item is self._STOP:
+                    self._queue.task_done()
+                    stopping = True
+                    break
+                batch.append(item)
+
+            self._write_batch(batch)
+            for _ in batch:
+                self._queue.task_done()
+
+        # Drena o que restou (submits concorrentes ao close)
+        leftovers = self._drain()
+        if leftovers:
+            self._write_batch(leftovers)
+            for _ in leftovers:
+                self._queue.task_done()
+
+    def _drain(self) -> List[Tuple[GameHistory, str, bool]]:
+        items = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return items
+            if item is self._STOP:
+                self._queue.task_done()
+            else:
+                items.append(item)
+
+    def _write_batch(self, batch: List[Tuple[GameHistory, str, bool]]) -> None:
+        started = time.perf_counter()
+
+        histories_ok = self._save_with_retry(
+            self.history_repository.save_many, [h for h, _, _ in batch], "histórico"
+        )
+        players_ok = self._save_with_retry(
+            self.player_repository.save_game_results,
+            [(name, won) for _, name, won in batch], "placar"
+        )
+        ok = histories_ok and players_ok
+
+        with self._metrics_lock:
+            self._metrics['batches'] += 1
+            self._metrics['written' if ok else 'failed'] += len(batch)
+            self._metrics['last_flush_seconds'] = time.perf_counter() - started
+            if not ok:
+                self._unreported_failures += len(batch)
+
+    def _save_with_retry(self, save, items: List, target: str) -> bool:
+        #Chama save(items) até dar certo ou esgotar as novas tentativas
+        error = None
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                with self._metrics_lock:
+                    self._metrics['retries'] += 1
+                time.sleep(self.retry_delay * 2 ** (attempt - 1))
+            try:
+                if save(items):
+                    return True
+                error = "o repositório não confirmou a gravação"
+            except Exception as e:
+                error = e
+
+        print(f"Erro ao persistir {target} de {len(items)} resultados "
+              f"após {self.max_retries + 1} tentativas: {error}")
+        return False
+
+    def _raise_failures(self) -> None:
+        with self._metrics_lock:
+            lost, self._unreported_failures = self._unreported_failures, 0
+        if lost:
+            raise RuntimeError(f"{lost} resultados de partidas não foram gravados")
@@ -0,0 +1,330 @@
+"""
+Serviço: GameSessionManager
+Single Responsibility: Manter muitas partidas simultâneas em memória
+"""
+
+import random
+import secrets
+import sys
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from domain.entities.game_history import GameHistory
+from domain.entities.game_state import GameState
+
+
+@lru_cache(maxsize=None)
+def _letters_allowance(letters: int) -> int:
+    # Tamanho do set de letras tentadas quando a partida termina (no máximo)
+    return sys.getsizeof(set(range(letters)))
+
+
+class _Session:
+    __slots__ = ('game', 'last_access', 'size')
+
+    def __init__(self, game: GameState, last_access: float, size: int):
+        self.game = game
+        self.last_access = last_access
+        self.size = size
+
+
+class GameSessionManager:
+    """
+    Gerenciador de sessões de jogo (várias partidas por processo)
+
+    Cada partida é um GameState identificado por um id de sessão. As
+    sessões ficam em um OrderedDict na ordem do último acesso, então as
+    mais ociosas estão sempre no início: a expulsão por inatividade
+    (idle_timeout) e por orçamento de memória (memory_budget, estimado
+    por sessão) remove do início sem varrer o dicionário.
+
+    Palpites em sessões diferentes não disputam a mesma trava: cada
+    sessão usa uma de lock_stripes travas, escolhida pelo hash do id.
+    Partidas encerradas são gravadas pelo escritor de resultados.
+    """
+
+    # Fallback caso o repositório de palavras esteja vazio
+    FALLBACK_WORDS = [
+        'PYTHON', 'PROGRAMACAO', 'COMPUTADOR', 'DESENVOLVEDOR',
+        'ALGORITMO', 'ARQUITETURA', 'ENGENHARIA', 'SOFTWARE'
+    ]
+
+    # Entrada no OrderedDict (slot da tabela + nó da lista) e o float do último acesso
+    _ENTRY_BYTES = 128
+
+    def __init__(self, word_repository, result_writer,
+                 idle_timeout: Optional[float] = 1800.0,
+                 memory_budget: Optional[int] = 64 * 1024 * 1024,
+                 lock_stripes: int = 64):
+        """
+        Args:
+            word_repository: Implementação de IWordRepository (sorteio de palavras)
+            result_writer: GameResultWriter (ou objeto com submit) para partidas encerradas
+            idle_timeout: Segundos sem acesso até a sessão expirar (None = nunca)
+            memory_budget: Bytes estimados para todas as sessões (None = sem limite)
+            lock_stripes: Número de travas compartilhadas entre as sessões
+        """
+        self.word_repository = word_repository
+        self.result_writer = result_writer
+        self.idle_timeout = idle_timeout
+        self.memory_budget = memory_budget
+
+        self._sessions: "OrderedDict[str, _Session]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stripes = [threading.Lock() for _ in range(max(1, lock_stripes))]
+        self._guesses = [0] * len(self._stripes)
+        self._bytes = 0
+        self._metrics = {
+            'created': 0,
+            'finished': 0,
+            'ended': 0,
+            'evicted_idle': 0,
+            'evicted_memory': 0,
+            'peak_sessions': 0,
+        }
+
+    # ==================== Sessões ====================
+
+    def start_single_player_game(self, player_name: str) -> str:
+        """
+        Cria uma sessão single player com palavra aleatória
+
+        Args:
+            player_name: Nome do jogador
+
+        Returns:
+            Id da sessão criada
+
+        Raises:
+            ValueError: Se nome do jogador for inválido
+        """
+        if not player_name or not player_name.strip():
+            raise ValueError("Nome do jogador não pode ser vazio")
+
+        return self._add(GameState(word=self._get_random_word(), player_name=player_name.strip()))
+
+    def start_multiplayer_game(self, player1_name: str, player2_name: str, word: str) -> str:
+        """
+        Cria uma sessão multiplayer: player1 escolhe a palavra e player2 adivinha
+
+        Returns:
+            Id da sessão criada
+
+        Raises:
+            ValueError: Se parâmetros forem inválidos
+        """
+        if not player1_name or not player1_name.strip():
+            raise ValueError("Nome do Jogador 1 não pode ser vazio")
+
+        if not player2_name or not player2_name.strip():
+            raise ValueError("Nome do Jogador 2 não pode ser vazio")
+
+        if not word or len(word.strip()) < 3:
+            raise ValueError("A palavra deve ter pelo menos 3 caracteres")
+
+        if not word.strip().isalpha():
+            raise ValueError("A palavra deve conter apenas letras")
+
+        # Player2 é quem adivinha
+        return self._add(GameState(word=word.strip(), player_name=player2_name.strip()))
+
+    def get_game(self, session_id: str) -> Optional[GameState]:
+        """Estado da partida da sessão (None se não existe ou expirou)"""
+        session = self._touch(session_id)
+        return session.game if session else None
+
+    def make_guess(self, session_id: str, letter: str) -> Dict[str, Any]:
+        """
+        Processa um palpite de letra na sessão
+
+        Args:
+            session_id: Id devolvido por start_*_game
+            letter: Letra a ser tentada
+
+        Returns:
+            Mesmo formato de HangmanGameUseCase.make_guess
+
+        Raises:
+            RuntimeError: Se a sessão não existe (ou expirou) ou o jogo já terminou
+        """
+        session = self._touch(session_id)
+        if session is None:
+            raise RuntimeError("Nenhum jogo em andamento")
+
+        game = session.game
+        finished = None
+        stripe = hash(session_id) % len(self._stripes)
+        with self._stripes[stripe]:
+            if game.is_game_over:
+                raise RuntimeError("O jogo já terminou")
+
+            # Validação da letra
+            if not letter or len(letter) != 1 or not letter.isalpha():
+                return self._result(False, False, 'Digite apenas uma letra válida', game, False)
+
+            letter = letter.upper()
+
+            # Verifica se já foi tentada
+            if letter in game:
+                return self._result(False, False, f'A letra {letter} já foi tentada', game, False)
+
+            # Processa tentativa
+            is_correct = game.guess_letter(letter)
+            game_over = game.is_game_over
+            if game_over:
+                finished = self._finish_game(game)
+
+            # Contador por trava: palpites não disputam a trava global
+            self._guesses[stripe] += 1
+
+        # Envio fora da trava da faixa: uma fila cheia não bloqueia outras sessões
+        if finished is not None:
+            self.result_writer.submit(finished, game.player_name, game.is_won)
+
+        return self._result(
+            True, is_correct,
+            f'Letra {letter} {"correta!" if is_correct else "incorreta!"}',
+            game, game_over
+        )
+
+    def end_session(self, session_id: str) -> bool:
+        """Remove a sessão (partida não encerrada não é gravada)"""
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+            if session is None:
+                return False
+            self._bytes -= session.size
+            self._metrics['ended'] += 1
+            return True
+
+    def evict_idle(self, now: float = None) -> int:
+        """
+        Remove as sessões sem acesso há mais de idle_timeout
+
+        Returns:
+            Número de sessões removidas
+        """
+        if self.idle_timeout is None:
+            return 0
+
+        deadline = (now if now is not None else time.monotonic()) - self.idle_timeout
+        evicted = 0
+        with self._lock:
+            while self._sessions:
+                session_id, session = next(iter(self._sessions.items()))
+                if session.last_access > deadline:
+                    break
+                self._sessions.popitem(last=False)
+                self._bytes -= session.size
+                evicted += 1
+            self._metrics['evicted_idle'] += evicted
+        return evicted
+
+    def session_ids(self) -> List[str]:
+        """Ids das sessões ativas, da mais ociosa para a mais recente"""
+        with self._lock:
+            return list(self._sessions)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Sessões ativas, memória estimada e contadores"""
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics['active_sessions'] = len(self._sessions)
+            metrics['estimated_bytes'] = self._bytes
+        metrics['guesses'] = sum(self._guesses)
+
+        metrics['bytes_per_session'] = (
+            metrics['estimated_bytes'] / metrics['active_sessions'] if metrics['active_sessions'] else 0.0
+        )
+        return metrics
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._sessions
+
+    # ==================== Interno ====================
+
+    def _add(self, game: GameState) -> str:
+        session_id = secrets.token_urlsafe(12)
+        now = time.monotonic()
+        session = _Session(game, now, self._estimate_size(session_id, game))
+
+        with self._lock:
+            self._sessions[session_id] = session
+            self._bytes += session.size
+            self._metrics['created'] += 1
+            self._metrics['peak_sessions'] = max(self._metrics['peak_sessions'], len(self._sessions))
+
+        self.evict_idle(now)
+        self._enforce_budget()
+        return session_id
+
+    def _touch(self, session_id: Optional[str]) -> Optional[_Session]:
+        #Busca a sessão e a move para o fim (acesso mais recente)
+        if session_id is None:
+            return None
+
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                return None
+
+            now = time.monotonic()
+            if self.idle_timeout is not None and now - session.last_access > self.idle_timeout:
+                # Expirou mesmo que a varredura ainda não a tenha removido
+                del self._sessions[session_id]
+                self._bytes -= session.size
+                self._metrics['evicted_idle'] += 1
+                return None
+
+            session.last_access = now
+            self._sessions.move_to_end(session_id)
+            return session
+
+    def _enforce_budget(self):
+        #Remove as sessões mais ociosas enquanto a estimativa passar do orçamento
+        if self.memory_budget is None:
+            return
+
+        with self._lock:
+            # A sessão mais recente (fim do dicionário) nunca é removida
+            while self._bytes > self.memory_budget and len(self._sessions) > 1:
+                _, session = self._sessions.popitem(last=False)
+                self._bytes -= session.size
+                self._metrics['evicted_memory'] += 1
+
+    def _estimate_size(self, session_id: str, game: GameState) -> int:
+        #Bytes da sessão: objetos próprios + o maior conjunto de letras possível na partida
+        return (sys.getsizeof(game) + sys.getsizeof(game.word) + sys.getsizeof(game.player_name)
+                + _letters_allowance(len(set(game.word)) + GameState.MAX_ATTEMPTS)
+                + sys.getsizeof(game.start_time) + sys.getsizeof(session_id)
+                + _Session.__basicsize__ + self._ENTRY_BYTES)
+
+    def _finish_game(self, game: GameState) -> GameHistory:
+        #Encerra a partida e devolve o registro a enviar ao escritor (gravação em lote)
+        game.finish_game()
+        with self._lock:
+            self._metrics['finished'] += 1
+
+        return GameHistory.from_game_state(game)
+
+    def _get_random_word(self) -> str:
+        # Sorteio delegado ao repositório (sem materializar a lista)
+        word = self.word_repository.random_word()
+        return word if word else random.choice(self.FALLBACK_WORDS)
+
+    @staticmethod
+    def _result(valid: bool, correct: bool, message: str, game: GameState, game_over: bool) -> Dict[str, Any]:
+        return {
+            'valid': valid,
+            'correct': correct,
+            'message': message,
+            'game_state': game,
+            'game_over': game_over,
+            'won': game.is_won if valid else False
+        }
@@ -0,0 +1,331 @@
+"""
+Serviço: HistoryColumns
+Single Responsibility: Visão colunar do histórico para agregações
+"""
+
+import heapq
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from itertools import compress, islice
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Sequence
+
+from domain.entities.game_history import DATE_FORMAT, GameHistory, date_to_epoch, from_epoch
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: as colunas array.array bastam
+    np = None
+
+
+class HistoryColumns:
+    """
+    Histórico em colunas (array.array) em vez de uma lista de objetos
+
+    Cada partida ocupa uma posição em colunas numéricas: data em segundos,
+    id do jogador, id da palavra, flags de vitória/derrota, tentativas e
+    duração. Nomes e palavras ficam em tabelas de strings referenciadas
+    pelos ids. Somas, contagens e filtros rodam sobre as colunas inteiras
+    (NumPy quando instalado; senão sum/compress/Counter, que iteram em C)
+    e objetos GameHistory só são criados para as linhas pedidas.
+    """
+
+    def __init__(self, players: List[str] = None, words: List[str] = None):
+        """
+        Args:
+            players: Tabela de nomes já existente (ids = posições); None cria uma própria
+            words: Tabela de palavras já existente (ids = posições); None cria uma própria
+        """
+        self.epoch = array('q')
+        self.player = array('I')
+        self.word = array('I')
+        self.won = array('B')
+        self.lost = array('B')
+        self.attempts = array('I')
+        self.duration = array('I')
+
+        self.players: List[str] = players if players is not None else []
+        self.words: List[str] = words if words is not None else []
+        self._owns_tables = players is None
+        self._player_ids: Dict[str, int] = {}
+        self._word_ids: Dict[str, int] = {}
+
+        # O histórico é append-only: as datas costumam já estar em ordem
+        self.is_sorted = True
+
+        # Ids por nome (strip + casefold) e linhas por id, completados sob demanda
+        self._key_ids: Dict[str, List[int]] = {}
+        self._key_ids_size = 0
+        self._player_rows: Dict[int, array] = {}
+        self._player_rows_size = 0
+
+    @classmethod
+    def from_histories(cls, histories: Iterable[GameHistory]) -> 'HistoryColumns':
+        """Monta as colunas a partir de objetos GameHistory"""
+        columns = cls()
+        columns.extend(histories)
+        return columns
+
+    def __len__(self) -> int:
+        return len(self.epoch)
+
+    # ==================== Carga ====================
+
+    def extend(self, histories: Iterable[GameHistory]):
+        """Anexa partidas (as tabelas de strings devem ser próprias)"""
+        if not self._owns_tables:
+            raise ValueError("Tabelas externas: use extend_raw com ids")
+
+        last = self.epoch[-1] if self.epoch else None
+        for h in histories:
+            try:
+                epoch = date_to_epoch(h.date)
+            except ValueError:
+                continue  # Data inválida: o registro fica fora das colunas
+            if last is not None and epoch < last:
+                self.is_sorted = False
+            last = epoch
+            self.epoch.append(epoch)
+            self.player.append(self._intern(h.player_name, self.players, self._player_ids))
+            self.word.append(self._intern(h.word, self.words, self._word_ids))
+            self.won.append(h.result == 'WIN')
+            self.lost.append(h.result == 'LOSS')
+            self.attempts.append(h.attempts_used)
+            self.duration.append(h.duration_seconds)
+
+    def extend_raw(self, rows: Iterable[Sequence[int]]):
+        """Anexa tuplas (epoch, jogador, palavra, vitória, tentativas, duração)"""
+        last = self.epoch[-1] if self.epoch else None
+        for epoch, player_id, word_id, won, attempts, duration in rows:
+            if last is not None and epoch < last:
+                self.is_sorted = False
+            last = epoch
+            self.epoch.append(epoch)
+            self.player.append(player_id)
+            self.word.append(word_id)
+            self.won.append(won)
+            self.lost.append(not won)
+            self.attempts.append(attempts)
+            self.duration.append(duration)
+
+    @staticmethod
+    def _intern(value: str, table: List[str], ids: Dict[str, int]) -> int:
+        value_id = ids.get(value)
+        if value_id is None:
+            value_id = ids[value] = len(table)
+            table.append(value)
+        return value_id
+
+    # ==================== Consultas ====================
+
+    def row(self, index: int) -> GameHistory:
+        """Materializa uma linha como GameHistory"""
+        timestamp = from_epoch(self.epoch[index])
+        return GameHistory(
+            date=timestamp.strftime(DATE_FORMAT),
+            player_name=self.players[self.player[index]],
+            word=self.words[self.word[index]],
+            result='WIN' if self.won[index] else 'LOSS' if self.lost[index] else '',
+            attempts_used=self.attempts[index],
+            duration_seconds=self.duration[index],
+            timestamp=timestamp
+        )
+
+    def rows(self, indices: Iterable[int]) -> List[GameHistory]:
+        return [self.row(i) for i in indices]
+
+    def filter(self, player_name: str = None, result: str = None,
+               start: int = None, end: int = None) -> List[int]:
+        """
+        Índices das linhas que atendem aos filtros, na ordem de gravação
+
+        Args:
+            player_name: Nome do jogador (case-insensitive)
+            result: 'WIN' ou 'LOSS'
+            start: Data mínima em segundos (inclusiva)
+            end: Data máxima em segundos (exclusiva)
+        """
+        if np is not None:
+            mask = self._np_mask(player_name, result, start, end)
+            return np.flatnonzero(mask).tolist() if mask is not None else list(range(len(self)))
+
+        indices = self._rows_for(player_name) if player_name else range(len(self))
+        if result:
+            flags = self.won if result == 'WIN' else self.lost if result == 'LOSS' else None
+            indices = [i for i in indices if flags is not None and flags[i]]
+        if start is not None:
+            indices = [i for i in indices if self.epoch[i] >= start]
+        if end is not None:
+            indices = [i for i in indices if self.epoch[i] < end]
+        return list(indices)
+
+    def between(self, start: int = None, end: int = None) -> List[int]:
+        """
+        Índices das linhas com data em [start, end), em ordem cronológica
+
+        Com as datas em ordem, localiza o intervalo por busca binária
+        (O(log n)); caso contrário ordena os índices pela data.
+        """
+        if self.is_sorted:
+            low = bisect_left(self.epoch, start) if start is not None else 0
+            high = bisect_left(self.epoch, end) if end is not None else len(self)
+            return list(range(low, max(low, high)))
+
+        indices = self.filter(start=start, end=end)
+        indices.sort(key=self.epoch.__getitem__)
+        return indices
+
+    def summary(self, player_name: str = None) -> Dict[str, Any]:
+        """Agregados no formato de IHistoryRepository.get_summary"""
+        if np is not None:
+            return self._np_summary(player_name)
+
+        if player_name:
+            indices = self._rows_for(player_name)
+            pick = self._pick(indices)
+            attempts, duration = pick(self.attempts), pick(self.duration)
+            won, lost = pick(self.won), pick(self.lost)
+        else:
+            indices = range(len(self))
+            attempts, duration = self.attempts, self.duration
+            won, lost = self.won, self.lost
+
+        wins = won.count(1)
+
+        # Vitória com menos tentativas (empate: a mais antiga)
+        best = None
+        if wins:
+            win_attempts = array('I', compress(attempts, won))
+            position = win_attempts.index(min(win_attempts))
+            best = self.row(next(islice(compress(indices, won), position, None)))
+
+        return {
+            'total_games': len(indices),
+            'wins': wins,
+            'losses': lost.count(1),
+            'attempts_sum': sum(attempts),
+            'duration_sum': sum(duration),
+            'best': best
+        }
+
+    def games_by_player(self) -> Dict[str, Dict[str, int]]:
+        """Partidas, vitórias e derrotas por jogador (group-by pelo id)"""
+        if np is not None and len(self):
+            size = len(self.players)
+            player = self._np(self.player, np.uint32)
+            games = np.bincount(player, minlength=size).tolist()
+            wins = np.bincount(player[self._np(self.won, np.bool_)], minlength=size).tolist()
+            losses = np.bincount(player[self._np(self.lost, np.bool_)], minlength=size).tolist()
+        else:
+            games = Counter(self.player)
+            wins = Counter(compress(self.player, self.won))
+            losses = Counter(compress(self.player, self.lost))
+
+        grouped: Dict[str, Dict[str, int]] = {}
+        for player_id, name in enumerate(self.players):
+            if not games[player_id]:
+                continue
+            # Grafias diferentes do mesmo nome somam no primeiro registro
+            entry = grouped.setdefault(name.strip().casefold(), {
+                'player_name': name.strip(), 'total_games': 0, 'wins': 0, 'losses': 0
+            })
+            entry['total_games'] += games[player_id]
+            entry['wins'] += wins[player_id]
+            entry['losses'] += losses[player_id]
+
+        return grouped
+
+    # ==================== Interno ====================
+
+    def _ids_for(self, player_name: str) -> List[int]:
+        #Ids de todas as grafias do nome; completado quando a tabela cresce
+        if self._key_ids_size > len(self.players):
+            self._key_ids, self._key_ids_size = {}, 0
+
+        for player_id in range(self._key_ids_size, len(self.players)):
+            self._key_ids.setdefault(self.players[player_id].strip().casefold(), []).append(player_id)
+        self._key_ids_size = len(self.players)
+
+        return self._key_ids.get(player_name.strip().casefold(), [])
+
+    def _rows_for(self, player_name: str) -> List[int]:
+        #Linhas do jogador pelo índice id -> linhas (sem varrer todas as colunas)
+        if self._player_rows_size > len(self):
+            self._player_rows, self._player_rows_size = {}, 0
+
+        rows = self._player_rows
+        for index in range(self._player_rows_size, len(self)):
+            player_id = self.player[index]
+            if player_id not in rows:
+                rows[player_id] = array('I')
+            rows[player_id].append(index)
+        self._player_rows_size = len(self)
+
+        found = [rows[i] for i in self._ids_for(player_name) if i in rows]
+        if len(found) == 1:
+            return list(found[0])
+        return list(heapq.merge(*found))
+
+    @staticmethod
+    def _pick(indices: List[int]):
+        #Seleciona várias posições de uma coluna de uma vez (itemgetter em C)
+        if not indices:
+            return lambda column: array('I')
+        if len(indices) == 1:
+            return lambda column: array('I', (column[indices[0]],))
+        getter = itemgetter(*indices)
+        return lambda column: array('I', getter(column))
+
+    @staticmethod
+    def _np(column: array, dtype):
+        # Visão sem cópia; não deve sobreviver à chamada (o array não cresce com buffers exportados)
+        return np.frombuffer(column, dtype=dtype) if len(column) else np.zeros(0, dtype=dtype)
+
+    def _np_mask(self, player_name, result, start, end):
+        mask = None
+
+        def combine(current, new):
+            return new if current is None else current & new
+
+        if player_name:
+            mask = combine(mask, np.isin(self._np(self.player, np.uint32), self._ids_for(player_name)))
+        if result:
+            if result in ('WIN', 'LOSS'):
+                flags = self._np(self.won if result == 'WIN' else self.lost, np.bool_)
+            else:
+                flags = np.zeros(len(self), dtype=np.bool_)
+            mask = combine(mask, flags)
+        if start is not None:
+            mask = combine(mask, self._np(self.epoch, np.int64) >= start)
+        if end is not None:
+            mask = combine(mask, self._np(self.epoch, np.int64) < end)
+        return mask
+
+    def _np_summary(self, player_name: str = None) -> Dict[str, Any]:
+        attempts = self._np(self.attempts, np.uint32)
+        duration = self._np(self.duration, np.uint32)
+        won = self._np(self.won, np.bool_)
+        lost = self._np(self.lost, np.bool_)
+        indices = None
+
+        if player_name:
+            mask = self._np_mask(player_name, None, None, None)
+            attempts, duration, won, lost = attempts[mask], duration[mask], won[mask], lost[mask]
+            indices = np.flatnonzero(mask)
+
+        best = None
+        if won.any():
+            # argmin devolve a primeira ocorrência: empate mantém a mais antiga
+            positions = np.flatnonzero(won)
+            position = int(positions[np.argmin(attempts[positions])])
+            best = int(indices[position]) if indices is not None else position
+
+        return {
+            'total_games': int(len(won)),
+            'wins': int(won.sum()),
+            'losses': int(lost.sum()),
+            'attempts_sum': int(attempts.sum(dtype=np.int64)),
+            'duration_sum': int(duration.sum(dtype=np.int64)),
+            'best': self.row(best) if best is not None else None
+        }
@@ -7,9 +7,11 @@ Contém todos os casos de uso (lógica de aplicação)
 from domain.use_cases.hangman_game_use_case import HangmanGameUseCase
 from domain.use_cases.scoreboard_use_case import ScoreboardUseCase
 from domain.use_cases.history_use_case import HistoryUseCase
+from domain.use_cases.async_use_case import AsyncUseCase
 
 __all__ = [
     'HangmanGameUseCase',
     'ScoreboardUseCase',
     'HistoryUseCase',
+    'AsyncUseCase',
 ]
\ No newline at end of file
@@ -0,0 +1,59 @@
+"""
+Use Case: AsyncUseCase
+Executar os casos de uso síncronos a partir de um event loop (asyncio)
+"""
+
+import functools
+from typing import Any, Optional
+
+from domain.services.async_executor import AsyncExecutor
+
+
+class AsyncUseCase:
+    """
+    Adaptador assíncrono para qualquer caso de uso
+
+    Cada método público do caso de uso vira uma corrotina que roda no
+    pool limitado do AsyncExecutor, sem bloquear o event loop. Consultas
+    (métodos get_*) concorrentes com os mesmos argumentos são
+    coalescidas; os demais métodos invalidam as consultas em andamento.
+    """
+
+    def __init__(self, use_case, executor: Optional[AsyncExecutor] = None):
+        """
+        Args:
+            use_case: ScoreboardUseCase, HistoryUseCase ou HangmanGameUseCase
+            executor: AsyncExecutor compartilhado (None cria um próprio)
+        """
+        self.use_case = use_case
+        self.executor = executor or AsyncExecutor()
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self.use_case, name)
+        if name.startswith('_') or not callable(attribute):
+            return attribute
+
+        if name.startswith('get_'):
+            async def query(*args, **kwargs):
+                call = functools.partial(attribute, *args, **kwargs)
+                key = (id(self.use_case), name, args, tuple(sorted(kwargs.items())))
+                try:
+                    hash(key)
+                except TypeError:
+                    # Argumentos não hasheáveis: executa sem coalescer
+                    return await self.executor.run(call)
+                return await self.executor.read(key, call)
+            method = query
+        else:
+            async def command(*args, **kwargs):
+                try:
+                    return await self.executor.run(functools.partial(attribute, *args, **kwargs))
+                finally:
+                    self.executor.invalidate()
+            method = command
+
+        functools.update_wrapper(method, attribute)
+        return method
+
+    def __repr__(self) -> str:
+        return f"AsyncUseCase({self.use_case!r})"
@@ -3,13 +3,12 @@ Use Case: HangmanGameUseCase
 Single Responsibility: Orquestrar o fluxo principal do jogo
 """
 
-import random
-import threading
 from typing import Optional, Dict, Any
 
 from domain.entities.game_state import GameState
 from domain.entities.player import Player
-from domain.entities.game_history import GameHistory
+from domain.services.game_result_writer import GameResultWriter
+from domain.services.game_session_manager import GameSessionManager
 
 
 class HangmanGameUseCase:
@@ -17,17 +16,39 @@ class HangmanGameUseCase:
     Caso de uso principal: gerencia o fluxo do jogo
     """
     
-    def __init__(self, word_repository, player_repository, history_repository):
+    def __init__(self, word_repository, player_repository, history_repository,
+                 result_writer: Optional[GameResultWriter] = None,
+                 session_manager: Optional[GameSessionManager] = None):
         """
         Args:
             word_repository: Implementação de IWordRepository
             player_repository: Implementação de IPlayerRepository
             history_repository: Implementação de IHistoryRepository
+            result_writer: Escritor de resultados (padrão: GameResultWriter
+                sobre os repositórios acima)
+            session_manager: Gerenciador de sessões (padrão: um próprio,
+                com uma única sessão por vez)
         """
         self.word_repository = word_repository
         self.player_repository = player_repository
         self.history_repository = history_repository
-        self.current_game: Optional[GameState] = None
+        self.result_writer = result_writer or GameResultWriter(
+            history_repository=history_repository,
+            player_repository=player_repository
+        )
+        # A partida atual é uma sessão do gerenciador (sem expiração por padrão)
+        self.sessions = session_manager or GameSessionManager(
+            word_repository,
+            self.result_writer,
+            idle_timeout=None,
+            memory_budget=None
+        )
+        self._session_id: Optional[str] = None
+    
+    @property
+    def current_game(self) -> Optional[GameState]:
+        """Estado da partida atual (None se não houver)"""
+        return self.sessions.get_game(self._session_id)
     
     
     
@@ -44,11 +65,8 @@ class HangmanGameUseCase:
         Raises:
             ValueError: Se nome do jogador for inválido
         """
-        if not player_name or not player_name.strip():
-            raise ValueError("Nome do jogador não pode ser vazio")
-        
-        word = self._get_random_word()
-        self.current_game = GameState(word=word, player_name=player_name.strip())
+        # Validação e sorteio da palavra ficam no gerenciador de sessões
+        self._replace_session(self.sessions.start_single_player_game(player_name))
         
         return self.current_game
     
@@ -74,23 +92,9 @@ class HangmanGameUseCase:
             ValueError: Se parâmetros forem inválidos
         """
 
-        # Validações
-        if not player1_name or not player1_name.strip():
-            raise ValueError("Nome do Jogador 1 não pode ser vazio")
-        
-        if not player2_name or not player2_name.strip():
-            raise ValueError("Nome do Jogador 2 não pode ser vazio")
-        
-        if not word or len(word.strip()) < 3:
-            raise ValueError("A palavra deve ter pelo menos 3 caracteres")
-        
-        if not word.strip().isalpha():
-            raise ValueError("A palavra deve conter apenas letras")
-        
-        # Player2 é quem adivinha
-        self.current_game = GameState(
-            word=word.strip(), 
-            player_name=player2_name.strip()
+        # Validações e criação da partida ficam no gerenciador de sessões
+        self._replace_session(
+            self.sessions.start_multiplayer_game(player1_name, player2_name, word)
         )
         
         return self.current_game
@@ -118,98 +122,27 @@ class HangmanGameUseCase:
         Raises:
             RuntimeError: Se não há jogo em andamento
         """
-        if not self.current_game:
+        if self._session_id is None:
             raise RuntimeError("Nenhum jogo em andamento")
         
-        if self.current_game.is_game_over:
-            raise RuntimeError("O jogo já terminou")
-        
-        # Validação da letra
-        if not letter or len(letter) != 1 or not letter.isalpha():
-            return {
-                'valid': False,
-                'correct': False,
-                'message': 'Digite apenas uma letra válida',
-                'game_state': self.current_game,
-                'game_over': False,
-                'won': False
-            }
-        
-        letter = letter.upper()
-        
-        # Verifica se já foi tentada
-        if letter in self.current_game:
-            return {
-                'valid': False,
-                'correct': False,
-                'message': f'A letra {letter} já foi tentada',
-                'game_state': self.current_game,
-                'game_over': False,
-                'won': False
-            }
-        
-        # Processa tentativa
-        is_correct = self.current_game.guess_letter(letter)
-        
-        # Verifica se o jogo terminou
-        game_over = self.current_game.is_game_over
-        
-        if game_over:
-            self._finish_game()
-        
-        return {
-            'valid': True,
-            'correct': is_correct,
-            'message': f'Letra {letter} {"correta!" if is_correct else "incorreta!"}',
-            'game_state': self.current_game,
-            'game_over': game_over,
-            'won': self.current_game.is_won
-        }
+        return self.sessions.make_guess(self._session_id, letter)
     
     
     
-    def _finish_game(self) -> None:
+    def is_dictionary_word(self, word: str) -> bool:
         """
-        Finaliza o jogo atual e persiste dados
-        - Salva histórico da partida
-        - Atualiza estatísticas do jogador
-        """
-        if not self.current_game:
-            return
-        
-        self.current_game.finish_game()
+        Verifica se a palavra existe no dicionário (ex.: palavra escolhida
+        no multiplayer)
         
-        # Captura dados antes da thread
-        history = GameHistory.from_game_state(self.current_game)
-        player_name = self.current_game.player_name
-        won = self.current_game.is_won
-        
-        # FIX: Executa I/O em background
-        def save_data():
-            self.history_repository.save(history)
-            self.player_repository.save_game_result(player_name, won)
-        
-        threading.Thread(target=save_data, daemon=True).start()
-    
-    def _get_random_word(self) -> str:
-        """
-        Obtém palavra aleatória do repositório
+        Args:
+            word: Palavra a verificar
         
         Returns:
-            Palavra aleatória em maiúsculas
+            True se a palavra está no dicionário
         """
-        words = self.word_repository.get_all()
-        
-        if not words:
-            # Fallback: lista básica caso o arquivo não exista
-            words = [
-                'PYTHON', 'PROGRAMACAO', 'COMPUTADOR', 'DESENVOLVEDOR', 
-                'ALGORITMO', 'ARQUITETURA', 'ENGENHARIA', 'SOFTWARE'
-            ]
-        
-        return random.choice(words)
-    
-    
+        if not word or not word.strip():
+            return False
+        return self.word_repository.contains(word)
     
     def get_current_game(self) -> Optional[GameState]:
         """Retorna o jogo atual (ou None se não houver)"""
@@ -217,4 +150,14 @@ class HangmanGameUseCase:
     
     def reset_game(self) -> None:
         """Reseta o jogo atual"""
-        self.current_game = None
+        self._replace_session(None)
+    
+    def _replace_session(self, session_id: Optional[str]) -> None:
+        """Troca a sessão atual, descartando a anterior"""
+        if self._session_id is not None:
+            self.sessions.end_session(self._session_id)
+        self._session_id = session_id
+    
+    def shutdown(self) -> None:
+        """Grava os resultados pendentes e encerra o escritor"""
+        self.result_writer.close()
@@ -3,6 +3,7 @@ Use Case: HistoryUseCase
 Gerenciar operações relacionadas ao histórico
 """
 
+from datetime import datetime
 from typing import List, Dict, Any
 
 from domain.entities.game_history import GameHistory
@@ -20,14 +21,29 @@ class HistoryUseCase:
         """
         self.history_repository = history_repository
     
-
+    def snapshot(self) -> 'HistoryUseCase':
+        """
+        Retorna um caso de uso ligado a um snapshot do histórico
+        
+        As consultas de uma tela feitas pelo objeto devolvido compartilham
+        as leituras do repositório; o snapshot é reaproveitado entre telas
+        até a próxima escrita (ver IHistoryRepository.snapshot)
+        
+        Returns:
+            HistoryUseCase sobre o snapshot
+        
+        Exemplo:
+            view = history_use_case.snapshot()
+            recent = view.get_recent_games(limit=30)
+            stats = view.get_statistics()
+            print(view.history_repository.repository_calls)
+        """
+        return HistoryUseCase(self.history_repository.snapshot())
     
     def get_recent_games(self, limit: int = 20) -> List[GameHistory]:
         """
         Retorna os jogos mais recentes
         
-        Usa list comprehension para processar dados
-        
         Args:
             limit: Número máximo de jogos a retornar
         
@@ -39,16 +55,8 @@ class HistoryUseCase:
             for game in recent:
                 print(game)
         """
-        all_history = self.history_repository.get_all()
-        
-        # Ordena por data usando list comprehension
-        sorted_history = sorted(
-            all_history, 
-            key=lambda h: h.timestamp if hasattr(h, 'timestamp') else h.date,
-            reverse=True
-        )
-        
-        return sorted_history[:limit]
+        # O histórico é append-only: os mais recentes estão no final
+        return self.history_repository.get_recent(limit)
     
     def get_player_history(self, player_name: str, limit: int = 10) -> List[GameHistory]:
         """
@@ -59,27 +67,35 @@ class HistoryUseCase:
             limit: Número máximo de jogos
         
         Returns:
-            Lista de GameHistory do jogador, ordenada por data
+            Lista de GameHistory do jogador (mais recente primeiro)
         
         Exemplo:
             alice_games = history_use_case.get_player_history("Alice", limit=5)
         """
-        all_history = self.history_repository.get_all()
+        # Filtro delegado ao repositório (SQL/índices quando disponíveis)
+        player_games = self.history_repository.get_by_player(player_name)
         
-        # Filtra jogos do jogador
-        player_games = [
-            game for game in all_history 
-            if game.player_name.lower() == player_name.lower()
-        ]
+        # Append-only: já está em ordem de data, basta pegar o final
+        if limit <= 0:
+            return []
+        return list(reversed(player_games[-limit:]))
+    
+    def get_games_between(self, start: datetime = None, end: datetime = None) -> List[GameHistory]:
+        """
+        Retorna os jogos com data no intervalo [start, end)
         
-        # Ordena por data
-        sorted_games = sorted(
-            player_games,
-            key=lambda h: h.timestamp if hasattr(h, 'timestamp') else h.date,
-            reverse=True
-        )
+        Args:
+            start: Início do intervalo (inclusivo, None = desde o início)
+            end: Fim do intervalo (exclusivo, None = até agora)
         
-        return sorted_games[:limit]
+        Returns:
+            Lista de GameHistory em ordem cronológica
+        
+        Exemplo:
+            janeiro = history_use_case.get_games_between(
+                datetime(2025, 1, 1), datetime(2025, 2, 1))
+        """
+        return self.history_repository.get_between(start, end)
     
     def get_victories(self, player_name: str = None) -> List[GameHistory]:
         """
@@ -91,19 +107,14 @@ class HistoryUseCase:
         Returns:
             Lista de vitórias
         """
-        all_history = self.history_repository.get_all()
-        
-        # Filtra vitórias
-        victories = [game for game in all_history if game.is_victory()]
-        
-        # Se fornecido nome, filtra por jogador
+        # Com nome, lê apenas as partidas do jogador; sem nome, em streaming
         if player_name:
-            victories = [
-                game for game in victories
-                if game.player_name.lower() == player_name.lower()
-            ]
+            games = self.history_repository.get_by_player(player_name)
+        else:
+            games = self.history_repository.iter_records()
         
-        return victories
+        # Filtra vitórias
+        return [game for game in games if game.is_victory()]
     
     def get_defeats(self, player_name: str = None) -> List[GameHistory]:
         """
@@ -115,23 +126,18 @@ class HistoryUseCase:
         Returns:
             Lista de derrotas
         """
-        all_history = self.history_repository.get_all()
-        
-        # Filtra derrotas
-        defeats = [game for game in all_history if game.is_defeat()]
-        
-        # Se fornecido nome, filtra por jogador
+        # Com nome, lê apenas as partidas do jogador; sem nome, em streaming
         if player_name:
-            defeats = [
-                game for game in defeats
-                if game.player_name.lower() == player_name.lower()
-            ]
+            games = self.history_repository.get_by_player(player_name)
+        else:
+            games = self.history_repository.iter_records()
         
-        return defeats
+        # Filtra derrotas
+        return [game for game in games if game.is_defeat()]
     
     def get_statistics(self) -> Dict[str, Any]:
         """
-        Retorna estatísticas gerais usando list comprehensions
+        Retorna estatísticas gerais a partir dos agregados do repositório
         
         Returns:
             Dicionário com estatísticas:
@@ -144,9 +150,10 @@ class HistoryUseCase:
                 'average_duration': float
             }
         """
-        all_history = self.history_repository.get_all()
+        summary = self.history_repository.get_summary()
+        total_games = summary['total_games']
         
-        if not all_history:
+        if not total_games:
             return {
                 'total_games': 0,
                 'total_wins': 0,
@@ -156,19 +163,14 @@ class HistoryUseCase:
                 'average_duration': 0.0
             }
         
-        total_games = len(all_history)
-        
-        # Calcula estatísticas
-        total_wins = len([g for g in all_history if g.result == 'WIN'])
-        total_losses = len([g for g in all_history if g.result == 'LOSS'])
+        total_wins = summary['wins']
+        total_losses = summary['losses']
         
         win_rate = (total_wins / total_games * 100) if total_games > 0 else 0.0
         
-        # Calcula média de tentativas
-        average_attempts = sum([g.attempts_used for g in all_history]) / total_games
-        
-        # Calcula média de duração
-        average_duration = sum([g.duration_seconds for g in all_history]) / total_games
+        # Médias a partir das somas agregadas
+        average_attempts = summary['attempts_sum'] / total_games
+        average_duration = summary['duration_sum'] / total_games
         
         return {
             'total_games': total_games,
@@ -189,9 +191,10 @@ class HistoryUseCase:
         Returns:
             Dicionário com estatísticas do jogador
         """
-        player_games = self.get_player_history(player_name, limit=1000)
+        summary = self.history_repository.get_summary(player_name)
+        total = summary['total_games']
         
-        if not player_games:
+        if not total:
             return {
                 'total_games': 0,
                 'wins': 0,
@@ -201,19 +204,11 @@ class HistoryUseCase:
                 'best_performance': None
             }
         
-        total = len(player_games)
-        wins = len([g for g in player_games if g.is_victory()])
-        losses = len([g for g in player_games if g.is_defeat()])
+        wins = summary['wins']
+        losses = summary['losses']
         
         win_rate = (wins / total * 100) if total > 0 else 0.0
-        average_attempts = sum([g.attempts_used for g in player_games]) / total
-        
-        # Melhor performance (vitória com menos tentativas)
-        victories = [g for g in player_games if g.is_victory()]
-        best_performance = None
-        
-        if victories:
-            best_performance = min(victories, key=lambda g: g.attempts_used)
+        average_attempts = summary['attempts_sum'] / total
         
         return {
             'total_games': total,
@@ -221,6 +216,26 @@ class HistoryUseCase:
             'losses': losses,
             'win_rate': win_rate,
             'average_attempts': average_attempts,
-            'best_performance': best_performance
+            # Melhor performance (vitória com menos tentativas)
+            'best_performance': summary['best']
         }
-    
\ No newline at end of file
+    
+    def get_statistics_by_player(self) -> List[Dict[str, Any]]:
+        """
+        Retorna partidas, vitórias e derrotas de cada jogador
+        Agrupamento feito sobre a visão colunar do repositório
+        
+        Returns:
+            Lista de dicionários ordenada por número de partidas:
+            [{'player_name': str, 'total_games': int, 'wins': int,
+              'losses': int, 'win_rate': float}, ...]
+        """
+        grouped = self.history_repository.get_columns().games_by_player()
+        
+        stats = []
+        for entry in grouped.values():
+            total = entry['total_games']
+            stats.append(dict(entry, win_rate=entry['wins'] / total * 100 if total else 0.0))
+        
+        stats.sort(key=lambda s: (-s['total_games'], s['player_name'].casefold()))
+        return stats
@@ -20,12 +20,32 @@ class ScoreboardUseCase:
         """
         self.player_repository = player_repository
     
+    def snapshot(self) -> 'ScoreboardUseCase':
+        """
+        Retorna um caso de uso ligado a um snapshot do placar
+        
+        Ranking, totais e posições consultados pelo objeto devolvido saem
+        de uma única carga dos jogadores; o snapshot é reaproveitado entre
+        telas até a próxima escrita (ver IPlayerRepository.snapshot)
+        
+        Returns:
+            ScoreboardUseCase sobre o snapshot
+        
+        Exemplo:
+            view = scoreboard_use_case.snapshot()
+            ranking = view.get_ranking(limit=20)
+            total = view.get_total_players()
+            print(view.player_repository.read_count)
+        """
+        return ScoreboardUseCase(self.player_repository.snapshot())
+    
     def get_ranking(self, limit: int = 10) -> List[Player]:
         """
         Retorna ranking de jogadores ordenado por vitórias
         
-        Usa list comprehension e sobrecarga de operadores (__gt__)
-        da classe Player para ordenação
+        O repositório já devolve o ranking ordenado (Player.ranking_key);
+        só os primeiros colocados são pedidos, ampliando a busca quando
+        jogadores sem partidas aparecem entre eles
         
         Args:
             limit: Número máximo de jogadores a retornar
@@ -38,12 +58,19 @@ class ScoreboardUseCase:
             for i, player in enumerate(top_10, 1):
                 print(f"{i}. {player}")
         """
-        all_players = self.player_repository.get_ranking()
-        
-        # Filtra jogadores que jogaram pelo menos uma vez
-        active_players = [p for p in all_players if p.total_games > 0]
-        
-        return active_players[:limit]
+        if limit <= 0:
+            return []
+        
+        fetch = limit
+        while True:
+            players = self.player_repository.get_ranking(fetch)
+            
+            # Filtra jogadores que jogaram pelo menos uma vez
+            active_players = [p for p in players if p.total_games > 0]
+            
+            if len(active_players) >= limit or len(players) < fetch:
+                return active_players[:limit]
+            fetch *= 2
     
     def get_top_players_by_win_rate(self, limit: int = 10, min_games: int = 5) -> List[Player]:
         """
@@ -77,19 +104,16 @@ class ScoreboardUseCase:
         """
         Retorna a posição do jogador no ranking
         
+        Consulta o ranking ordenado do repositório (busca binária no
+        arquivo, COUNT no SQLite) em vez de percorrer a lista
+        
         Args:
             player_name: Nome do jogador
         
         Returns:
             Posição no ranking (1-indexed), ou None se não encontrado
         """
-        ranking = self.get_ranking(limit=1000)  # Pega todos
-        
-        for index, player in enumerate(ranking, start=1):
-            if player.name.lower() == player_name.lower():
-                return index
-        
-        return None
+        return self.player_repository.get_rank(player_name)
 
     def get_total_players(self) -> int:
         """Retorna número total de jogadores cadastrados"""
@@ -18,7 +18,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Importações das camadas
-from data.storage import FileWordRepository, FilePlayerRepository, FileHistoryRepository
+from data.storage import create_repositories
 from domain.use_cases import HangmanGameUseCase, ScoreboardUseCase, HistoryUseCase
 from presentation.controllers.game_controller import GameController
 
@@ -43,9 +43,8 @@ class HangmanApplication:
         self._setup_styles()
         
         # Dependency Injection - Camada de Dados (Repositórios)
-        self.word_repository = FileWordRepository("assets/words.txt")
-        self.player_repository = FilePlayerRepository("assets/scoreboard.txt")
-        self.history_repository = FileHistoryRepository("assets/history.txt")
+        # Backend escolhido por HANGMAN_STORAGE / HANGMAN_DB_PATH
+        self.word_repository, self.player_repository, self.history_repository = create_repositories()
         
         # Dependency Injection - Camada de Domínio (Use Cases)
         self.game_use_case = HangmanGameUseCase(
@@ -94,7 +93,18 @@ class HangmanApplication:
         """Inicia o loop principal da aplicação"""
         
         # Inicia loop do Tkinter
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self.shutdown()
+    
+    def shutdown(self):
+        """Garante a gravação dos resultados pendentes antes de sair"""
+        try:
+            self.game_use_case.shutdown()
+        except RuntimeError as e:
+            # Resultados perdidos não são erro de inicialização: só informa
+            print(f"Erro ao gravar resultados pendentes: {e}")
 
 
 def main():
@@ -1,21 +1,23 @@
+try:
+    from presentation.views.base_view import BaseView
+    from presentation.views.main_menu_view import MainMenuView
+    from presentation.views.player_setup_view import PlayerSetupView
+    from presentation.views.game_view import GameView
+    from presentation.views.game_over_view import GameOverView
+    from presentation.views.scoreboard_view import ScoreboardView
+    from presentation.views.history_view import HistoryView
 
-from presentation.views.base_view import BaseView
-from presentation.views.main_menu_view import MainMenuView
-from presentation.views.player_setup_view import PlayerSetupView
-from presentation.views.game_view import GameView
-from presentation.views.game_over_view import GameOverView
-from presentation.views.scoreboard_view import ScoreboardView
-from presentation.views.history_view import HistoryView
-
-from presentation.controllers.game_controller import GameController
-
-__all__ = [
-    'BaseView',
-    'MainMenuView',
-    'PlayerSetupView',
-    'GameView',
-    'GameOverView',
-    'ScoreboardView',
-    'HistoryView',
-    'GameController'
-]
\ No newline at end of file
+    from presentation.controllers.game_controller import GameController
+except ImportError:  # Tkinter é opcional: presentation.server roda sem interface gráfica
+    __all__ = []
+else:
+    __all__ = [
+        'BaseView',
+        'MainMenuView',
+        'PlayerSetupView',
+        'GameView',
+        'GameOverView',
+        'ScoreboardView',
+        'HistoryView',
+        'GameController'
+    ]
@@ -35,6 +35,10 @@ class GameController:
         
         self.current_view = None
         
+        # Chamadas ao repositório causadas pela última abertura de cada tela
+        # (cargas do placar; consultas repassadas pelo snapshot do histórico)
+        self.view_repository_calls = {}
+        
         # Configura callbacks das views
         self._setup_view_callbacks()
         
@@ -97,7 +101,10 @@ class GameController:
     def show_scoreboard(self):
         """Exibe placar"""
         def load_ranking():
-            ranking = self.scoreboard_use_case.get_ranking(limit=20)
+            view = self.scoreboard_use_case.snapshot()
+            reads = view.player_repository.read_count
+            ranking = view.get_ranking(limit=20)
+            self.view_repository_calls['scoreboard'] = view.player_repository.read_count - reads
             self.root.after(0, lambda: self._display_scoreboard(ranking))
         
         threading.Thread(target=load_ranking, daemon=True).start()
@@ -110,8 +117,12 @@ class GameController:
     def show_history(self):
         """Exibe histórico"""
         def load_history():
-            recent_games = self.history_use_case.get_recent_games(limit=30)
-            stats = self.history_use_case.get_statistics()
+            # Uma leitura consistente para a tela inteira
+            view = self.history_use_case.snapshot()
+            calls = view.history_repository.repository_calls
+            recent_games = view.get_recent_games(limit=30)
+            stats = view.get_statistics()
+            self.view_repository_calls['history'] = view.history_repository.repository_calls - calls
             self.root.after(0, lambda: self._display_history(recent_games, stats))
         
         threading.Thread(target=load_history, daemon=True).start()
@@ -0,0 +1,8 @@
+from presentation.server.http_server import HangmanServer, HttpError
+from presentation.server.latency_histogram import LatencyHistogram
+
+__all__ = [
+    'HangmanServer',
+    'HttpError',
+    'LatencyHistogram'
+]
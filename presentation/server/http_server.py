@@ -0,0 +1,379 @@
+"""
+Servidor HTTP/JSON do jogo (asyncio, somente biblioteca padrão)
+Single Responsibility: Expor os casos de uso por HTTP sem interface gráfica
+"""
+
+import asyncio
+import json
+import time
+from http import HTTPStatus
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from domain.services.async_executor import AsyncExecutor
+from domain.use_cases.async_use_case import AsyncUseCase
+from presentation.server.latency_histogram import LatencyHistogram
+from presentation.server.serializers import (
+    game_state_to_dict, guess_result_to_dict, history_to_dict, player_to_dict
+)
+
+
+class HttpError(Exception):
+    """Erro que vira uma resposta JSON com o status informado"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class _Request:
+    __slots__ = ('method', 'path', 'query', 'headers', 'body', 'keep_alive')
+
+    def __init__(self, method: str, path: str, query: Dict[str, str],
+                 headers: Dict[str, str], body: bytes, keep_alive: bool):
+        self.method = method
+        self.path = path
+        self.query = query
+        self.headers = headers
+        self.body = body
+        self.keep_alive = keep_alive
+
+    def json(self) -> Dict[str, Any]:
+        if not self.body:
+            return {}
+        try:
+            data = json.loads(self.body.decode('utf-8'))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            raise HttpError(400, "Corpo JSON inválido")
+        if not isinstance(data, dict):
+            raise HttpError(400, "O corpo deve ser um objeto JSON")
+        return data
+
+    def int_param(self, name: str, default: int, maximum: int = 1000) -> int:
+        value = self.query.get(name)
+        if value is None:
+            return default
+        try:
+            number = int(value)
+        except ValueError:
+            raise HttpError(400, f"Parâmetro {name} deve ser inteiro")
+        if number < 0:
+            raise HttpError(400, f"Parâmetro {name} não pode ser negativo")
+        return min(number, maximum)
+
+
+class HangmanServer:
+    """
+    Servidor HTTP/1.1 sobre os casos de uso do jogo
+
+    Rotas (todas respondem JSON):
+        POST   /games                {"player": ...} ou {"player1", "player2", "word"}
+        GET    /games/{id}           Estado da partida
+        POST   /games/{id}/guess     {"letter": ...} -> mesmo dicionário de make_guess
+        DELETE /games/{id}           Descarta a partida
+        GET    /scoreboard           ?limit=10&player=nome
+        GET    /history              ?limit=20&player=nome
+        GET    /metrics              Latências, sessões, executor e escritor
+        GET    /health
+
+    As partidas são sessões do GameSessionManager do HangmanGameUseCase.
+    Cada conexão é keep-alive (HTTP/1.1) e atende as requisições na
+    ordem em que chegam, então clientes podem enviá-las em pipeline: a
+    próxima só é lida depois que a resposta anterior foi escrita. O
+    trabalho bloqueante (arquivos, SQLite, backpressure do escritor)
+    roda no pool limitado do AsyncExecutor; leituras iguais do placar
+    e do histórico são coalescidas.
+    """
+
+    MAX_HEADERS = 100
+
+    def __init__(self, game_use_case, scoreboard_use_case, history_use_case,
+                 executor: Optional[AsyncExecutor] = None,
+                 keep_alive_timeout: float = 15.0,
+                 max_body_size: int = 64 * 1024):
+        """
+        Args:
+            game_use_case: HangmanGameUseCase (usa o seu gerenciador de sessões)
+            scoreboard_use_case: ScoreboardUseCase
+            history_use_case: HistoryUseCase
+            executor: AsyncExecutor compartilhado (None cria um próprio)
+            keep_alive_timeout: Segundos de espera pela próxima requisição na conexão
+            max_body_size: Tamanho máximo do corpo de uma requisição
+        """
+        self.game_use_case = game_use_case
+        self.sessions = game_use_case.sessions
+        self.executor = executor or AsyncExecutor()
+        self.scoreboard = AsyncUseCase(scoreboard_use_case, self.executor)
+        self.history = AsyncUseCase(history_use_case, self.executor)
+        self.keep_alive_timeout = keep_alive_timeout
+        self.max_body_size = max_body_size
+
+        self.latency = LatencyHistogram()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections = set()
+        self._closing = False
+        self._metrics = {
+            'connections': 0,
+            'requests': 0,
+            'errors': 0,
+        }
+
+    # ==================== Ciclo de vida ====================
+
+    async def start(self, host: str = '127.0.0.1', port: int = 8080) -> Tuple[str, int]:
+        """
+        Abre o socket de escuta
+
+        Returns:
+            (host, porta) efetivos (porta 0 escolhe uma livre)
+        """
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def serve_forever(self) -> None:
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Para de aceitar conexões, fecha as ociosas e grava os resultados pendentes"""
+        self._closing = True
+        if self._server is not None:
+            self._server.close()
+        for writer in list(self._connections):
+            writer.close()
+        if self._server is not None:
+            await self._server.wait_closed()
+
+        # Partidas encerradas ainda na fila do escritor
+        try:
+            await self.executor.run(self.game_use_case.shutdown)
+        finally:
+            self.executor.close()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Contadores do servidor, latência por rota e métricas das dependências"""
+        metrics = dict(self._metrics)
+        metrics['open_connections'] = len(self._connections)
+        metrics['latency'] = self.latency.snapshot()
+        metrics['sessions'] = self.sessions.metrics()
+        metrics['executor'] = self.executor.metrics()
+        metrics['result_writer'] = self.game_use_case.result_writer.metrics()
+        return metrics
+
+    # ==================== Conexões ====================
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._connections.add(writer)
+        self._metrics['connections'] += 1
+        try:
+            while not self._closing:
+                try:
+                    request = await asyncio.wait_for(self._read_request(reader), self.keep_alive_timeout)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except HttpError as e:
+                    # Requisição malformada: responde e fecha (o fluxo perdeu o alinhamento)
+                    self._metrics['errors'] += 1
+                    writer.write(self._response(e.status, {'error': e.message}, keep_alive=False))
+                    await writer.drain()
+                    break
+
+                if request is None:
+                    break
+
+                started = time.perf_counter()
+                route, status, payload = await self._dispatch(request)
+                keep_alive = request.keep_alive and not self._closing
+                writer.write(self._response(status, payload, keep_alive))
+                await writer.drain()
+                self.latency.record(route, time.perf_counter() - started)
+                self._metrics['requests'] += 1
+
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[_Request]:
+        #Lê uma requisição completa (None quando o cliente fecha a conexão)
+        try:
+            line = await reader.readline()
+            if not line:
+                return None
+            if line in (b'\r\n', b'\n'):
+                # Linha em branco entre requisições é tolerada (RFC 9112)
+                line = await reader.readline()
+                if not line:
+                    return None
+
+            parts = line.decode('latin-1').split()
+            if len(parts) != 3 or not parts[2].startswith('HTTP/'):
+                raise HttpError(400, "Linha de requisição inválida")
+            method, target, version = parts
+
+            headers = {}
+            while True:
+                header = await reader.readline()
+                if header in (b'\r\n', b'\n', b''):
+                    break
+                if len(headers) >= self.MAX_HEADERS:
+                    raise HttpError(431, "Cabeçalhos demais")
+                name, separator, value = header.decode('latin-1').partition(':')
+                if not separator:
+                    raise HttpError(400, "Cabeçalho inválido")
+                headers[name.strip().lower()] = value.strip()
+        except ValueError:
+            # Linha maior que o limite do StreamReader
+            raise HttpError(431, "Linha de requisição ou cabeçalho grande demais")
+
+        if 'chunked' in headers.get('transfer-encoding', '').lower():
+            raise HttpError(501, "Transfer-Encoding chunked não suportado")
+
+        try:
+            length = int(headers.get('content-length', '0'))
+        except ValueError:
+            raise HttpError(400, "Content-Length inválido")
+        if length < 0:
+            raise HttpError(400, "Content-Length inválido")
+        if length > self.max_body_size:
+            raise HttpError(413, "Corpo grande demais")
+        body = await reader.readexactly(length) if length else b''
+
+        connection = headers.get('connection', '').lower()
+        if version == 'HTTP/1.0':
+            keep_alive = connection == 'keep-alive'
+        else:
+            keep_alive = connection != 'close'
+
+        url = urlsplit(target)
+        return _Request(method.upper(), unquote(url.path), dict(parse_qsl(url.query)),
+                        headers, body, keep_alive)
+
+    def _response(self, status: int, payload: Any, keep_alive: bool) -> bytes:
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        head = [
+            f"HTTP/1.1 {status} {HTTPStatus(status).phrase}",
+            "Content-Type: application/json; charset=utf-8",
+            f"Content-Length: {len(body)}",
+        ]
+        if keep_alive:
+            head.append("Connection: keep-alive")
+            head.append(f"Keep-Alive: timeout={int(self.keep_alive_timeout)}")
+        else:
+            head.append("Connection: close")
+        return ('\r\n'.join(head) + '\r\n\r\n').encode('latin-1') + body
+
+    # ==================== Rotas ====================
+
+    async def _dispatch(self, request: _Request) -> Tuple[str, int, Any]:
+        #Encaminha para o handler; devolve (rota para o histograma, status, corpo)
+        parts = [part for part in request.path.split('/') if part]
+        method = request.method
+        route = f"{method} /{'/'.join(parts)}"
+
+        try:
+            if parts == ['games']:
+                route = f"{method} /games"
+                self._allow(method, 'POST')
+                return route, 201, await self._start_game(request)
+
+            if len(parts) == 2 and parts[0] == 'games':
+                route = f"{method} /games/{{id}}"
+                self._allow(method, 'GET', 'DELETE')
+                if method == 'DELETE':
+                    return route, 200, {'ended': self.sessions.end_session(parts[1])}
+                return route, 200, self._get_game(parts[1])
+
+            if len(parts) == 3 and parts[0] == 'games' and parts[2] == 'guess':
+                route = f"{method} /games/{{id}}/guess"
+                self._allow(method, 'POST')
+                return route, 200, await self._guess(parts[1], request)
+
+            if parts == ['scoreboard']:
+                self._allow(method, 'GET')
+                return route, 200, await self._scoreboard(request)
+
+            if parts == ['history']:
+                self._allow(method, 'GET')
+                return route, 200, await self._history(request)
+
+            if parts == ['metrics']:
+                self._allow(method, 'GET')
+                return route, 200, self.metrics()
+
+            if parts == ['health']:
+                self._allow(method, 'GET')
+                return route, 200, {'status': 'ok'}
+
+            # Caminhos desconhecidos compartilham uma linha no histograma
+            route = f"{method} (não encontrado)"
+            raise HttpError(404, "Rota não encontrada")
+        except HttpError as e:
+            self._metrics['errors'] += 1
+            return route, e.status, {'error': e.message}
+        except ValueError as e:
+            self._metrics['errors'] += 1
+            return route, 400, {'error': str(e)}
+        except Exception as e:
+            print(f"Erro ao processar {route}: {e}")
+            self._metrics['errors'] += 1
+            return route, 500, {'error': "Erro interno"}
+
+    @staticmethod
+    def _allow(method: str, *allowed: str) -> None:
+        if method not in allowed:
+            raise HttpError(405, "Método não permitido")
+
+    async def _start_game(self, request: _Request) -> Dict[str, Any]:
+        data = request.json()
+        if 'word' in data:
+            session_id = await self.executor.run(
+                self.sessions.start_multiplayer_game,
+                str(data.get('player1') or ''), str(data.get('player2') or ''), str(data['word'])
+            )
+        else:
+            # Sorteio da palavra pode ir ao disco/banco: fora do event loop
+            session_id = await self.executor.run(
+                self.sessions.start_single_player_game, str(data.get('player') or '')
+            )
+
+        return {'session_id': session_id, 'game_state': self._get_game(session_id)}
+
+    def _get_game(self, session_id: str) -> Dict[str, Any]:
+        game = self.sessions.get_game(session_id)
+        if game is None:
+            raise HttpError(404, "Sessão não encontrada")
+        return game_state_to_dict(game)
+
+    async def _guess(self, session_id: str, request: _Request) -> Dict[str, Any]:
+        letter = request.json().get('letter')
+        if session_id not in self.sessions:
+            raise HttpError(404, "Sessão não encontrada")
+
+        try:
+            # Fim de partida entrega o resultado ao escritor, que pode bloquear (fila cheia)
+            result = await self.executor.run(self.sessions.make_guess, session_id, str(letter or ''))
+        except RuntimeError as e:
+            # Sessão expirou entre a checagem e o palpite, ou jogo já terminou
+            raise HttpError(404 if session_id not in self.sessions else 409, str(e))
+        return guess_result_to_dict(result)
+
+    async def _scoreboard(self, request: _Request) -> Dict[str, Any]:
+        player = request.query.get('player')
+        if player:
+            return {'player': player, 'rank': await self.scoreboard.get_player_rank(player)}
+
+        ranking = await self.scoreboard.get_ranking(request.int_param('limit', 10))
+        return {'ranking': [player_to_dict(p) for p in ranking]}
+
+    async def _history(self, request: _Request) -> Dict[str, Any]:
+        limit = request.int_param('limit', 20)
+        player = request.query.get('player')
+        if player:
+            games = await self.history.get_player_history(player, limit)
+        else:
+            games = await self.history.get_recent_games(limit)
+        return {'games': [history_to_dict(h) for h in games]}
@@ -0,0 +1,79 @@
+"""
+Histograma de latência das requisições do servidor HTTP
+"""
+
+import bisect
+from typing import Any, Dict, List
+
+
+class LatencyHistogram:
+    """
+    Histograma de latências com baldes exponenciais (por rota)
+
+    Cada balde cobre o dobro do anterior, de 50 µs até ~50 s, então a
+    memória é fixa não importa quantas requisições passem e os
+    percentis têm erro relativo de no máximo um balde. Só o event loop
+    grava, portanto não há trava.
+    """
+
+    BOUNDS = [0.00005 * 2 ** i for i in range(21)]  # Limites superiores em segundos
+
+    def __init__(self):
+        self._counts: Dict[str, List[int]] = {}
+        self._totals: Dict[str, float] = {}
+        self._max: Dict[str, float] = {}
+
+    def record(self, route: str, seconds: float) -> None:
+        """Soma uma requisição da rota ao balde da sua latência"""
+        counts = self._counts.get(route)
+        if counts is None:
+            # Um balde extra para o que passar do último limite
+            counts = self._counts[route] = [0] * (len(self.BOUNDS) + 1)
+            self._totals[route] = 0.0
+            self._max[route] = 0.0
+
+        counts[bisect.bisect_left(self.BOUNDS, seconds)] += 1
+        self._totals[route] += seconds
+        if seconds > self._max[route]:
+            self._max[route] = seconds
+
+    def percentile(self, route: str, percent: float) -> float:
+        """Limite superior do balde que contém o percentil (segundos)"""
+        counts = self._counts.get(route)
+        if not counts:
+            return 0.0
+
+        target = sum(counts) * percent / 100
+        seen = 0
+        for index, count in enumerate(counts):
+            seen += count
+            if count and seen >= target:
+                # O balde não passa do máximo observado
+                return min(self.BOUNDS[index], self._max[route]) if index < len(self.BOUNDS) else self._max[route]
+        return self._max[route]
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Contagem, média, p50/p95/p99 e máximo por rota, em milissegundos"""
+        result = {}
+        for route, counts in sorted(self._counts.items()):
+            total = sum(counts)
+            result[route] = {
+                'count': total,
+                'mean_ms': self._totals[route] / total * 1000,
+                'p50_ms': self.percentile(route, 50) * 1000,
+                'p95_ms': self.percentile(route, 95) * 1000,
+                'p99_ms': self.percentile(route, 99) * 1000,
+                'max_ms': self._max[route] * 1000,
+                'buckets': {
+                    f"le_{bound * 1000:g}ms": count
+                    for bound, count in zip(self.BOUNDS, counts) if count
+                },
+            }
+            if counts[-1]:
+                result[route]['buckets']['overflow'] = counts[-1]
+        return result
+
+    def reset(self) -> None:
+        self._counts.clear()
+        self._totals.clear()
+        self._max.clear()
@@ -0,0 +1,53 @@
+"""
+Conversão das entidades do domínio para JSON
+"""
+
+from typing import Any, Dict
+
+from domain.entities import GameHistory, GameState, Player
+
+
+def game_state_to_dict(game: GameState) -> Dict[str, Any]:
+    """Estado público da partida (a palavra só aparece quando o jogo termina)"""
+    return {
+        'player_name': game.player_name,
+        'masked_word': game.masked_word,
+        'word': game.word if game.is_game_over else None,
+        'length': len(game),
+        'guessed_letters': game.all_letters_guessed,
+        'wrong_letters': game.wrong_letters,
+        'wrong_attempts': game.wrong_attempts,
+        'remaining_attempts': game.remaining_attempts,
+        'max_attempts': game.MAX_ATTEMPTS,
+        'is_won': game.is_won,
+        'is_lost': game.is_lost,
+        'is_game_over': game.is_game_over,
+    }
+
+
+def guess_result_to_dict(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Mesmo dicionário de make_guess, com game_state convertido"""
+    converted = dict(result)
+    converted['game_state'] = game_state_to_dict(result['game_state'])
+    return converted
+
+
+def player_to_dict(player: Player) -> Dict[str, Any]:
+    return {
+        'name': player.name,
+        'wins': player.wins,
+        'losses': player.losses,
+        'total_games': player.total_games,
+        'win_rate': player.win_rate,
+    }
+
+
+def history_to_dict(history: GameHistory) -> Dict[str, Any]:
+    return {
+        'date': history.date,
+        'player_name': history.player_name,
+        'word': history.word,
+        'result': history.result,
+        'attempts_used': history.attempts_used,
+        'duration_seconds': history.duration_seconds,
+    }
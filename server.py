@@ -0,0 +1,102 @@
+"""
+Ponto de Entrada do Servidor HTTP (sem interface gráfica)
+Responsável por:
+1. Configurar as dependências (mesmos repositórios do main.py)
+2. Instanciar use cases e o gerenciador de sessões
+3. Servir a API JSON até Ctrl+C / SIGTERM
+
+Uso:
+    python server.py [--host 0.0.0.0] [--port 8080] [--workers 8]
+"""
+
+import argparse
+import asyncio
+import os
+import signal
+import sys
+
+# Adiciona o diretório raiz ao path para imports absolutos
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from data.storage.repository_factory import STORAGE_BACKEND, create_repositories
+from domain.services import AsyncExecutor, GameResultWriter, GameSessionManager
+from domain.use_cases import HangmanGameUseCase, ScoreboardUseCase, HistoryUseCase
+from presentation.server import HangmanServer
+
+
+def create_server(args) -> HangmanServer:
+    """Monta use cases, sessões e servidor (Dependency Injection)"""
+    # Mesmo backend do main.py (HANGMAN_STORAGE / HANGMAN_DB_PATH)
+    word_repository, player_repository, history_repository = create_repositories()
+
+    result_writer = GameResultWriter(
+        history_repository=history_repository,
+        player_repository=player_repository
+    )
+    sessions = GameSessionManager(
+        word_repository,
+        result_writer,
+        idle_timeout=args.idle_timeout,
+        memory_budget=args.memory_budget_mb * 1024 * 1024
+    )
+    game_use_case = HangmanGameUseCase(
+        word_repository=word_repository,
+        player_repository=player_repository,
+        history_repository=history_repository,
+        result_writer=result_writer,
+        session_manager=sessions
+    )
+
+    return HangmanServer(
+        game_use_case=game_use_case,
+        scoreboard_use_case=ScoreboardUseCase(player_repository=player_repository),
+        history_use_case=HistoryUseCase(history_repository=history_repository),
+        executor=AsyncExecutor(max_workers=args.workers),
+        keep_alive_timeout=args.keep_alive
+    )
+
+
+async def serve(args) -> None:
+    server = create_server(args)
+    host, port = await server.start(args.host, args.port)
+    print(f"Servidor da forca em http://{host}:{port} (armazenamento: {STORAGE_BACKEND})")
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, stop.set)
+        except (NotImplementedError, RuntimeError):
+            pass  # Windows: Ctrl+C chega como KeyboardInterrupt
+
+    try:
+        await stop.wait()
+    finally:
+        print("Encerrando: gravando resultados pendentes...")
+        await server.close()
+
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Servidor HTTP/JSON do jogo da forca")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=8, help="Threads para I/O bloqueante")
+    parser.add_argument("--keep-alive", type=float, default=15.0, help="Segundos de conexão ociosa")
+    parser.add_argument("--idle-timeout", type=float, default=1800.0, help="Segundos até a sessão expirar")
+    parser.add_argument("--memory-budget-mb", type=int, default=64, help="Memória estimada das sessões")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        print(f"\n Erro ao iniciar servidor: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
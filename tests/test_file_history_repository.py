@@ -0,0 +1,61 @@
+"""
+Testes do FileHistoryRepository: linhas inválidas e registros preguiçosos
+"""
+
+from datetime import datetime
+
+import pytest
+
+from data.storage.file_history_repository import FileHistoryRepository
+from domain.use_cases import HistoryUseCase
+
+HEADER = "# Histórico - Formato: data|jogador|palavra|resultado|tentativas|duracao\n"
+
+
+@pytest.fixture(params=[True, False], ids=["lazy", "eager"])
+def repository(request, tmp_path):
+    path = tmp_path / "history.txt"
+    path.write_text(
+        HEADER
+        + "2025-11-21 22:30:00|Atos|PYTHON|WIN|2|40\n"
+        + "2025-11-21 22:38:22|Atos|X|WIN|abc|62\n"
+        + "2025-11-21 22:40:00|Atos|FORCA|LOSS|6|70\n",
+        encoding="utf-8",
+    )
+    return FileHistoryRepository(str(path), segment_by_month=False, lazy_records=request.param)
+
+
+def test_get_all_skips_line_with_invalid_integer(repository):
+    games = repository.get_all()
+
+    assert [h.word for h in games] == ["PYTHON", "FORCA"]
+    assert len(games) == repository.get_summary()['total_games']
+
+
+def test_iter_records_skips_line_with_invalid_integer(repository):
+    assert [h.attempts_used for h in repository.iter_records()] == [2, 6]
+
+
+def test_use_case_filters_survive_invalid_line(repository):
+    use_case = HistoryUseCase(repository)
+
+    assert [h.attempts_used for h in use_case.get_victories()] == [2]
+    assert [h.attempts_used for h in use_case.get_defeats()] == [6]
+    stats = use_case.get_statistics_by_player()
+    assert [(s['player_name'], s['total_games']) for s in stats] == [("Atos", 2)]
+
+
+def test_out_of_range_time_stays_out_of_date_ranges(tmp_path):
+    path = tmp_path / "history.txt"
+    path.write_text(
+        HEADER
+        + "2025-11-21 22:30:00|Atos|PYTHON|WIN|2|40\n"
+        + "2025-11-21 25:99:99|Atos|FORCA|LOSS|6|70\n",
+        encoding="utf-8",
+    )
+    repository = FileHistoryRepository(str(path), segment_by_month=False)
+
+    assert [h.word for h in repository.get_all()] == ["PYTHON", "FORCA"]
+    assert repository.get_all()[1].timestamp is None
+    assert [h.word for h in repository.get_between(datetime(2025, 11, 21),
+                                                   datetime(2025, 11, 23))] == ["PYTHON"]
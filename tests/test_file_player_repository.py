@@ -0,0 +1,85 @@
+"""
+Testes do FilePlayerRepository com log de deltas: replay, compactação e
+log de geração já incorporada ao snapshot
+"""
+
+import pytest
+
+from data.storage.file_player_repository import FilePlayerRepository
+
+
+def open_repository(path, **options):
+    options.setdefault('compact_threshold', 1000)
+    return FilePlayerRepository(str(path), use_delta_log=True,
+                                background_compaction=False, **options)
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "scoreboard.txt"
+
+
+def scores(repository):
+    return {p.name: (p.wins, p.losses) for p in repository.get_all()}
+
+
+def test_results_go_to_log_and_are_replayed_on_open(path):
+    repository = open_repository(path)
+    repository.save_game_results([("Ana", True), (" ana ", False), ("Bia", True)])
+    repository.save_game_result("Ana", True)
+
+    # Snapshot intacto: os resultados só existem no log
+    assert "Ana|" not in path.read_text(encoding="utf-8")
+    assert scores(open_repository(path)) == {"Ana": (2, 1), "Bia": (1, 0)}
+
+
+def test_compact_folds_log_into_snapshot(path):
+    repository = open_repository(path)
+    repository.save_game_results([("Ana", True), ("Bia", False)])
+
+    assert repository.compact()
+
+    log = path.with_name("scoreboard.txt.log").read_text(encoding="utf-8")
+    assert log == FilePlayerRepository.DELTA_HEADER.format(gen=1)
+    assert f"{FilePlayerRepository.SNAPSHOT_MARKER}1\n" in path.read_text(encoding="utf-8")
+    assert scores(open_repository(path)) == {"Ana": (1, 0), "Bia": (0, 1)}
+
+
+def test_threshold_compacts_inline(path):
+    repository = open_repository(path, compact_threshold=3)
+    for _ in range(3):
+        repository.save_game_result("Ana", True)
+
+    assert path.with_name("scoreboard.txt.log").read_text(encoding="utf-8").count("\n") == 1
+    assert scores(open_repository(path)) == {"Ana": (3, 0)}
+
+
+def test_log_of_compacted_generation_is_not_replayed_again(path):
+    repository = open_repository(path)
+    repository.save_game_results([("Ana", True), ("Ana", True), ("Bia", False)])
+    log_path = path.with_name("scoreboard.txt.log")
+    stale_log = log_path.read_bytes()
+
+    # Compactação interrompida depois da troca do snapshot e antes de truncar o log
+    repository.compact()
+    log_path.write_bytes(stale_log)
+
+    reopened = open_repository(path)
+    assert scores(reopened) == {"Ana": (2, 0), "Bia": (0, 1)}
+
+    # A próxima escrita recomeça o log na geração do snapshot
+    reopened.save_game_result("Bia", True)
+    assert log_path.read_text(encoding="utf-8").startswith(
+        FilePlayerRepository.DELTA_HEADER.format(gen=1)
+    )
+    assert scores(open_repository(path)) == {"Ana": (2, 0), "Bia": (1, 1)}
+
+
+def test_other_instance_sees_appended_deltas(path):
+    writer = open_repository(path)
+    reader = open_repository(path)
+    assert reader.get_by_name("Ana") is None
+
+    writer.save_game_result("Ana", True)
+
+    assert (reader.get_by_name("ana").wins, reader.get_by_name("ana").losses) == (1, 0)
@@ -0,0 +1,52 @@
+"""
+Testes do FileWordRepository: pertinência com dicionário não normalizado
+"""
+
+import os
+
+import pytest
+
+from data.storage.file_word_repository import FileWordRepository
+
+# Minúsculas, CRLF e espaços em volta: o índice normaliza com strip().upper()
+MIXED_CASE_CRLF = "Python\r\n  gato \r\nCASA\r\nComputação\r\nbanana"
+
+
+@pytest.fixture(params=["set", "bloom"])
+def repository(request, tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_bytes(MIXED_CASE_CRLF.encode("utf-8"))
+    bloom_path = str(tmp_path / "words.bloom") if request.param == "bloom" else None
+    return FileWordRepository(str(path), bloom_path=bloom_path)
+
+
+@pytest.mark.parametrize("word", ["PYTHON", "python", "Gato", "casa", "COMPUTAÇÃO", "banana"])
+def test_contains_normalized_lines(repository, word):
+    assert repository.contains(word)
+
+
+def test_contains_missing_word(repository):
+    assert not repository.contains("CACHORRO")
+
+
+def test_add_word_rejects_existing_word_in_other_case(repository):
+    size = os.path.getsize(repository.file_path)
+
+    assert not repository.add_word("gato")
+    assert not repository.add_word("Python")
+    assert os.path.getsize(repository.file_path) == size
+
+
+def test_add_word_accepts_new_word(repository):
+    assert repository.add_word("cachorro")
+    assert repository.contains("CACHORRO")
+
+
+def test_import_words_rejects_duplicates_across_chunks(repository):
+    words = ["pato", "rato", "gato", "pato", "sapo", "rato", "bola", "sapo"]
+
+    counts = repository.import_words(words, chunk_size=2)
+
+    assert counts["accepted"] == 4
+    assert counts["rejected_duplicate"] == 4
+    assert repository.get_all().count("PATO") == 1
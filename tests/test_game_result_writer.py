@@ -0,0 +1,100 @@
+"""
+Testes do GameResultWriter: novas tentativas e perda de resultados
+"""
+
+import pytest
+
+from data.storage.file_history_repository import FileHistoryRepository
+from domain.entities import GameHistory
+from domain.services.game_result_writer import GameResultWriter
+
+
+class FlakyRepository:
+    """Falha (exceção ou False) nas primeiras `failures` gravações"""
+
+    def __init__(self, failures=0, error=True):
+        self.failures = failures
+        self.error = error
+        self.calls = 0
+        self.saved = []
+
+    def _save(self, items):
+        self.calls += 1
+        if self.calls <= self.failures:
+            if self.error:
+                raise OSError("disco cheio")
+            return False
+        self.saved.extend(items)
+        return True
+
+    save_many = _save
+    save_game_results = _save
+
+
+def game(player="Ana", word="PYTHON"):
+    return GameHistory("2025-11-21 22:30:00", player, word, "WIN", 3, 40)
+
+
+def make_writer(history, players, **options):
+    options.setdefault('flush_interval', 0.01)
+    options.setdefault('retry_delay', 0)
+    return GameResultWriter(history, players, **options)
+
+
+@pytest.mark.parametrize("error", [True, False], ids=["exception", "false"])
+def test_failed_save_is_retried(error):
+    history, players = FlakyRepository(failures=2, error=error), FlakyRepository()
+    writer = make_writer(history, players)
+
+    writer.submit(game(), "Ana", True)
+    writer.close()
+
+    assert [h.word for h in history.saved] == ["PYTHON"]
+    assert history.calls == 3
+    # O placar é repetido à parte: não é gravado de novo pelas falhas do histórico
+    assert players.saved == [("Ana", True)] and players.calls == 1
+    metrics = writer.metrics()
+    assert (metrics['retries'], metrics['written'], metrics['failed']) == (2, 1, 0)
+
+
+def test_lost_results_are_reported_once_by_flush():
+    history, players = FlakyRepository(failures=100), FlakyRepository()
+    writer = make_writer(history, players, max_retries=2)
+
+    writer.submit(game(), "Ana", True)
+    writer.submit(game("Bia"), "Bia", False)
+    with pytest.raises(RuntimeError, match="2 resultados"):
+        writer.flush()
+
+    assert history.calls == 3
+    assert writer.metrics()['failed'] == 2
+    writer.close()  # Já informado: não levanta de novo
+
+
+def test_close_reports_results_lost_while_draining():
+    writer = make_writer(FlakyRepository(failures=100), FlakyRepository(), max_retries=0)
+
+    writer.submit(game(), "Ana", True)
+    with pytest.raises(RuntimeError, match="1 resultados"):
+        writer.close()
+
+    with pytest.raises(RuntimeError):
+        writer.submit(game(), "Ana", True)
+
+
+def test_index_failure_after_append_does_not_duplicate_rows(tmp_path):
+    history = FileHistoryRepository(str(tmp_path / "history.txt"), segment_by_month=False)
+    history.get_by_player("Ana")  # Índices carregados: save_many os atualiza
+
+    def broken_record(*args):
+        raise OSError("disco cheio")
+    history._player_index.record = broken_record
+
+    writer = make_writer(history, FlakyRepository())
+    writer.submit(game(), "Ana", True)
+    writer.close()
+
+    del history._player_index.record
+    assert [h.word for h in history.get_all()] == ["PYTHON"]
+    assert [h.word for h in history.get_by_player("ana")] == ["PYTHON"]
+    assert writer.metrics()['retries'] == 0
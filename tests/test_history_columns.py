@@ -0,0 +1,45 @@
+"""
+Testes do HistoryColumns: agrupamento por jogador igual ao dos repositórios
+"""
+
+from data.storage.binary_history_repository import BinaryHistoryRepository
+from data.storage.file_history_repository import FileHistoryRepository
+from domain.entities import GameHistory
+from domain.use_cases import HistoryUseCase
+
+# Mesmo jogador com caixa e espaços diferentes: os backends usam strip().casefold()
+GAMES = [
+    GameHistory("2025-03-01 10:00:00", "Ana", "PYTHON", "WIN", 1, 75),
+    GameHistory("2025-03-01 11:00:00", "ana ", "FORCA", "LOSS", 6, 55),
+    GameHistory("2025-03-01 12:00:00", "Bia", "CASA", "WIN", 2, 30),
+]
+
+
+def _repositories(tmp_path):
+    file_repository = FileHistoryRepository(str(tmp_path / "history.txt"))
+    binary_repository = BinaryHistoryRepository(str(tmp_path / "history.bin"))
+    for repository in (file_repository, binary_repository):
+        assert repository.save_many(GAMES)
+    return file_repository, binary_repository
+
+
+def test_columns_summary_matches_file_summary(tmp_path):
+    file_repository, binary_repository = _repositories(tmp_path)
+
+    expected = file_repository.get_summary("ana")
+    assert expected['total_games'] == 2
+    assert expected['duration_sum'] == 130
+
+    for repository in (file_repository, binary_repository):
+        summary = repository.get_columns().summary("ana")
+        for key in ('total_games', 'wins', 'losses', 'attempts_sum', 'duration_sum'):
+            assert summary[key] == expected[key]
+
+
+def test_statistics_by_player_merges_spellings(tmp_path):
+    for repository in _repositories(tmp_path):
+        stats = HistoryUseCase(repository).get_statistics_by_player()
+
+        assert [(s['player_name'], s['total_games'], s['wins'], s['losses']) for s in stats] == [
+            ("Ana", 2, 1, 1), ("Bia", 1, 1, 0)
+        ]
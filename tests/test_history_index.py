@@ -0,0 +1,62 @@
+"""
+Testes do índice lateral por jogador (history.txt.idx): anexos de outros
+escritores e reconstrução quando o sidecar não corresponde ao histórico
+"""
+
+import pytest
+
+from data.storage.file_history_repository import FileHistoryRepository
+from domain.entities import GameHistory
+
+
+def game(player, word, date="2025-11-21 22:30:00"):
+    return GameHistory(date, player, word, "WIN", 3, 40)
+
+
+def open_repository(path):
+    return FileHistoryRepository(str(path), segment_by_month=False)
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = tmp_path / "history.txt"
+    repository = open_repository(path)
+    repository.save_many([game("Ana", "PYTHON"), game("Bia", "FORCA"), game(" ana", "CASA")])
+    repository.get_by_player("Ana")  # Grava o sidecar
+    return path
+
+
+def words(repository, player):
+    return [h.word for h in repository.get_by_player(player)]
+
+
+def test_index_follows_rows_appended_by_another_writer(path):
+    reader = open_repository(path)
+    assert words(reader, "ANA") == ["PYTHON", "CASA"]
+
+    open_repository(path).save(game("Ana", "GATO"))
+
+    assert words(reader, "ana") == ["PYTHON", "CASA", "GATO"]
+    assert words(open_repository(path), "Ana") == ["PYTHON", "CASA", "GATO"]
+
+
+def test_index_of_another_file_is_rebuilt(path):
+    index_path = path.with_name("history.txt.idx")
+    header, entries = index_path.read_text(encoding="utf-8").split("\n", 1)
+    index_path.write_text("# Índice de histórico ino=0 - Formato: offset|jogador\n" + entries,
+                          encoding="utf-8")
+
+    assert words(open_repository(path), "Bia") == ["FORCA"]
+    assert index_path.read_text(encoding="utf-8").startswith(header + "\n")
+
+
+def test_index_pointing_at_wrong_line_is_rebuilt(path):
+    index_path = path.with_name("history.txt.idx")
+    lines = index_path.read_text(encoding="utf-8").splitlines(keepends=True)
+    # Última entrada com jogador trocado (sidecar de outro conteúdo)
+    offset = lines[-1].split("|")[0]
+    index_path.write_text("".join(lines[:-1]) + f"{offset}|bia\n", encoding="utf-8")
+
+    repository = open_repository(path)
+    assert words(repository, "Ana") == ["PYTHON", "CASA"]
+    assert words(repository, "Bia") == ["FORCA"]
@@ -0,0 +1,172 @@
+"""
+Testes dos segmentos mensais do histórico: arquivamento ao virar o mês,
+recuperação de arquivamento interrompido (diário .roll) e compressão
+"""
+
+import gzip
+import lzma
+import os
+
+import pytest
+
+from data.storage.file_history_repository import FileHistoryRepository
+from data.storage.history_segments import HistorySegments
+from domain.entities import GameHistory
+
+
+def game(date, word, result="WIN", player="Ana"):
+    return GameHistory(date, player, word, result, 3, 40)
+
+
+def open_repository(path, codec='gzip'):
+    return FileHistoryRepository(str(path), segment_codec=codec)
+
+
+def words(repository):
+    return [h.word for h in repository.get_all()]
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "history.txt"
+
+
+def segments_dir(path):
+    return path.with_name("history.d")
+
+
+def test_game_of_new_month_rolls_previous_month(path):
+    repository = open_repository(path)
+    repository.save_many([game("2025-01-10 10:00:00", "PYTHON"),
+                          game("2025-01-20 10:00:00", "FORCA", "LOSS")])
+    repository.save(game("2025-02-01 09:00:00", "CASA"))
+
+    with gzip.open(segments_dir(path) / "2025-01.txt.gz", "rt", encoding="utf-8") as f:
+        assert [line.split("|")[2] for line in f] == ["PYTHON", "FORCA"]
+    assert "2025-01" not in path.read_text(encoding="utf-8")
+
+    assert words(repository) == ["PYTHON", "FORCA", "CASA"]
+    summary = repository.get_summary()
+    assert (summary['total_games'], summary['wins'], summary['losses']) == (3, 2, 1)
+
+
+def test_hot_file_with_several_months_is_migrated_on_open(path):
+    path.write_text(
+        "2025-01-10 10:00:00|Ana|PYTHON|WIN|3|40\n"
+        "2025-02-10 10:00:00|Ana|FORCA|WIN|3|40\n"
+        "2025-03-10 10:00:00|Ana|CASA|WIN|3|40\n",
+        encoding="utf-8",
+    )
+    repository = open_repository(path)
+
+    assert HistorySegments(str(path)).months() == ["2025-01", "2025-02"]
+    assert words(repository) == ["PYTHON", "FORCA", "CASA"]
+
+
+def test_recover_undoes_archive_interrupted_before_hot_file_swap(path):
+    repository = open_repository(path)
+    repository.save(game("2025-01-10 10:00:00", "PYTHON"))
+
+    # Arquivamento interrompido: linha copiada no segmento, arquivo quente intacto
+    directory = segments_dir(path)
+    directory.mkdir()
+    with gzip.open(directory / "2025-01.txt.gz", "wb") as f:
+        f.write(b"2025-01-10 10:00:00|Ana|PYTHON|WIN|3|40\n")
+    (directory / ".roll").write_text(f"{os.stat(path).st_ino}\n2025-01|0\n", encoding="utf-8")
+
+    repository = open_repository(path)
+
+    assert not (directory / ".roll").exists()
+    assert not (directory / "2025-01.txt.gz").exists()
+    assert words(repository) == ["PYTHON"]
+
+
+def test_recover_truncates_existing_segment_to_journaled_size(path):
+    repository = open_repository(path)
+    repository.save(game("2025-01-10 10:00:00", "PYTHON"))
+    repository.save(game("2025-02-01 09:00:00", "CASA"))
+    segment = segments_dir(path) / "2025-01.txt.gz"
+    archived = segment.read_bytes()
+
+    # Anexo interrompido de uma partida que continua no arquivo quente
+    with open(segment, "ab") as f:
+        f.write(gzip.compress(b"2025-01-31 23:00:00|Bia|GATO|LOSS|6|70\n"))
+    path.write_text(path.read_text(encoding="utf-8")
+                    + "2025-01-31 23:00:00|Bia|GATO|LOSS|6|70\n", encoding="utf-8")
+    (segments_dir(path) / ".roll").write_text(
+        f"{os.stat(path).st_ino}\n2025-01|{len(archived)}\n", encoding="utf-8"
+    )
+
+    repository = open_repository(path)
+
+    assert segment.read_bytes() == archived
+    assert sorted(words(repository)) == ["CASA", "GATO", "PYTHON"]
+    assert repository.get_summary()['total_games'] == 3
+
+
+def test_recover_keeps_segment_when_hot_file_was_already_swapped(path):
+    repository = open_repository(path)
+    repository.save(game("2025-01-10 10:00:00", "PYTHON"))
+    repository.save(game("2025-02-01 09:00:00", "CASA"))
+
+    # Diário deixado para trás depois da troca: aponta para o inode antigo
+    journal = segments_dir(path) / ".roll"
+    journal.write_text("1\n2025-01|0\n", encoding="utf-8")
+
+    repository = open_repository(path)
+
+    assert not journal.exists()
+    assert words(repository) == ["PYTHON", "CASA"]
+
+
+@pytest.mark.parametrize("codec, suffix, opener", [("gzip", ".txt.gz", gzip.open),
+                                                   ("lzma", ".txt.xz", lzma.open)])
+def test_plain_segments_are_compressed_on_open(path, codec, suffix, opener):
+    repository = open_repository(path, codec=None)
+    repository.save(game("2025-01-10 10:00:00", "PYTHON"))
+    repository.save(game("2025-02-01 09:00:00", "CASA"))
+    assert (segments_dir(path) / "2025-01.txt").exists()
+
+    repository = open_repository(path, codec=codec)
+
+    segment = segments_dir(path) / f"2025-01{suffix}"
+    assert not (segments_dir(path) / "2025-01.txt").exists()
+    with opener(segment, "rt", encoding="utf-8") as f:
+        assert f.read() == "2025-01-10 10:00:00|Ana|PYTHON|WIN|3|40\n"
+    assert words(repository) == ["PYTHON", "CASA"]
+    assert repository.get_summary()['total_games'] == 2
+
+
+def test_append_to_compressed_segment_adds_a_member(path):
+    repository = open_repository(path)
+    repository.save(game("2025-01-10 10:00:00", "PYTHON"))
+    repository.save(game("2025-02-01 09:00:00", "CASA"))
+
+    # Partida atrasada de janeiro chega depois do arquivamento
+    path.write_text(path.read_text(encoding="utf-8")
+                    + "2025-01-31 23:00:00|Bia|GATO|LOSS|6|70\n", encoding="utf-8")
+    repository = open_repository(path)
+    repository.save(game("2025-03-01 09:00:00", "FORCA"))
+
+    segment = segments_dir(path) / "2025-01.txt.gz"
+    assert segment.read_bytes().count(b"\x1f\x8b\x08") == 2
+    with gzip.open(segment, "rt", encoding="utf-8") as f:
+        assert [line.split("|")[2] for line in f] == ["PYTHON", "GATO"]
+    assert sorted(words(repository)) == ["CASA", "FORCA", "GATO", "PYTHON"]
+    assert repository.get_summary("Bia")['losses'] == 1
+
+
+def test_interrupted_compression_drops_plain_duplicate(path):
+    repository = open_repository(path)
+    repository.save(game("2025-01-10 10:00:00", "PYTHON"))
+    repository.save(game("2025-02-01 09:00:00", "CASA"))
+
+    # Troca atômica feita, remoção do texto não
+    (segments_dir(path) / "2025-01.txt").write_text(
+        "2025-01-10 10:00:00|Ana|PYTHON|WIN|3|40\n", encoding="utf-8"
+    )
+
+    repository = open_repository(path)
+
+    assert not (segments_dir(path) / "2025-01.txt").exists()
+    assert words(repository) == ["PYTHON", "CASA"]